@@ -44,12 +44,29 @@ EVM_GAS_THRESHOLD = 20
 # Максимальный STARKNET GWEI для работы.
 STARKNET_GAS_THRESHOLD = 20
 
+# Количество аккаунтов, которые работают одновременно.
+CONCURRENT_ACCOUNTS_COUNT = 1
+
+# Максимальное количество аккаунтов, одновременно работающих через один прокси (только при USE_PROXY = True).
+MAX_ACCOUNTS_PER_PROXY = 1
+
 # Время между проверками газа. Лучше оставить [60, 60].
 GAS_DELAY_RANGE = [60, 60]
 
+# Сколько транзакций одной сети можно отправлять одновременно, когда газ опускается ниже порога.
+GAS_SCHEDULER_BURST_SIZE = 10
+
+# Ожидание провала газа. 100 - выключено, транзакции выпускаются сразу при газе ниже порога.
+# Чтобы включить, укажите например 50: транзакции будут ждать, пока газ не опустится до этого перцентиля
+# последних 60 замеров газа. Дольше 10 минут транзакция в ожидании провала газа не ждет.
+GAS_SCHEDULER_DIP_PERCENTILE = 100
+
 # Время между транзакциями. Минимальная задержка 80 секунд, меньше нельзя.
 TX_DELAY_RANGE = [80, 120]
 
+# Если нужно показывать прогресс задержек в консоли: True, а если нет: False.
+SHOW_DELAY_PROGRESS = True
+
 # Количество знаков после запятой, в случае, если число округляется.
 ROUND_TO = 5
 
@@ -110,6 +127,21 @@ USE_MOBILE_PROXY = False
 # Ссылка на смену ip адреса мобильных прокси.
 IP_CHANGE_LINK = ""
 
+##########################################################################
+############################### База данных ##############################
+##########################################################################
+
+# Способ хранения базы данных: "json", "journal" или "sqlite".
+# "json" - data/database.json полностью перезаписывается после каждого изменения (по умолчанию).
+# "journal" - изменения дописываются в журнал data/database.journal и периодически сжимаются в data/database.json.
+# "sqlite" - база хранится в data/database.sqlite3, при первом запуске переносится из data/database.json.
+#            С одной базой могут одновременно работать несколько запущенных процессов, аккаунты между ними не повторяются.
+DATABASE_STORAGE = "json"
+
+# Минимальный интервал в секундах между выгрузками базы данных в Excel (data/excel).
+# Выгрузка идет в фоне, пропускается если база не менялась, и делается при завершении работы.
+EXCEL_EXPORT_INTERVAL = 300
+
 ##########################################################################
 ################################ Шифрование ##############################
 ##########################################################################
@@ -120,6 +152,11 @@ USE_DATABASE_ENCRYPTION = False
 # Пароль для шифрования данных в базе данных.
 ENCRYPTION_PASSWORD = ""
 
+# Способ получения ключа шифрования из пароля: "sha256", "scrypt" или "pbkdf2".
+# "scrypt" и "pbkdf2" надежнее, но соль сохраняется в data/encryption_salt.txt и без нее базу не расшифровать.
+# При смене способа базу данных нужно создать заново.
+ENCRYPTION_KDF = "sha256"
+
 ##########################################################################
 ############################### Keep amount ##############################
 ##########################################################################
@@ -145,9 +182,18 @@ ZKLEND_DEPOSIT_PERCENT = [0.5, 0.5]
 # Количество ETH, которое будет дано апрувом на контракт nft маркетплейса (по сути оффер на nft).
 NFT_MARKETPLACE_ALLOWANCE_AMOUNT = [0.001, 0.001]
 
+# Если нужно объединять несколько действий (dmail, минт NFT, allowance) в одну транзакцию: True, а если нет: False.
+USE_WARMUP_BUNDLES = False
+
+# Сколько действий объединять в одну транзакцию.
+WARMUP_BUNDLE_SIZE = [2, 3]
+
 # Минимальное количество токенов в эквиваленте USD, чтобы сборщик свапал их в ETH (0.9 это 0.1$).
 MINIMUM_COLLECTED_USD_VALUE = 0.1
 
+# Время в секундах, в течение которого цены токенов с coingecko считаются актуальными.
+PRICE_CACHE_TIME = 60
+
 # Eсли хотите использовать AVNU для сборщика: True, а если Myswap: False.
 USE_AVNU_FOR_COLLECTOR = True
 
@@ -10,8 +10,42 @@ PROXIES_PATH = "data/proxies.txt"
 WITHDRAWAL_ADDRESSES_PATH = "data/withdrawal_addresses.txt"
 SALTS_PATH = "data/salts.txt"
 DATABASE_PATH = "data/database.json"
+DATABASE_JOURNAL_PATH = "data/database.journal"
+DATABASE_SQLITE_PATH = "data/database.sqlite3"
 DATABASE_DATA_EXCEL_PATH = "data/excel/data.xlsx"
 DATABASE_ERRORS_EXCEL_PATH = "data/excel/errors.xlsx"
+DATABASE_JOURNAL_COMPACTION_SIZE = 1000
+SQLITE_BUSY_TIMEOUT = 30
+SQLITE_CLAIM_BATCH_SIZE = 20
+SQLITE_WORKER_TIMEOUT = 1800
+SQLITE_HEARTBEAT_INTERVAL = 60
+ACCOUNT_CLAIM_RETRY_DELAY = 10
+ENCRYPTION_SALT_PATH = "data/encryption_salt.txt"
+ENCRYPTION_DIGESTS_LIMIT = 100000
+CONTRACT_ABI_CACHE_PATH = "data/contract_abis.json"
+
+CONTRACT_ABI_CACHE_REVALIDATE_TIME = 3600
+
+STARKNET_ACCOUNTS_DERIVATION_POOL_THRESHOLD = 200
+STARKNET_ACCOUNTS_DERIVATION_PROGRESS_INTERVAL = 1000
+STARKNET_TX_STATUS_CHECK_DELAYS = [2, 2, 3, 5, 8, 13, 20]
+STARKNET_TX_MAX_WAIT = 3600
+
+HTTP_CONNECTIONS_LIMIT = 100
+HTTP_CONNECTIONS_LIMIT_PER_HOST = 10
+HTTP_DNS_CACHE_TIME = 300
+HTTP_KEEPALIVE_TIMEOUT = 30
+
+GAS_MONITOR_HISTORY_SIZE = 60
+GAS_SCHEDULER_DIP_MAX_WAIT = 600
+GAS_SCHEDULER_PRIORITIES = {
+    "bridge": 3,
+    "transfer": 2,
+    "swap": 1,
+    "dmail": -1
+}
+
+ENCRYPTED_FIELDS = ("starknet_private_key", "starknet_wallet_salt", "evm_private_key", "proxy")
 
 BRAAVOS_PROXY_CLASS_HASH = 0x03131fa018d520a037686ce3efddeab8f28895662f019ca3ca18a626650f7d1e
 BRAAVOS_IMPLEMENTATION_CLASS_HASH = 0x5aa23d5bb71ddaa783da7ea79d405315bafa7cf0387a74f4593578c3e9e6570
@@ -52,6 +86,8 @@ COINGECKO_TOKEN_IDS = {
     STARKNET_DAI_TOKEN_ADDRESS: "dai"
 }
 
+PRICE_MAX_STALE_TIME = 600
+
 STARKNET_TOKEN_NAMES = {
     STARKNET_ETH_TOKEN_ADDRESS: "ETH",
     STARKNET_USDC_TOKEN_ADDRESS: "USDC",
@@ -59,6 +95,10 @@ STARKNET_TOKEN_NAMES = {
     STARKNET_DAI_TOKEN_ADDRESS: "DAI"
 }
 
+STARKNET_QUOTE_CACHE_TIME = 30
+STARKNET_QUOTE_BATCH_DELAY = 0.05
+STARKNET_MYSWAP_FEE_DENOMINATOR = 100000
+
 STARKNET_MYSWAP_POOL_IDS = {
     1: [STARKNET_ETH_TOKEN_ADDRESS, STARKNET_USDC_TOKEN_ADDRESS],
     2: [STARKNET_ETH_TOKEN_ADDRESS, STARKNET_DAI_TOKEN_ADDRESS],
@@ -131,6 +171,8 @@ LAYERSWAP_BRIDGE_ADDRESSES = {
 
 AVNU_SWAP_BUILD_URL = "https://starknet.api.avnu.fi/swap/v1/build"
 AVNU_SWAP_QUOTES_URL = "https://starknet.api.avnu.fi/swap/v1/quotes"
+AVNU_QUOTE_CACHE_TIME = 10
+AVNU_QUOTE_AMOUNT_PRECISION = 4
 
 LAYERSWAP_IDENTITY_ENDPOINT = "https://identity-api.layerswap.io/connect/token"
 LAYERSWAP_SWAPS_ENDPOINT = "https://bridge-api.layerswap.io//api/swaps"
@@ -170,6 +212,12 @@ OKX_STARKNET_WITHDRAWAL_FEE = 0.0001
 OKX_ERC20_WITHDRAWAL_FEE = 0.00049
 
 STARKNET_ESTIMATED_FEE_MULTIPLIER = 1.2
+STARKNET_FEE_ESTIMATE_CACHE_TIME = 60
+STARKNET_FEE_ESTIMATE_CACHE_MULTIPLIER = 1.3
 EVM_ESTIMATED_FEE_MULTIPLIER = 1.2
 
+EVM_FEE_HISTORY_BLOCKS = 10
+EVM_FEE_HISTORY_PERCENTILE = 50
+EVM_FEE_CACHE_TIME = 15
+
 TX_SIMULATION_VALUE = 1000000000000000
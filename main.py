@@ -8,13 +8,16 @@ from modules.bridge import (
 from modules.collector import batch_collector
 from modules.sender import batch_sender, batch_withdrawal_to_starknet
 from modules.warmup import warmup, warmup_with_gas, warmup_low_bank
+from sdk.apis.session_registry import session_registry
 from sdk.database.database import Database
+from sdk.helpers.gas_monitor import stop_gas_monitors
 from sdk.helpers.logger import logger
 from sdk.helpers.utils import greeting_message
 
 
 async def main():
     try:
+        session_registry.start()
         greeting_message()
         module = input("Start module: ")
 
@@ -47,12 +50,18 @@ async def main():
         elif module == "14":
             pass
             # todo: await cairo_1_update(mode=BridgeModes.LAYERSWAP)
+        elif module == "15":
+            Database.export_excel()
         else:
             logger.error(f"Invalid module number: {module}")
 
     except Exception as e:
         logger.error(str(e), send_to_tg=False)
 
+    finally:
+        await stop_gas_monitors()
+        await session_registry.close()
+
 
 if __name__ == "__main__":
     loop = asyncio.get_event_loop()
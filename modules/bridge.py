@@ -1,13 +1,14 @@
+import asyncio
 from enum import Enum
+from functools import partial
 
+from sdk.database.data_item import DataItem
 from sdk.database.database import Database
+from sdk.database.database_writer import DatabaseWriter
 from sdk.events.bridge_event import BridgeEvent
+from sdk.helpers.executor import AccountExecutor
 from sdk.helpers.logger import logger
-from sdk.helpers.utils import (
-    change_mobile_ip,
-    close_starknet_session,
-    get_starknet_token_balance
-)
+from constants import STARKNET_ETH_TOKEN_ADDRESS
 from sdk.models.token_amount import TokenAmount
 
 
@@ -19,100 +20,91 @@ class BridgeModes(Enum):
 
 async def batch_bridge_from_starknet(mode):
     database = Database.read_database()
-    bridge_event = data_item = data_item_index = None
-    tx_status = False
+    await AccountExecutor(database).run(partial(bridge_from_starknet_account, mode=mode))
 
-    while Database.not_empty(database):
-        try:
-            change_mobile_ip()
+    logger.debug("All accounts are finished. Run exit()")
+    exit()
 
-            data_item, data_item_index = Database.get_random_data_item(database["data"])
-            bridge_event = BridgeEvent(database, data_item, data_item_index)
 
-            logger.info(f"Accounts remaining count: {bridge_event.accounts_remaining}", send_to_tg=False)
-            logger.debug(f"Starknet wallet address: {bridge_event.starknet_address}")
+async def bridge_from_starknet_account(writer: DatabaseWriter, data_item: DataItem, record: dict, mode):
+    tx_status = False
 
-            balance = await get_starknet_token_balance(bridge_event.starknet_read_client)
-            amount = bridge_event.get_amount_to_bridge(balance)
+    try:
+        bridge_event = BridgeEvent(writer.database, data_item, None)
 
-            if mode == BridgeModes.STARKGATE:
-                tx_status = await bridge_event.starkgate_bridge_from_starknet(bridge_event.evm_address, amount)
+        logger.info(f"Accounts remaining count: {bridge_event.accounts_remaining}", send_to_tg=False)
+        logger.debug(f"Starknet wallet address: {bridge_event.starknet_address}")
 
-            if mode == BridgeModes.ORBITER:
-                tx_status = await bridge_event.orbiter_bridge_from_starknet(bridge_event.evm_address, amount)
+        balance = (await bridge_event.get_balances()).get(STARKNET_ETH_TOKEN_ADDRESS)
+        amount = bridge_event.get_amount_to_bridge(balance)
 
-            if mode == BridgeModes.LAYERSWAP:
-                tx_status = await bridge_event.layerswap_bridge_from_starknet(bridge_event.evm_address, amount)
+        if mode == BridgeModes.STARKGATE:
+            tx_status = await bridge_event.starkgate_bridge_from_starknet(bridge_event.evm_address, amount)
 
-            if tx_status:
-                database = Database.remove_item_from_data(database, data_item_index)
-                Database.save_database(database)
+        if mode == BridgeModes.ORBITER:
+            tx_status = await bridge_event.orbiter_bridge_from_starknet(bridge_event.evm_address, amount)
 
-        except Exception as e:
-            if "Balance is below minimum" in str(e) or "Amount to bridge less than 0" in str(e):
-                Database.move_item_to_errors(database, data_item, data_item_index)
-                continue
+        if mode == BridgeModes.LAYERSWAP:
+            tx_status = await bridge_event.layerswap_bridge_from_starknet(bridge_event.evm_address, amount)
 
-            logger.exception(f"Error while execute warmup module: {str(e)}")
+        if tx_status:
+            await writer.remove(record)
 
-        finally:
-            if bridge_event is not None:
-                await close_starknet_session(bridge_event.starknet_read_client, bridge_event.starknet_write_client)
+    except Exception as e:
+        if "Balance is below minimum" in str(e) or "Amount to bridge less than 0" in str(e):
+            await writer.move_to_errors(record)
+            return
+
+        logger.exception(f"Error while execute warmup module: {str(e)}")
 
-    logger.debug("All accounts are finished. Run exit()")
-    exit()
 
 
 async def batch_bridge_from_evm(mode):
     database = Database.read_database()
-    bridge_event = data_item = data_item_index = client = None
-    tx_status = False
+    await AccountExecutor(database).run(partial(bridge_from_evm_account, mode=mode))
 
-    while Database.not_empty(database):
-        try:
-            change_mobile_ip()
+    logger.debug("All accounts are finished. Run exit()")
+    exit()
 
-            data_item, data_item_index = Database.get_random_data_item(database["data"])
-            bridge_event = BridgeEvent(database, data_item, data_item_index)
 
-            logger.info(f"Accounts remaining count: {bridge_event.accounts_remaining}", send_to_tg=False)
-            logger.debug(f"Starknet wallet address: {bridge_event.starknet_address}")
+async def bridge_from_evm_account(writer: DatabaseWriter, data_item: DataItem, record: dict, mode):
+    bridge_event = client = None
+    tx_status = False
 
-            if mode == BridgeModes.STARKGATE:
-                client = bridge_event.ethereum_client
+    try:
+        bridge_event = BridgeEvent(writer.database, data_item, None)
 
-            if mode == BridgeModes.ORBITER:
-                client = bridge_event.arbitrum_client
+        logger.info(f"Accounts remaining count: {bridge_event.accounts_remaining}", send_to_tg=False)
+        logger.debug(f"Starknet wallet address: {bridge_event.starknet_address}")
 
-            if mode == BridgeModes.LAYERSWAP:
-                client = bridge_event.optimism_client
+        if mode == BridgeModes.STARKGATE:
+            client = bridge_event.ethereum_client
 
-            balance = TokenAmount(amount=client.w3.eth.get_balance(client.public_key), wei=True)
-            amount = bridge_event.get_amount_to_bridge(float(balance.ether))
+        if mode == BridgeModes.ORBITER:
+            client = bridge_event.arbitrum_client
 
-            if mode == BridgeModes.STARKGATE:
-                tx_status = await bridge_event.starkgate_bridge_from_evm(bridge_event.starknet_address, amount)
+        if mode == BridgeModes.LAYERSWAP:
+            client = bridge_event.optimism_client
 
-            if mode == BridgeModes.ORBITER:
-                tx_status = await bridge_event.orbiter_bridge_from_evm(bridge_event.starknet_address, amount)
+        balance = TokenAmount(amount=await asyncio.to_thread(client.w3.eth.get_balance, client.public_key), wei=True)
+        amount = bridge_event.get_amount_to_bridge(float(balance.ether))
 
-            if mode == BridgeModes.LAYERSWAP:
-                tx_status = await bridge_event.layerswap_bridge_from_evm(bridge_event.starknet_address, amount)
+        if mode == BridgeModes.STARKGATE:
+            tx_status = await bridge_event.starkgate_bridge_from_evm(bridge_event.starknet_address, amount)
 
-            if tx_status:
-                database = Database.remove_item_from_data(database, data_item_index)
-                Database.save_database(database)
+        if mode == BridgeModes.ORBITER:
+            tx_status = await bridge_event.orbiter_bridge_from_evm(bridge_event.starknet_address, amount)
 
-        except Exception as e:
-            if "Balance is below minimum" in str(e) or "Amount to bridge less than 0" in str(e):
-                Database.move_item_to_errors(database, data_item, data_item_index)
-                continue
+        if mode == BridgeModes.LAYERSWAP:
+            tx_status = await bridge_event.layerswap_bridge_from_evm(bridge_event.starknet_address, amount)
 
-            logger.exception(f"Error while execute warmup module: {str(e)}")
+        if tx_status:
+            await writer.remove(record)
 
-        finally:
-            if bridge_event is not None:
-                await close_starknet_session(bridge_event.starknet_read_client, bridge_event.starknet_write_client)
+    except Exception as e:
+        if "Balance is below minimum" in str(e) or "Amount to bridge less than 0" in str(e):
+            await writer.move_to_errors(record)
+            return
+
+        logger.exception(f"Error while execute warmup module: {str(e)}")
 
-    logger.debug("All accounts are finished. Run exit()")
-    exit()
@@ -1,92 +1,88 @@
+from sdk.database.data_item import DataItem
 from sdk.database.database import Database
+from sdk.database.database_writer import DatabaseWriter
 from sdk.events.collector_event import CollectorEvent
 from sdk.events.sender_event import SenderEvent
 from sdk.events.warmup_event import WarmupEvent
 from sdk.helpers.aggregator import Aggregator
+from sdk.helpers.executor import AccountExecutor
 from sdk.helpers.logger import logger
 from sdk.helpers.utils import (
     change_mobile_ip,
-    get_starknet_max_balance_token,
-    close_starknet_session
+    get_starknet_max_balance_token
 )
 
 
 async def warmup():
     database = Database.read_database()
-    warmup_event = data_item = data_item_index = None
+    await AccountExecutor(database).run(warmup_account)
 
-    while Database.not_empty(database):
-        try:
-            change_mobile_ip()
+    logger.debug("All accounts are finished. Run exit()")
+    exit()
 
-            data_item, data_item_index = Database.get_random_data_item(database["data"])
-            warmup_event = WarmupEvent(database, data_item, data_item_index)
 
-            logger.info(f"Database tx count: {warmup_event.database_tx_count}", send_to_tg=False)
-            logger.debug(f"Starknet wallet address: {warmup_event.starknet_address}")
+async def warmup_account(writer: DatabaseWriter, data_item: DataItem, record: dict):
+    try:
+        warmup_event = WarmupEvent(writer.database, data_item, None)
 
-            token_in, amount_in = await get_starknet_max_balance_token(warmup_event.starknet_read_client)
-            aggregator = Aggregator(data_item, token_in, amount_in)
+        logger.info(f"Database tx count: {warmup_event.database_tx_count}", send_to_tg=False)
+        logger.debug(f"Starknet wallet address: {warmup_event.starknet_address}")
 
-            tx_status, data_item = await warmup_event.run_warmup(data_item, aggregator)
+        token_in, amount_in = await get_starknet_max_balance_token(
+            warmup_event.starknet_client,
+            await warmup_event.get_balances()
+        )
+        aggregator = Aggregator(data_item, token_in, amount_in)
 
-            if tx_status:
-                database = Database.update_database(database, data_item, data_item_index)
-                Database.save_database(database)
+        tx_status, data_item = await warmup_event.run_warmup(data_item, aggregator)
 
-        except Exception as e:
-            if "Balance is below minimum" in str(e):
-                Database.move_item_to_errors(database, data_item, data_item_index)
-                continue
+        if tx_status:
+            await writer.update(record, data_item)
 
-            logger.exception(f"Error while execute warmup module: {str(e)}")
+    except Exception as e:
+        if "Balance is below minimum" in str(e):
+            await writer.move_to_errors(record)
+            return
 
-        finally:
-            if warmup_event is not None:
-                await close_starknet_session(warmup_event.starknet_read_client, warmup_event.starknet_write_client)
+        logger.exception(f"Error while execute warmup module: {str(e)}")
 
-    logger.debug("All accounts are finished. Run exit()")
-    exit()
 
 
 async def warmup_with_gas():
     database = Database.read_database()
-    warmup_event = data_item = data_item_index = None
+    await AccountExecutor(database).run(warmup_with_gas_account)
 
-    while Database.not_empty(database):
-        try:
-            change_mobile_ip()
+    logger.debug("All accounts are finished. Run exit()")
+    exit()
 
-            data_item, data_item_index = Database.get_random_data_item(database["data"])
-            warmup_event = WarmupEvent(database, data_item, data_item_index)
 
-            logger.info(f"Database tx count: {warmup_event.database_tx_count}", send_to_tg=False)
-            logger.debug(f"Starknet wallet address: {warmup_event.starknet_address}")
+async def warmup_with_gas_account(writer: DatabaseWriter, data_item: DataItem, record: dict):
+    try:
+        warmup_event = WarmupEvent(writer.database, data_item, None)
 
-            await warmup_event.warmup_with_gas_withdraw()
+        logger.info(f"Database tx count: {warmup_event.database_tx_count}", send_to_tg=False)
+        logger.debug(f"Starknet wallet address: {warmup_event.starknet_address}")
 
-            token_in, amount_in = await get_starknet_max_balance_token(warmup_event.starknet_read_client)
-            aggregator = Aggregator(data_item, token_in, amount_in)
+        await warmup_event.warmup_with_gas_withdraw()
 
-            tx_status, data_item = await warmup_event.run_warmup(data_item, aggregator)
+        token_in, amount_in = await get_starknet_max_balance_token(
+            warmup_event.starknet_client,
+            await warmup_event.get_balances()
+        )
+        aggregator = Aggregator(data_item, token_in, amount_in)
 
-            if tx_status:
-                database = Database.update_database(database, data_item, data_item_index)
-                Database.save_database(database)
+        tx_status, data_item = await warmup_event.run_warmup(data_item, aggregator)
 
-        except Exception as e:
-            if "Balance is below minimum" in str(e):
-                Database.move_item_to_errors(database, data_item, data_item_index)
-                continue
+        if tx_status:
+            await writer.update(record, data_item)
 
-            logger.exception(f"Error while execute warmup with gas module: {str(e)}")
+    except Exception as e:
+        if "Balance is below minimum" in str(e):
+            await writer.move_to_errors(record)
+            return
 
-        finally:
-            if warmup_event is not None:
-                await close_starknet_session(warmup_event.starknet_read_client, warmup_event.starknet_write_client)
+        logger.exception(f"Error while execute warmup with gas module: {str(e)}")
 
-    logger.debug("All accounts are finished. Run exit()")
-    exit()
 
 
 async def warmup_low_bank():
@@ -118,7 +114,11 @@ async def warmup_low_bank():
 
             while True:
                 logger.info(f"Wallet tx count: {warmup_event.data_item_tx_count}", send_to_tg=False)
-                token_in, amount_in = await get_starknet_max_balance_token(warmup_event.starknet_read_client)
+                warmup_event.balances = None
+                token_in, amount_in = await get_starknet_max_balance_token(
+                    warmup_event.starknet_client,
+                    await warmup_event.get_balances()
+                )
                 aggregator = Aggregator(warmup_event.data_item, token_in, amount_in)
 
                 tx_status, data_item = await warmup_event.run_warmup(data_item, aggregator)
@@ -144,7 +144,18 @@ async def warmup_low_bank():
                 warmup_event.data_item,
                 warmup_event.data_item_index
             )
-            await collector_event.collector()
+            collector_status = await collector_event.collector()
+
+            if collector_status:
+                Database.remove_item_from_data(collector_event.database, collector_event.data_item_index)
+            else:
+                Database.move_item_to_errors(
+                    collector_event.database,
+                    collector_event.data_item,
+                    collector_event.data_item_index
+                )
+
+            Database.save_database(collector_event.database)
 
             logger.info("Start sender")
 
@@ -166,9 +177,6 @@ async def warmup_low_bank():
 
             logger.exception(f"Error while execute warmup low bank module: {str(e)}")
 
-        finally:
-            if warmup_event is not None:
-                await close_starknet_session(warmup_event.starknet_read_client, warmup_event.starknet_write_client)
 
     logger.debug("All accounts are finished. Run exit()")
     exit()
@@ -1,17 +1,71 @@
+import asyncio
+import time
+
 from config import SLIPPAGE
 from constants import (
     AVNU_SWAP_BUILD_URL,
-    AVNU_SWAP_QUOTES_URL
+    AVNU_SWAP_QUOTES_URL,
+    AVNU_QUOTE_CACHE_TIME,
+    AVNU_QUOTE_AMOUNT_PRECISION
 )
 
 from sdk.apis.base_api import BaseAPI
 
 
+class AvnuQuoteCache:
+    def __init__(self, cache_time: int, amount_precision: int):
+        self.cache_time = cache_time
+        self.amount_precision = amount_precision
+        self.quotes = {}
+
+    def get(self, from_token: str, to_token: str, amount: int) -> dict:
+        timestamp, quoted_amount, quote = self.quotes.get(self.get_key(from_token, to_token, amount), (0, None, None))
+
+        if time.time() - timestamp > self.cache_time or quoted_amount != amount:
+            return None
+
+        return quote
+
+    def set(self, from_token: str, to_token: str, amount: int, quote: dict):
+        self.remove_expired()
+        self.quotes[self.get_key(from_token, to_token, amount)] = (time.time(), amount, quote)
+
+    def invalidate(self, from_token: str, to_token: str, amount: int):
+        self.quotes.pop(self.get_key(from_token, to_token, amount), None)
+
+    def remove_expired(self):
+        now = time.time()
+
+        for key, (timestamp, _, _) in list(self.quotes.items()):
+            if now - timestamp > self.cache_time:
+                del self.quotes[key]
+
+    def get_key(self, from_token: str, to_token: str, amount: int) -> tuple:
+        digits = len(str(amount)) - self.amount_precision
+
+        if digits > 0:
+            amount = amount // 10 ** digits * 10 ** digits
+
+        return from_token, to_token, amount
+
+
 class AvnuSwapAPI(BaseAPI):
     def __init__(self, proxy: str) -> None:
-        super().__init__(proxy, use_aiohttp=True)
+        super().__init__(proxy, AVNU_SWAP_QUOTES_URL)
+
+    async def get_quote(self, from_token: str, to_token: str, amount: int) -> dict:
+        quote = avnu_quote_cache.get(from_token, to_token, amount)
+
+        if quote is None:
+            quote = await self.fetch_quote(from_token, to_token, amount)
+            avnu_quote_cache.set(from_token, to_token, amount, quote)
 
-    async def get_avnu_swap_quote_id(self, from_token: str, to_token: str, amount: int):
+        return quote
+
+    async def get_quotes(self, pairs: list) -> list:
+        return await asyncio.gather(*[self.get_quote(*pair) for pair in pairs])
+
+    async def fetch_quote(self, from_token: str, to_token: str, amount: int) -> dict:
         params = {
             "sellTokenAddress": from_token,
             "buyTokenAddress": to_token,
@@ -19,11 +73,12 @@ class AvnuSwapAPI(BaseAPI):
             "excludeSources": "Ekubo"
         }
 
-        response = await self.session.get(url=AVNU_SWAP_QUOTES_URL, params=params)
-        response_data = await response.json()
-        quote_id = response_data[0]["quoteId"]
+        response_data = await self.request_json("GET", AVNU_SWAP_QUOTES_URL, params=params)
+
+        if not isinstance(response_data, list) or len(response_data) == 0:
+            raise Exception(f"Avnu quote error: {response_data}")
 
-        return quote_id
+        return response_data[0]
 
     async def get_build_avnu_swap_tx(self, quote_id: str, recipient: int):
         data = {
@@ -32,7 +87,21 @@ class AvnuSwapAPI(BaseAPI):
             "slippage": float(SLIPPAGE / 100),
         }
 
-        response = await self.session.post(url=AVNU_SWAP_BUILD_URL, json=data)
-        response_data = await response.json()
+        return await self.request_json("POST", AVNU_SWAP_BUILD_URL, json=data)
+
+    async def build_swap_tx(self, from_token: str, to_token: str, amount: int, recipient: int) -> dict:
+        response_data = None
+
+        for _ in range(2):
+            quote = await self.get_quote(from_token, to_token, amount)
+            response_data = await self.get_build_avnu_swap_tx(quote["quoteId"], recipient)
+
+            if isinstance(response_data, dict) and "calldata" in response_data:
+                return response_data
+
+            avnu_quote_cache.invalidate(from_token, to_token, amount)
+
+        raise Exception(f"Avnu build swap error: {response_data}")
+
 
-        return response_data
+avnu_quote_cache = AvnuQuoteCache(AVNU_QUOTE_CACHE_TIME, AVNU_QUOTE_AMOUNT_PRECISION)
@@ -1,27 +1,21 @@
-import requests
 from aiohttp import ClientSession
-from aiohttp_socks import ProxyConnector
 
-from config import USE_PROXY
+from sdk.apis.session_registry import session_registry
 
 
 class BaseAPI:
-    def __init__(self, proxy: str, use_aiohttp: bool = False) -> None:
-        self.session = requests.Session()
-        proxy_url = f"http://{proxy}"
+    def __init__(self, proxy: str, url: str) -> None:
+        self.proxy = proxy
+        self.url = url
 
-        if not use_aiohttp:
-            if USE_PROXY:
-                self.session.proxies = {"https": proxy_url}
+    @property
+    def session(self) -> ClientSession:
+        return session_registry.get_session(self.proxy, self.url)
 
-        if use_aiohttp:
-            if USE_PROXY:    
-                self.session = ClientSession(connector=ProxyConnector.from_url(proxy_url))
-            else:
-                self.session = ClientSession()
+    @staticmethod
+    def run_sync(coroutine):
+        return session_registry.run_sync(coroutine)
 
-    async def close_session(self):
-        await self.session.close()
-    
-    def close_session_sync(self):
-        self.session.close()
+    async def request_json(self, method: str, url: str, **kwargs):
+        async with self.session.request(method, url, **kwargs) as response:
+            return await response.json(content_type=None)
@@ -16,10 +16,14 @@ from sdk.models.layerswap_swap_config import LayerswapDataItem
 
 class LayerSwapAPI(BaseAPI):
     def __init__(self, proxy: str):
-        super().__init__(proxy)
+        super().__init__(proxy, LAYERSWAP_SWAPS_ENDPOINT)
 
         self.user_agent = UserAgent().random
-        self.access_token = self.get_identity_tokens()["access_token"]
+        self.access_token = None
+
+    async def authorize(self):
+        if self.access_token is None:
+            self.access_token = (await self.get_identity_tokens())["access_token"]
 
     def construct_request_headers(
             self,
@@ -45,19 +49,21 @@ class LayerSwapAPI(BaseAPI):
 
         return headers
 
-    def get_swap(self, swap_id: str):
+    async def get_swap(self, swap_id: str):
         try:
+            await self.authorize()
             headers = self.construct_request_headers()
             url = f"{LAYERSWAP_SWAPS_ENDPOINT}/{swap_id}"
-            response = self.session.get(url=url, headers=headers)
+            response = await self.request_json("GET", url, headers=headers)
 
-            return response.json()['data']
+            return response['data']
 
         except Exception as e:
             logger.error(f"Error while get swap with id {swap_id}: {e}")
 
-    def create_swap(self, data_item: LayerswapDataItem):
+    async def create_swap(self, data_item: LayerswapDataItem):
         try:
+            await self.authorize()
             x_ls_correlation_id = str(uuid.uuid4())
 
             headers = self.construct_request_headers(
@@ -66,34 +72,38 @@ class LayerSwapAPI(BaseAPI):
                 content_type="application/json",
                 x_ls_correlation_id=x_ls_correlation_id
             )
-            response = self.session.post(
-                url=LAYERSWAP_SWAPS_ENDPOINT,
+            response = await self.request_json(
+                "POST",
+                LAYERSWAP_SWAPS_ENDPOINT,
                 data=data_item.to_json(),
                 headers=headers
             )
 
-            return response.json()['data']
+            return response['data']
 
         except Exception as e:
             logger.error(f"Error while create swap: {e}")
 
-    def get_deposit_address(self, grab_url):
+    async def get_deposit_address(self, grab_url):
         try:
+            await self.authorize()
             headers = self.construct_request_headers()
-            response = self.session.post(
-                url=f"{LAYERSWAP_TRANSFER_TO_ADDRESS_ENDPOINT}/{grab_url}",
+            response = await self.request_json(
+                "POST",
+                f"{LAYERSWAP_TRANSFER_TO_ADDRESS_ENDPOINT}/{grab_url}",
                 headers=headers
             )
 
-            return response.json()['data']
+            return response['data']
 
         except Exception as e:
             logger.error(f"Error while getting deposit address: {e}")
 
-    def get_identity_tokens(self):
+    async def get_identity_tokens(self):
         try:
-            response = self.session.post(
-                url=LAYERSWAP_IDENTITY_ENDPOINT,
+            return await self.request_json(
+                "POST",
+                LAYERSWAP_IDENTITY_ENDPOINT,
                 data={
                     "client_id": "layerswap_bridge_ui",
                     "grant_type": "credentialless"
@@ -101,7 +111,14 @@ class LayerSwapAPI(BaseAPI):
                 headers=LAYERSWAP_DEFAULT_API_HEADERS
             )
 
-            return response.json()
-
         except Exception as e:
             logger.error(f"Error while getting identity tokens: {e}")
+
+    def get_swap_sync(self, swap_id: str):
+        return self.run_sync(self.get_swap(swap_id))
+
+    def create_swap_sync(self, data_item: LayerswapDataItem):
+        return self.run_sync(self.create_swap(data_item))
+
+    def get_deposit_address_sync(self, grab_url):
+        return self.run_sync(self.get_deposit_address(grab_url))
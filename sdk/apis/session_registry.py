@@ -0,0 +1,80 @@
+import asyncio
+from urllib.parse import urlparse
+
+from aiohttp import ClientSession, TCPConnector
+from aiohttp_socks import ProxyConnector
+
+from config import USE_PROXY
+from constants import (
+    HTTP_CONNECTIONS_LIMIT,
+    HTTP_CONNECTIONS_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TIME,
+    HTTP_KEEPALIVE_TIMEOUT
+)
+
+
+class SessionRegistry:
+    def __init__(self, limit: int, limit_per_host: int, dns_cache_time: int, keepalive_timeout: int):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_time = dns_cache_time
+        self.keepalive_timeout = keepalive_timeout
+        self.sessions = {}
+        self.loop = None
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+
+    def run_sync(self, coroutine):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self.loop is None or running_loop is self.loop:
+            coroutine.close()
+            raise Exception("Sync api call requires the session registry loop running in another thread")
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def get_session(self, proxy: str, url: str) -> ClientSession:
+        key = get_session_key(proxy, url)
+        session = self.sessions.get(key)
+
+        if session is None or session.closed:
+            session = ClientSession(connector=self.create_connector(key[0]))
+            self.sessions[key] = session
+
+        return session
+
+    def create_connector(self, proxy: str) -> TCPConnector:
+        connector_kwargs = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "ttl_dns_cache": self.dns_cache_time,
+            "keepalive_timeout": self.keepalive_timeout
+        }
+
+        if proxy is not None:
+            return ProxyConnector.from_url(f"http://{proxy}", **connector_kwargs)
+
+        return TCPConnector(**connector_kwargs)
+
+    async def close(self):
+        sessions, self.sessions = self.sessions, {}
+
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+
+
+def get_session_key(proxy: str, url: str) -> tuple:
+    return proxy if USE_PROXY and proxy else None, urlparse(url).netloc
+
+
+session_registry = SessionRegistry(
+    limit=HTTP_CONNECTIONS_LIMIT,
+    limit_per_host=HTTP_CONNECTIONS_LIMIT_PER_HOST,
+    dns_cache_time=HTTP_DNS_CACHE_TIME,
+    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+)
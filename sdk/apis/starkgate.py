@@ -13,9 +13,9 @@ from sdk.models.token_amount import TokenAmount
 
 class StarkgateAPI(BaseAPI):
     def __init__(self, proxy: str) -> None:
-        super().__init__(proxy)
+        super().__init__(proxy, STARKNET_ESTIMATE_MESSAGE_FEE_ENDPOINT)
 
-    def get_message_fee(self, amount: TokenAmount, starknet_address: str):
+    async def get_message_fee(self, amount: TokenAmount, starknet_address: str):
         try:
             headers = {"Content-Type": "application/json"}
 
@@ -30,14 +30,18 @@ class StarkgateAPI(BaseAPI):
                 ]
             }
 
-            response = self.session.post(
-                url=STARKNET_ESTIMATE_MESSAGE_FEE_ENDPOINT,
+            response = await self.request_json(
+                "POST",
+                STARKNET_ESTIMATE_MESSAGE_FEE_ENDPOINT,
                 data=json.dumps(data),
                 headers=headers
             )
 
-            return response.json()['overall_fee']
+            return response['overall_fee']
 
         except Exception as e:
             logger.error(f"Error while getting message fee. {e}")
             return False
+
+    def get_message_fee_sync(self, amount: TokenAmount, starknet_address: str):
+        return self.run_sync(self.get_message_fee(amount, starknet_address))
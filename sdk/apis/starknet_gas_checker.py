@@ -1,4 +1,4 @@
-import time
+import asyncio
 
 from constants import STARKNET_GET_LAST_BLOCK_ENDPOINT
 from sdk.apis.base_api import BaseAPI
@@ -7,14 +7,17 @@ from sdk.helpers.logger import logger
 
 class GasAPI(BaseAPI):
     def __init__(self, proxy: str) -> None:
-        super().__init__(proxy, use_aiohttp=False)
+        super().__init__(proxy, STARKNET_GET_LAST_BLOCK_ENDPOINT)
 
-    def get_last_block_gas_price(self):
+    async def get_last_block_gas_price(self):
         while True:
             try:
-                response = self.session.get(url=STARKNET_GET_LAST_BLOCK_ENDPOINT)
-                gas_price_hex = response.json()["gas_price"]
+                response = await self.request_json("GET", STARKNET_GET_LAST_BLOCK_ENDPOINT)
+                gas_price_hex = response["gas_price"]
                 return int(gas_price_hex, 16)
             except Exception as e:
                 logger.warning(f"Starknet gas price fetch error: {str(e)}. Retrying in 30 sec")
-                time.sleep(30)
+                await asyncio.sleep(30)
+
+    def get_last_block_gas_price_sync(self):
+        return self.run_sync(self.get_last_block_gas_price())
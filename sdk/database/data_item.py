@@ -25,7 +25,11 @@ class DataItem:
             is_okx_withdraw_completed,
             is_bridge_completed,
             volume_amount,
-            cryptography_mode: CryptographyMode = CryptographyMode.RAW
+            cryptography_mode: CryptographyMode = CryptographyMode.RAW,
+            starknet_address: str = None,
+            starknet_public_key: str = None,
+            execution_plan: str = None,
+            starknet_wallet_application: str = None
     ):
         self.starknet_private_key = DataItem.set_cryptography_value(starknet_private_key, cryptography_mode)
         self.starknet_wallet_salt = DataItem.set_cryptography_value(starknet_wallet_salt, cryptography_mode)
@@ -46,6 +50,10 @@ class DataItem:
         self.is_okx_withdraw_completed = is_okx_withdraw_completed
         self.is_bridge_completed = is_bridge_completed
         self.volume_amount = volume_amount
+        self.starknet_address = starknet_address
+        self.starknet_public_key = starknet_public_key
+        self.execution_plan = execution_plan
+        self.starknet_wallet_application = starknet_wallet_application
 
     @staticmethod
     def set_cryptography_value(value: Union[str, int, bool], cryptography_mode: CryptographyMode):
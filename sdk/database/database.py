@@ -1,5 +1,7 @@
+import atexit
 import json
 import random
+import time
 from typing import Any
 
 from config import (
@@ -15,6 +17,8 @@ from config import (
     ZKLEND_TX_COUNT,
     WITHDRAWAL_FROM_ZKLEND,
     WALLET_APPLICATION,
+    DATABASE_STORAGE,
+    EXCEL_EXPORT_INTERVAL,
     STARKVERSE_MINT_TX_COUNT
 )
 from constants import (
@@ -22,15 +26,28 @@ from constants import (
     STARKNET_PRIVATE_KEYS_PATH,
     PROXIES_PATH,
     WITHDRAWAL_ADDRESSES_PATH,
-    DATABASE_PATH,
-    DATABASE_DATA_EXCEL_PATH,
-    DATABASE_ERRORS_EXCEL_PATH,
-    SALTS_PATH
+    SALTS_PATH,
+    STARKNET_ACCOUNTS_DERIVATION_PROGRESS_INTERVAL
 )
 from sdk.database.data_item import DataItem
+from sdk.database.excel_exporter import ExcelExporter
+from sdk.database.json_storage import assign_account_ids
+from sdk.database.storage import create_storage, close_storage
 from sdk.helpers.cryptography_manager import CryptographyManager, CryptographyMode
 from sdk.helpers.logger import logger
-from sdk.helpers.utils import export_json
+from sdk.helpers.planner import get_execution_plan
+from sdk.starknet.utils import (
+    derive_starknet_accounts,
+    iter_starknet_accounts,
+    is_valid_starknet_private_key,
+    get_wallet_application
+)
+
+storage = create_storage(DATABASE_STORAGE)
+atexit.register(close_storage, storage)
+
+excel_exporter = ExcelExporter(EXCEL_EXPORT_INTERVAL)
+atexit.register(excel_exporter.close)
 
 
 class Database:
@@ -55,12 +72,14 @@ class Database:
             if data_item is None or data_item_index is None:
                 raise Exception("Data item or data_item_index is None")
 
-            database["errors"].append(data_item)
-            database["data"].pop(data_item_index)
+            database["errors"].append(database["data"].pop(data_item_index))
+            database["accounts_remaining"] -= 1
 
         except Exception as e:
             logger.error(f"Move data item error: {str(e)}")
 
+        return database
+
     @staticmethod
     def create_data_item(
             starknet_private_key: str,
@@ -69,7 +88,8 @@ class Database:
             proxy: str,
             withdrawal_address: str,
             zklend_deposit_tx_count: int,
-
+            starknet_address: str = None,
+            starknet_public_key: str = None
     ):
         return DataItem(
             starknet_private_key=starknet_private_key,
@@ -88,15 +108,19 @@ class Database:
             starkverse_mint_tx_count=random.randint(*STARKVERSE_MINT_TX_COUNT),
             zklend_deposit_tx_count=zklend_deposit_tx_count,
             zklend_withdraw_tx_count=Database.get_zklend_withdraw_tx_count(zklend_deposit_tx_count),
-            cryptography_mode=CryptographyMode.ENCRYPT,
+            cryptography_mode=CryptographyMode.RAW,
             is_okx_withdraw_completed=False,
             is_bridge_completed=False,
-            volume_amount=0
+            volume_amount=0,
+            starknet_address=starknet_address,
+            starknet_public_key=starknet_public_key,
+            starknet_wallet_application=get_wallet_application() if starknet_address else None
         )
 
     @staticmethod
     def create_database():
         try:
+            started_at = time.time()
             data = []
             starknet_private_keys = Database.read_from_txt(STARKNET_PRIVATE_KEYS_PATH)
             evm_private_keys = Database.read_from_txt(EVM_PRIVATE_KEYS_PATH)
@@ -120,9 +144,34 @@ class Database:
                 logger.error(f"Salts length less than needed. Run exit()")
                 exit()
 
+            invalid_lines = [
+                index + 1 for index, starknet_private_key in enumerate(starknet_private_keys)
+                if not is_valid_starknet_private_key(starknet_private_key)
+            ]
+            if len(invalid_lines) > 0:
+                logger.error(f"Invalid Starknet private keys on lines: {Database.format_lines(invalid_lines)}. "
+                             f"Run exit()")
+                exit()
+
+            Database.check_duplicates(
+                [int(starknet_private_key, 0) for starknet_private_key in starknet_private_keys],
+                "Starknet private keys"
+            )
+
+            starknet_accounts = Database.derive_starknet_accounts(
+                starknet_private_keys,
+                starknet_wallet_salts if WALLET_APPLICATION == 'salts' else [None] * len(starknet_private_keys)
+            )
+            derivation_time = time.time() - started_at
+
+            Database.check_duplicates(
+                [starknet_address for starknet_address, _ in starknet_accounts],
+                "Starknet addresses"
+            )
+
             try:
-                for starknet_private_key in starknet_private_keys:
-                    starknet_private_key_index = starknet_private_keys.index(starknet_private_key)
+                for starknet_private_key_index, starknet_private_key in enumerate(starknet_private_keys):
+                    starknet_address, starknet_public_key = starknet_accounts[starknet_private_key_index]
                     starknet_wallet_salt = starknet_wallet_salts[starknet_private_key_index] \
                         if WALLET_APPLICATION == 'salts' else None
                     proxy = proxies[starknet_private_key_index] if USE_PROXY else None
@@ -146,7 +195,9 @@ class Database:
                             evm_private_key,
                             proxy,
                             withdrawal_address,
-                            zklend_deposit_tx_count
+                            zklend_deposit_tx_count,
+                            starknet_address,
+                            starknet_public_key
                         )
 
                         tx_count = Database.get_data_item_tx_count(data_item)
@@ -160,12 +211,69 @@ class Database:
             except Exception as e:
                 raise Exception(f"Problems with data items when creating a database: {str(e)}")
 
-            Database.save_database(Database(data).to_json())
-            logger.success(f"Database was been created", send_to_tg=False)
+            database = json.loads(Database(data).to_json())
+            assign_account_ids(database)
+            CryptographyManager.encrypt_database(database, create_salt=True)
+            Database.save_database(database)
+            logger.success(f"Database was been created for {len(data)} accounts in "
+                           f"{round(time.time() - started_at, 2)}s "
+                           f"(address derivation {round(derivation_time, 2)}s)", send_to_tg=False)
 
         except Exception as e:
             raise Exception(f"Database creation error: {str(e)}")
 
+    @staticmethod
+    def derive_starknet_accounts(starknet_private_keys: list, starknet_wallet_salts: list) -> list:
+        accounts = []
+
+        for account in iter_starknet_accounts(starknet_private_keys, starknet_wallet_salts):
+            accounts.append(account)
+
+            if len(accounts) % STARKNET_ACCOUNTS_DERIVATION_PROGRESS_INTERVAL == 0:
+                logger.info(f"Starknet addresses derived: {len(accounts)}/{len(starknet_private_keys)}",
+                            send_to_tg=False)
+
+        return accounts
+
+    @staticmethod
+    def check_duplicates(values: list, name: str):
+        lines = {}
+
+        for index, value in enumerate(values):
+            lines.setdefault(value, []).append(index + 1)
+
+        duplicates = [Database.format_lines(value_lines) for value_lines in lines.values() if len(value_lines) > 1]
+        if len(duplicates) > 0:
+            logger.error(f"Duplicate {name} on lines: {'; '.join(duplicates)}. Run exit()")
+            exit()
+
+    @staticmethod
+    def format_lines(lines: list) -> str:
+        return ", ".join(str(line) for line in lines)
+
+    @staticmethod
+    def fill_starknet_accounts(records) -> int:
+        wallet_application = get_wallet_application()
+        records = [
+            record for record in records
+            if record.get("starknet_address") is None or record.get("starknet_wallet_application") != wallet_application
+        ]
+
+        if len(records) == 0:
+            return 0
+
+        accounts = derive_starknet_accounts(
+            [CryptographyManager.decrypt(record["starknet_private_key"]) for record in records],
+            [CryptographyManager.decrypt(record["starknet_wallet_salt"]) for record in records]
+        )
+
+        for record, (starknet_address, starknet_public_key) in zip(records, accounts):
+            record["starknet_address"] = starknet_address
+            record["starknet_public_key"] = starknet_public_key
+            record["starknet_wallet_application"] = wallet_application
+
+        return len(records)
+
     @staticmethod
     def get_zklend_withdraw_tx_count(zklend_tx_count):
         return zklend_tx_count if WITHDRAWAL_FROM_ZKLEND else 0
@@ -177,13 +285,14 @@ class Database:
         if tx_count == 0:
             return Database.remove_item_from_data(database, data_item_index)
 
-        database["data"][data_item_index]["starknet_private_key"] = CryptographyManager.encrypt(
-            data_item.starknet_private_key)
-        database["data"][data_item_index]["starknet_wallet_salt"] = CryptographyManager.encrypt(
-            data_item.starknet_wallet_salt)
-        database["data"][data_item_index]["evm_private_key"] = CryptographyManager.encrypt(
-            data_item.evm_private_key)
-        database["data"][data_item_index]["proxy"] = CryptographyManager.encrypt(data_item.proxy)
+        database["data"][data_item_index]["starknet_private_key"] = CryptographyManager.encrypt_if_changed(
+            database["data"][data_item_index]["starknet_private_key"], data_item.starknet_private_key)
+        database["data"][data_item_index]["starknet_wallet_salt"] = CryptographyManager.encrypt_if_changed(
+            database["data"][data_item_index]["starknet_wallet_salt"], data_item.starknet_wallet_salt)
+        database["data"][data_item_index]["evm_private_key"] = CryptographyManager.encrypt_if_changed(
+            database["data"][data_item_index]["evm_private_key"], data_item.evm_private_key)
+        database["data"][data_item_index]["proxy"] = CryptographyManager.encrypt_if_changed(
+            database["data"][data_item_index]["proxy"], data_item.proxy)
         database["data"][data_item_index]["withdrawal_address"] = data_item.withdrawal_address
         database["data"][data_item_index]["dmail_tx_count"] = data_item.dmail_tx_count
         database["data"][data_item_index]["nft_marketplace_allowance_tx_count"] = \
@@ -201,6 +310,9 @@ class Database:
         database["data"][data_item_index]["is_bridge_completed"] = data_item.is_bridge_completed
         database["data"][data_item_index]["volume_amount"] = data_item.volume_amount
 
+        get_execution_plan(data_item)
+        database["data"][data_item_index]["execution_plan"] = data_item.execution_plan
+
         return database
 
     @staticmethod
@@ -210,6 +322,65 @@ class Database:
 
         return database
 
+    @staticmethod
+    def claim_account(worker_id: str, is_available):
+        return storage.claim_account(worker_id, is_available)
+
+    @staticmethod
+    def update_account(record, data_item: DataItem):
+        database = {"data": [record], "errors": [], "accounts_remaining": 1}
+        Database.update_database(database, data_item, 0)
+
+        if len(database["data"]) == 0:
+            storage.remove_account(record["id"])
+        else:
+            storage.update_account(record)
+
+        excel_exporter.mark_changed(storage.snapshot)
+
+    @staticmethod
+    def remove_account(record):
+        storage.remove_account(record["id"])
+        excel_exporter.mark_changed(storage.snapshot)
+
+    @staticmethod
+    def move_account_to_errors(record):
+        storage.move_account_to_errors(record["id"])
+        excel_exporter.mark_changed(storage.snapshot)
+
+    @staticmethod
+    def get_database_summary() -> dict:
+        return storage.get_summary()
+
+    @staticmethod
+    def load_data_item(data_item_json) -> DataItem:
+        return DataItem(
+            data_item_json["starknet_private_key"],
+            data_item_json["starknet_wallet_salt"],
+            data_item_json["evm_private_key"],
+            data_item_json["proxy"],
+            data_item_json["withdrawal_address"],
+            data_item_json["dmail_tx_count"],
+            data_item_json["nft_marketplace_allowance_tx_count"],
+            data_item_json["myswap_swap_tx_count"],
+            data_item_json["jediswap_swap_tx_count"],
+            data_item_json["tenkswap_swap_tx_count"],
+            data_item_json["sithswap_swap_tx_count"],
+            data_item_json["avnu_swap_tx_count"],
+            data_item_json["my_identity_mint_tx_count"],
+            data_item_json["starkverse_mint_tx_count"],
+            data_item_json["zklend_deposit_tx_count"],
+            data_item_json["zklend_withdraw_tx_count"],
+            data_item_json["is_okx_withdraw_completed"],
+            data_item_json["is_bridge_completed"],
+            data_item_json["volume_amount"],
+            CryptographyMode.DECRYPT,
+            data_item_json.get("starknet_address"),
+            data_item_json.get("starknet_public_key"),
+            data_item_json.get("execution_plan"),
+            data_item_json.get("starknet_wallet_application")
+        )
+
     @staticmethod
     def get_first_data_item(data):
         try:
@@ -223,28 +394,7 @@ class Database:
             data_item_json = data[data_item_index]
 
             if data_len > 0:
-                data_item = DataItem(
-                    data_item_json["starknet_private_key"],
-                    data_item_json["starknet_wallet_salt"],
-                    data_item_json["evm_private_key"],
-                    data_item_json["proxy"],
-                    data_item_json["withdrawal_address"],
-                    data_item_json["dmail_tx_count"],
-                    data_item_json["nft_marketplace_allowance_tx_count"],
-                    data_item_json["myswap_swap_tx_count"],
-                    data_item_json["jediswap_swap_tx_count"],
-                    data_item_json["tenkswap_swap_tx_count"],
-                    data_item_json["sithswap_swap_tx_count"],
-                    data_item_json["avnu_swap_tx_count"],
-                    data_item_json["my_identity_mint_tx_count"],
-                    data_item_json["starkverse_mint_tx_count"],
-                    data_item_json["zklend_deposit_tx_count"],
-                    data_item_json["zklend_withdraw_tx_count"],
-                    data_item_json["is_okx_withdraw_completed"],
-                    data_item_json["is_bridge_completed"],
-                    data_item_json["volume_amount"],
-                    CryptographyMode.DECRYPT
-                )
+                data_item = Database.load_data_item(data_item_json)
                 return data_item, data_item_index
             else:
                 raise Exception("Empty range for randrange")
@@ -272,28 +422,7 @@ class Database:
             data_item_json = data[data_item_index]
 
             if data_len > 0:
-                data_item = DataItem(
-                    data_item_json["starknet_private_key"],
-                    data_item_json["starknet_wallet_salt"],
-                    data_item_json["evm_private_key"],
-                    data_item_json["proxy"],
-                    data_item_json["withdrawal_address"],
-                    data_item_json["dmail_tx_count"],
-                    data_item_json["nft_marketplace_allowance_tx_count"],
-                    data_item_json["myswap_swap_tx_count"],
-                    data_item_json["jediswap_swap_tx_count"],
-                    data_item_json["tenkswap_swap_tx_count"],
-                    data_item_json["sithswap_swap_tx_count"],
-                    data_item_json["avnu_swap_tx_count"],
-                    data_item_json["my_identity_mint_tx_count"],
-                    data_item_json["starkverse_mint_tx_count"],
-                    data_item_json["zklend_deposit_tx_count"],
-                    data_item_json["zklend_withdraw_tx_count"],
-                    data_item_json["is_okx_withdraw_completed"],
-                    data_item_json["is_bridge_completed"],
-                    data_item_json["volume_amount"],
-                    CryptographyMode.DECRYPT
-                )
+                data_item = Database.load_data_item(data_item_json)
                 return data_item, data_item_index
             else:
                 raise Exception("Empty range for randrange")
@@ -308,26 +437,37 @@ class Database:
     @staticmethod
     def read_database() -> Any:
         try:
-            with open(DATABASE_PATH) as json_file:
-                return json.load(json_file)
+            database = storage.read()
+
+            accounts_count = Database.fill_starknet_accounts(database["data"] + database["errors"])
+            if accounts_count > 0:
+                storage.save(database)
+                logger.info(f"Starknet addresses were been derived for {accounts_count} accounts", send_to_tg=False)
+
+            return database
         except Exception as e:
             raise Exception(f"Error while read database: {str(e)}")
 
     @staticmethod
-    def save_database(database) -> None:
+    def save_database(database, changes: list = None) -> None:
         try:
-            if type(database) is dict:
-                database = json.dumps(database, indent=4)
+            if type(database) is not dict:
+                database = json.loads(database)
 
-            with open(DATABASE_PATH, 'w') as json_file:
-                json_file.write(database)
-
-            export_json(database, "data", DATABASE_DATA_EXCEL_PATH)
-            export_json(database, "errors", DATABASE_ERRORS_EXCEL_PATH)
+            storage.save(database, changes)
+            excel_exporter.mark_changed(database)
 
         except Exception as e:
             raise Exception(f"Error while save database: {str(e)}")
 
+    @staticmethod
+    def export_excel() -> None:
+        try:
+            excel_exporter.export(Database.read_database())
+            logger.success(f"Database was been exported to Excel", send_to_tg=False)
+        except Exception as e:
+            raise Exception(f"Error while export database to Excel: {str(e)}")
+
     @staticmethod
     def read_from_txt(file_path) -> Any:
         try:
@@ -355,10 +495,13 @@ class Database:
         return total_tx_count
 
     @staticmethod
-    def get_database_tx_count(data):
+    def get_database_tx_count(database):
+        if "tx_count" in database:
+            return database["tx_count"]
+
         tx_count = 0
 
-        for item in data:
+        for item in database["data"]:
             if isinstance(item, dict):
                 for key, value in item.items():
                     if key.endswith("_tx_count"):
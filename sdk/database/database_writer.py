@@ -0,0 +1,164 @@
+import asyncio
+import random
+import uuid
+
+from constants import SQLITE_HEARTBEAT_INTERVAL
+from sdk.database.data_item import DataItem
+from sdk.database.database import Database, storage
+from sdk.database.sqlite_storage import SqliteStorage
+from sdk.helpers.logger import logger
+
+
+class DatabaseWriter:
+    def __init__(self, database):
+        self.database = database
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        await self.queue.join()
+
+        if self.task is not None:
+            self.task.cancel()
+
+    async def has_accounts(self) -> bool:
+        return len(self.database["data"]) > 0
+
+    async def claim(self, is_available):
+        records = [record for record in self.database["data"] if is_available(record)]
+
+        return random.choice(records) if len(records) > 0 else None
+
+    async def release(self, record):
+        pass
+
+    def index_of(self, record) -> int:
+        for index, item in enumerate(self.database["data"]):
+            if item is record:
+                return index
+
+        raise Exception("Data item is not in database")
+
+    def get_change(self, record, index: int) -> str:
+        if index < len(self.database["data"]) and self.database["data"][index] is record:
+            return "update"
+
+        if len(self.database["errors"]) > 0 and self.database["errors"][-1] is record:
+            return "error"
+
+        return "remove"
+
+    async def update(self, record, data_item: DataItem):
+        return await self.submit(
+            record,
+            lambda index: Database.update_database(self.database, data_item, index)
+        )
+
+    async def remove(self, record):
+        return await self.submit(
+            record,
+            lambda index: Database.remove_item_from_data(self.database, index)
+        )
+
+    async def move_to_errors(self, record):
+        return await self.submit(
+            record,
+            lambda index: Database.move_item_to_errors(self.database, record, index)
+        )
+
+    async def submit(self, record, operation):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((record, operation, future))
+
+        return await future
+
+    async def run(self):
+        while True:
+            commands = [await self.queue.get()]
+
+            while not self.queue.empty():
+                commands.append(self.queue.get_nowait())
+
+            results = []
+            changes = []
+            for record, operation, future in commands:
+                try:
+                    index = self.index_of(record)
+                    operation(index)
+                    changes.append((self.get_change(record, index), record))
+                    results.append((future, None))
+                except Exception as e:
+                    results.append((future, e))
+
+            try:
+                await asyncio.to_thread(Database.save_database, self.database, changes)
+            except Exception as e:
+                logger.error(f"Database writer error: {str(e)}")
+                results = [(future, error or e) for future, error in results]
+
+            for future, error in results:
+                if future.done():
+                    pass
+                elif error is None:
+                    future.set_result(True)
+                else:
+                    future.set_exception(error)
+
+                self.queue.task_done()
+
+
+class SqliteDatabaseWriter:
+    def __init__(self):
+        self.worker_id = uuid.uuid4().hex
+        self.task = None
+
+    @property
+    def database(self) -> dict:
+        return Database.get_database_summary()
+
+    def start(self):
+        storage.heartbeat(self.worker_id)
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+
+        await asyncio.to_thread(storage.remove_worker, self.worker_id)
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(SQLITE_HEARTBEAT_INTERVAL)
+
+            try:
+                await asyncio.to_thread(storage.heartbeat, self.worker_id)
+            except Exception as e:
+                logger.error(f"Database writer error: {str(e)}")
+
+    async def has_accounts(self) -> bool:
+        return await asyncio.to_thread(storage.has_accounts)
+
+    async def claim(self, is_available):
+        return await asyncio.to_thread(Database.claim_account, self.worker_id, is_available)
+
+    async def release(self, record):
+        await asyncio.to_thread(storage.release_account, self.worker_id, record["id"])
+
+    async def update(self, record, data_item: DataItem):
+        return await asyncio.to_thread(Database.update_account, record, data_item)
+
+    async def remove(self, record):
+        return await asyncio.to_thread(Database.remove_account, record)
+
+    async def move_to_errors(self, record):
+        return await asyncio.to_thread(Database.move_account_to_errors, record)
+
+
+def create_database_writer(database):
+    if isinstance(storage, SqliteStorage):
+        return SqliteDatabaseWriter()
+
+    return DatabaseWriter(database)
@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import DATABASE_DATA_EXCEL_PATH, DATABASE_ERRORS_EXCEL_PATH
+from sdk.helpers.logger import logger
+from sdk.helpers.utils import export_excel
+
+
+class ExcelExporter:
+    def __init__(self, interval: int):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.database = None
+        self.version = 0
+        self.exported_version = 0
+        self.submitted_at = 0
+        self.future = None
+
+    def mark_changed(self, database):
+        with self.lock:
+            self.database = database
+            self.version += 1
+
+            if time.time() - self.submitted_at >= self.interval and (self.future is None or self.future.done()):
+                self.submit()
+
+    def export(self, database: dict = None):
+        with self.lock:
+            if database is not None and database is not self.database:
+                self.database = database
+                self.version += 1
+
+            if self.database is None or self.version == self.exported_version:
+                return None
+
+            future = self.submit()
+
+        return future.result()
+
+    def submit(self):
+        self.submitted_at = time.time()
+        self.future = self.executor.submit(self.write, self.get_snapshot(), self.version)
+
+        return self.future
+
+    def get_snapshot(self) -> dict:
+        database = self.database() if callable(self.database) else self.database
+
+        return {field: [dict(record) for record in database[field]] for field in ("data", "errors")}
+
+    def write(self, snapshot: dict, version: int):
+        started_at = time.time()
+
+        export_excel(snapshot["data"], DATABASE_DATA_EXCEL_PATH)
+        export_excel(snapshot["errors"], DATABASE_ERRORS_EXCEL_PATH)
+
+        self.exported_version = max(self.exported_version, version)
+        logger.debug(f"Database exported to Excel in {round(time.time() - started_at, 2)}s", send_to_tg=False)
+
+    def close(self):
+        # At interpreter exit the executor no longer accepts work, so the last export is written in this thread
+        self.executor.shutdown(wait=True)
+
+        with self.lock:
+            if self.database is None or self.version == self.exported_version:
+                return
+
+            snapshot, version = self.get_snapshot(), self.version
+
+        try:
+            self.write(snapshot, version)
+        except Exception as e:
+            logger.error(f"Error while export database to Excel: {str(e)}", send_to_tg=False)
@@ -0,0 +1,179 @@
+import json
+import os
+
+from sdk.database.json_storage import JsonStorage
+from sdk.helpers.logger import logger
+
+
+class JournalStorage:
+    def __init__(self, snapshot_path: str, journal_path: str, compaction_size: int):
+        self.snapshot = JsonStorage(snapshot_path)
+        self.journal_path = journal_path
+        self.compaction_size = compaction_size
+        self.journal_size = 0
+        self.state = None
+        self.database = None
+
+    def read(self) -> dict:
+        database = self.snapshot.read()
+        entries = self.read_journal()
+
+        if len(entries) > 0:
+            replay(database, entries)
+            logger.debug(f"Replayed {len(entries)} database journal entries", send_to_tg=False)
+
+        self.checkpoint(database)
+
+        return database
+
+    def read_journal(self) -> list:
+        if not os.path.exists(self.journal_path):
+            return []
+
+        entries = []
+
+        with open(self.journal_path) as journal_file:
+            for line in journal_file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning("Database journal has a torn entry, the rest of the journal is skipped",
+                                   send_to_tg=False)
+                    break
+
+        return entries
+
+    def save(self, database: dict, changes: list = None):
+        if self.state is None or database is not self.database:
+            return self.checkpoint(database)
+
+        entries = get_entries(self.state, database, changes)
+        if len(entries) == 0:
+            return
+
+        with open(self.journal_path, "a") as journal_file:
+            journal_file.write("".join(f"{json.dumps(entry)}\n" for entry in entries))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        for entry in entries:
+            apply_state_entry(self.state, entry)
+
+        self.journal_size += len(entries)
+
+        if self.journal_size >= self.compaction_size:
+            self.checkpoint(database)
+
+    def checkpoint(self, database: dict):
+        self.snapshot.save(database)
+
+        with open(self.journal_path, "w") as journal_file:
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        self.database = database
+        self.state = get_state(database)
+        self.journal_size = 0
+
+    def close(self):
+        if self.journal_size > 0:
+            self.checkpoint(self.database)
+
+
+def get_entries(state: dict, database: dict, changes: list = None) -> list:
+    if changes is None:
+        entries = get_database_entries(state, database)
+    else:
+        entries = [entry for change, record in changes for entry in get_record_entries(state, change, record)]
+
+    if database["accounts_remaining"] != state["accounts_remaining"]:
+        entries.append({"op": "accounts_remaining", "value": database["accounts_remaining"]})
+
+    return entries
+
+
+def get_record_entries(state: dict, change: str, record: dict) -> list:
+    if change == "update":
+        state_record = state["data"].get(record["id"])
+
+        if state_record is None:
+            return [{"op": "insert", "record": record}]
+
+        fields = {key: value for key, value in record.items() if state_record.get(key) != value}
+
+        return [{"op": "update", "id": record["id"], "fields": fields}] if len(fields) > 0 else []
+
+    if change == "error":
+        return [] if record["id"] in state["errors"] else [{"op": "error", "record": record}]
+
+    return [{"op": "remove", "id": record["id"]}] if record["id"] in state["data"] else []
+
+
+def get_database_entries(state: dict, database: dict) -> list:
+    entries = []
+    data_ids = set()
+
+    for record in database["data"]:
+        data_ids.add(record["id"])
+        state_record = state["data"].get(record["id"])
+
+        if state_record is None:
+            entries.append({"op": "insert", "record": record})
+            continue
+
+        fields = {key: value for key, value in record.items() if state_record.get(key) != value}
+        if len(fields) > 0:
+            entries.append({"op": "update", "id": record["id"], "fields": fields})
+
+    for record in database["errors"]:
+        if record["id"] not in state["errors"]:
+            entries.append({"op": "error", "record": record})
+
+    error_ids = {record["id"] for record in database["errors"]}
+    for account_id in state["data"].keys() - data_ids - error_ids:
+        entries.append({"op": "remove", "id": account_id})
+
+    return entries
+
+
+def get_state(database: dict) -> dict:
+    return {
+        "data": {record["id"]: dict(record) for record in database["data"]},
+        "errors": {record["id"] for record in database["errors"]},
+        "accounts_remaining": database["accounts_remaining"]
+    }
+
+
+def apply_state_entry(state: dict, entry: dict):
+    if entry["op"] == "insert":
+        state["data"][entry["record"]["id"]] = dict(entry["record"])
+    elif entry["op"] == "update":
+        state["data"][entry["id"]].update(entry["fields"])
+    elif entry["op"] == "error":
+        state["data"].pop(entry["record"]["id"], None)
+        state["errors"].add(entry["record"]["id"])
+    elif entry["op"] == "remove":
+        state["data"].pop(entry["id"], None)
+    elif entry["op"] == "accounts_remaining":
+        state["accounts_remaining"] = entry["value"]
+
+
+def replay(database: dict, entries: list):
+    data = {record["id"]: record for record in database["data"]}
+    errors = {record["id"]: record for record in database["errors"]}
+
+    for entry in entries:
+        if entry["op"] == "insert":
+            data.setdefault(entry["record"]["id"], entry["record"])
+        elif entry["op"] == "update" and entry["id"] in data:
+            data[entry["id"]].update(entry["fields"])
+        elif entry["op"] == "error":
+            data.pop(entry["record"]["id"], None)
+            errors.setdefault(entry["record"]["id"], entry["record"])
+        elif entry["op"] == "remove":
+            data.pop(entry["id"], None)
+        elif entry["op"] == "accounts_remaining":
+            database["accounts_remaining"] = entry["value"]
+
+    database["data"] = list(data.values())
+    database["errors"] = list(errors.values())
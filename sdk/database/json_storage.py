@@ -0,0 +1,36 @@
+import json
+import os
+
+
+class JsonStorage:
+    def __init__(self, path: str):
+        self.path = path
+
+    def read(self) -> dict:
+        with open(self.path) as json_file:
+            return assign_account_ids(json.load(json_file))
+
+    def save(self, database: dict, changes: list = None):
+        tmp_path = f"{self.path}.tmp"
+
+        with open(tmp_path, "w") as json_file:
+            json.dump(database, json_file, indent=4)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        pass
+
+
+def assign_account_ids(database: dict) -> dict:
+    records = database["data"] + database["errors"]
+    next_id = max((record["id"] for record in records if "id" in record), default=-1) + 1
+
+    for record in records:
+        if "id" not in record:
+            record["id"] = next_id
+            next_id += 1
+
+    return database
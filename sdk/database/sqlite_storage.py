@@ -0,0 +1,386 @@
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from constants import SQLITE_BUSY_TIMEOUT, SQLITE_CLAIM_BATCH_SIZE, SQLITE_WORKER_TIMEOUT
+from sdk.database.journal_storage import JournalStorage, get_entries, get_state, apply_state_entry
+from sdk.helpers.logger import logger
+
+ACCOUNT_COLUMNS = {
+    "starknet_private_key": "TEXT",
+    "starknet_wallet_salt": "TEXT",
+    "evm_private_key": "TEXT",
+    "proxy": "TEXT",
+    "withdrawal_address": "TEXT",
+    "dmail_tx_count": "INTEGER",
+    "nft_marketplace_allowance_tx_count": "INTEGER",
+    "myswap_swap_tx_count": "INTEGER",
+    "jediswap_swap_tx_count": "INTEGER",
+    "tenkswap_swap_tx_count": "INTEGER",
+    "sithswap_swap_tx_count": "INTEGER",
+    "avnu_swap_tx_count": "INTEGER",
+    "my_identity_mint_tx_count": "INTEGER",
+    "starkverse_mint_tx_count": "INTEGER",
+    "zklend_deposit_tx_count": "INTEGER",
+    "zklend_withdraw_tx_count": "INTEGER",
+    "is_okx_withdraw_completed": "BOOLEAN",
+    "is_bridge_completed": "BOOLEAN",
+    "volume_amount": "REAL"
+}
+
+INDEXED_COLUMNS = [
+    column for column in ACCOUNT_COLUMNS
+    if column.endswith("_tx_count") or column.endswith("_completed")
+]
+
+TX_COUNT_COLUMNS = [column for column in ACCOUNT_COLUMNS if column.endswith("_tx_count")]
+
+AVAILABLE_ACCOUNTS = "is_error = 0 AND claimed_by IS NULL"
+
+
+class SqliteStorage:
+    def __init__(self, path: str, json_path: str, journal_path: str):
+        self.path = path
+        self.json_path = json_path
+        self.journal_path = journal_path
+        self.lock = threading.Lock()
+        self.connection = None
+        self.state = None
+        self.database = None
+
+    def connect(self):
+        if self.connection is not None:
+            return self.connection
+
+        is_new = not os.path.exists(self.path)
+
+        self.connection = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+        if is_new and os.path.exists(self.json_path):
+            self.migrate()
+
+        return self.connection
+
+    def create_tables(self):
+        columns = ", ".join(f"{column} {column_type}" for column, column_type in ACCOUNT_COLUMNS.items())
+
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS accounts ("
+                f"id INTEGER PRIMARY KEY, is_error BOOLEAN NOT NULL DEFAULT 0, {columns}, extra TEXT, "
+                f"claimed_by TEXT)"
+            )
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS workers (id TEXT PRIMARY KEY, seen_at REAL)")
+
+            account_columns = [row[1] for row in self.connection.execute("PRAGMA table_info(accounts)")]
+            if "claimed_by" not in account_columns:
+                self.connection.execute("ALTER TABLE accounts ADD COLUMN claimed_by TEXT")
+
+            self.connection.execute("CREATE INDEX IF NOT EXISTS accounts_is_error ON accounts (is_error)")
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS accounts_available ON accounts (id) WHERE {AVAILABLE_ACCOUNTS}"
+            )
+
+            for column in INDEXED_COLUMNS:
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS accounts_{column} ON accounts ({column})")
+
+    def migrate(self):
+        database = JournalStorage(self.json_path, self.journal_path, 0).read()
+        self.write(database)
+
+        logger.success(f"Database migrated from {self.json_path} to {self.path}, {len(database['data'])} accounts",
+                       send_to_tg=False)
+
+    def read(self) -> dict:
+        with self.lock:
+            self.connect()
+
+            database = self.dump()
+            self.database = database
+            self.state = get_state(database)
+
+            return database
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return self.dump()
+
+    def dump(self) -> dict:
+        self.connect()
+
+        cursor = self.connection.execute("SELECT * FROM accounts ORDER BY id")
+        columns = [description[0] for description in cursor.description]
+
+        database = {"data": [], "errors": [], "accounts_remaining": 0}
+        for row in cursor:
+            row = dict(zip(columns, row))
+            database["errors" if row.pop("is_error") else "data"].append(load_record(row))
+
+        accounts_remaining = self.get_accounts_remaining()
+        database["accounts_remaining"] = len(database["data"]) if accounts_remaining is None else accounts_remaining
+
+        return database
+
+    def save(self, database: dict, changes: list = None):
+        with self.lock:
+            self.connect()
+
+            if self.state is None or database is not self.database:
+                return self.write(database)
+
+            entries = get_entries(self.state, database, changes)
+            if len(entries) == 0:
+                return
+
+            with self.connection:
+                for entry in entries:
+                    self.apply_entry(entry)
+
+            for entry in entries:
+                apply_state_entry(self.state, entry)
+
+    def write(self, database: dict):
+        account_ids = {record["id"] for record in database["data"] + database["errors"]}
+
+        with self.connection:
+            for record in database["data"]:
+                self.upsert(record, False)
+
+            for record in database["errors"]:
+                self.upsert(record, True)
+
+            stale_ids = [
+                (account_id,) for (account_id,) in self.connection.execute("SELECT id FROM accounts")
+                if account_id not in account_ids
+            ]
+            self.connection.executemany("DELETE FROM accounts WHERE id = ?", stale_ids)
+
+            self.set_accounts_remaining(database["accounts_remaining"])
+
+        self.database = database
+        self.state = get_state(database)
+
+    def apply_entry(self, entry: dict):
+        if entry["op"] == "insert":
+            self.upsert(entry["record"], False)
+        elif entry["op"] == "update":
+            self.update(entry["id"], entry["fields"])
+        elif entry["op"] == "error":
+            self.upsert(entry["record"], True)
+        elif entry["op"] == "remove":
+            self.connection.execute("DELETE FROM accounts WHERE id = ?", (entry["id"],))
+        elif entry["op"] == "accounts_remaining":
+            self.set_accounts_remaining(entry["value"])
+
+    def upsert(self, record: dict, is_error: bool):
+        row = dump_record(record)
+        row["is_error"] = is_error
+        columns = list(row)
+
+        self.connection.execute(
+            f"INSERT INTO accounts ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in columns)}",
+            [row[column] for column in columns]
+        )
+
+    def update(self, account_id: int, fields: dict):
+        row = {column: value for column, value in fields.items() if column in ACCOUNT_COLUMNS}
+        extra_fields = {key: value for key, value in fields.items() if key not in ACCOUNT_COLUMNS}
+
+        if len(extra_fields) > 0:
+            extra = self.connection.execute("SELECT extra FROM accounts WHERE id = ?", (account_id,)).fetchone()
+            row["extra"] = json.dumps({**json.loads(extra[0] or "{}"), **extra_fields})
+
+        if len(row) == 0:
+            return
+
+        self.connection.execute(
+            f"UPDATE accounts SET {', '.join(f'{column} = ?' for column in row)} WHERE id = ?",
+            [*row.values(), account_id]
+        )
+
+    def set_accounts_remaining(self, accounts_remaining: int):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('accounts_remaining', ?)",
+            (str(accounts_remaining),)
+        )
+
+    def get_accounts_remaining(self) -> int:
+        accounts_remaining = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'accounts_remaining'"
+        ).fetchone()
+
+        return int(accounts_remaining[0]) if accounts_remaining else None
+
+    def decrease_accounts_remaining(self):
+        self.connection.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) - 1 WHERE key = 'accounts_remaining'"
+        )
+
+    def claim_account(self, worker_id: str, is_available) -> dict:
+        with self.lock:
+            self.connect()
+
+            first_id, last_id = [
+                self.connection.execute(
+                    f"SELECT {function}(id) FROM accounts INDEXED BY accounts_available WHERE {AVAILABLE_ACCOUNTS}"
+                ).fetchone()[0]
+                for function in ("MIN", "MAX")
+            ]
+            if first_id is None:
+                return None
+
+            pivot = random.randint(first_id, last_id)
+            rows = self.get_available_rows("id >= ?", pivot)
+            if len(rows) < SQLITE_CLAIM_BATCH_SIZE:
+                rows += self.get_available_rows("id < ?", pivot, SQLITE_CLAIM_BATCH_SIZE - len(rows))
+
+            for record in rows:
+                if not is_available(record):
+                    continue
+
+                with self.connection:
+                    cursor = self.connection.execute(
+                        f"UPDATE accounts SET claimed_by = ? WHERE id = ? AND {AVAILABLE_ACCOUNTS}",
+                        (worker_id, record["id"])
+                    )
+
+                if cursor.rowcount == 1:
+                    return record
+
+            return None
+
+    def get_available_rows(self, condition: str, pivot: int, limit: int = SQLITE_CLAIM_BATCH_SIZE) -> list:
+        cursor = self.connection.execute(
+            f"SELECT * FROM accounts INDEXED BY accounts_available "
+            f"WHERE {AVAILABLE_ACCOUNTS} AND {condition} ORDER BY id LIMIT ?",
+            (pivot, limit)
+        )
+        columns = [description[0] for description in cursor.description]
+
+        records = []
+        for row in cursor:
+            row = dict(zip(columns, row))
+            row.pop("is_error")
+            records.append(load_record(row))
+
+        return records
+
+    def release_account(self, worker_id: str, account_id: int):
+        with self.lock:
+            self.connect()
+
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE accounts SET claimed_by = NULL WHERE id = ? AND claimed_by = ?",
+                    (account_id, worker_id)
+                )
+
+    def update_account(self, record: dict):
+        with self.lock:
+            self.connect()
+
+            with self.connection:
+                self.update(record["id"], {key: value for key, value in record.items() if key != "id"})
+
+    def remove_account(self, account_id: int):
+        with self.lock:
+            self.connect()
+
+            with self.connection:
+                cursor = self.connection.execute("DELETE FROM accounts WHERE id = ? AND is_error = 0", (account_id,))
+
+                if cursor.rowcount == 1:
+                    self.decrease_accounts_remaining()
+
+    def move_account_to_errors(self, account_id: int):
+        with self.lock:
+            self.connect()
+
+            with self.connection:
+                cursor = self.connection.execute(
+                    "UPDATE accounts SET is_error = 1, claimed_by = NULL WHERE id = ? AND is_error = 0",
+                    (account_id,)
+                )
+
+                if cursor.rowcount == 1:
+                    self.decrease_accounts_remaining()
+
+    def has_accounts(self) -> bool:
+        with self.lock:
+            self.connect()
+
+            return self.connection.execute("SELECT 1 FROM accounts WHERE is_error = 0 LIMIT 1").fetchone() is not None
+
+    def get_summary(self) -> dict:
+        with self.lock:
+            self.connect()
+
+            tx_count = self.connection.execute(
+                f"SELECT SUM({' + '.join(TX_COUNT_COLUMNS)}) FROM accounts WHERE is_error = 0"
+            ).fetchone()[0]
+
+            return {"data": [], "errors": [], "accounts_remaining": self.get_accounts_remaining() or 0,
+                    "tx_count": tx_count or 0}
+
+    def heartbeat(self, worker_id: str):
+        with self.lock:
+            self.connect()
+
+            now = time.time()
+
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO workers (id, seen_at) VALUES (?, ?)",
+                    (worker_id, now)
+                )
+                # Claims of a process that stopped sending heartbeats are given back to the other processes
+                self.connection.execute(
+                    "UPDATE accounts SET claimed_by = NULL "
+                    "WHERE claimed_by IN (SELECT id FROM workers WHERE seen_at < ?)",
+                    (now - SQLITE_WORKER_TIMEOUT,)
+                )
+                self.connection.execute("DELETE FROM workers WHERE seen_at < ?", (now - SQLITE_WORKER_TIMEOUT,))
+
+    def remove_worker(self, worker_id: str):
+        with self.lock:
+            self.connect()
+
+            with self.connection:
+                self.connection.execute("UPDATE accounts SET claimed_by = NULL WHERE claimed_by = ?", (worker_id,))
+                self.connection.execute("DELETE FROM workers WHERE id = ?", (worker_id,))
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+def dump_record(record: dict) -> dict:
+    row = {column: record.get(column) for column in ACCOUNT_COLUMNS}
+    row["id"] = record["id"]
+    row["extra"] = json.dumps({
+        key: value for key, value in record.items()
+        if key not in ACCOUNT_COLUMNS and key != "id"
+    })
+
+    return row
+
+
+def load_record(row: dict) -> dict:
+    extra = json.loads(row.pop("extra") or "{}")
+    row.pop("claimed_by", None)
+
+    for column, column_type in ACCOUNT_COLUMNS.items():
+        if column_type == "BOOLEAN" and row[column] is not None:
+            row[column] = bool(row[column])
+
+    return {**row, **extra}
@@ -0,0 +1,30 @@
+from constants import (
+    DATABASE_PATH,
+    DATABASE_JOURNAL_PATH,
+    DATABASE_JOURNAL_COMPACTION_SIZE,
+    DATABASE_SQLITE_PATH
+)
+from sdk.database.journal_storage import JournalStorage
+from sdk.database.json_storage import JsonStorage
+from sdk.database.sqlite_storage import SqliteStorage
+from sdk.helpers.logger import logger
+
+
+def create_storage(storage_type: str):
+    if storage_type == "json":
+        return JsonStorage(DATABASE_PATH)
+
+    if storage_type == "journal":
+        return JournalStorage(DATABASE_PATH, DATABASE_JOURNAL_PATH, DATABASE_JOURNAL_COMPACTION_SIZE)
+
+    if storage_type == "sqlite":
+        return SqliteStorage(DATABASE_SQLITE_PATH, DATABASE_PATH, DATABASE_JOURNAL_PATH)
+
+    raise Exception(f"Unknown database storage type: {storage_type}")
+
+
+def close_storage(storage):
+    try:
+        storage.close()
+    except Exception as e:
+        logger.error(f"Error while close database storage: {str(e)}", send_to_tg=False)
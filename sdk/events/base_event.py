@@ -1,6 +1,7 @@
 from sdk.database.database import Database
-from sdk.evm.client import EvmClient
-from sdk.helpers.utils import get_starknet_read_client, get_starknet_write_client
+from sdk.evm.client import EvmClient, get_evm_client
+from sdk.helpers.utils import get_starknet_client, get_starknet_balances
+from sdk.models.balance_snapshot import BalanceSnapshot
 from sdk.models.chain import ethereum, arbitrum, optimism
 from sdk.starknet.client import StarknetClient
 
@@ -11,41 +12,41 @@ class BaseEvent:
         self.data_item = data_item
         self.data_item_index = data_item_index
 
-        self.database_tx_count = Database.get_database_tx_count(database["data"])
+        self.database_tx_count = Database.get_database_tx_count(database)
         self.data_item_tx_count = Database.get_data_item_tx_count(data_item)
         self.accounts_remaining = database['accounts_remaining']
 
-        self.starknet_read_client = StarknetClient(
+        self.starknet_client = StarknetClient(
             private_key=data_item.starknet_private_key,
             salt=data_item.starknet_wallet_salt,
             proxy=data_item.proxy,
-            rpc=get_starknet_read_client(data_item.proxy)
+            rpc=get_starknet_client(data_item.proxy),
+            address=data_item.starknet_address,
+            public_key=data_item.starknet_public_key,
+            wallet_application=data_item.starknet_wallet_application
         )
 
-        self.starknet_write_client = StarknetClient(
-            private_key=data_item.starknet_private_key,
-            salt=data_item.starknet_wallet_salt,
-            proxy=data_item.proxy,
-            rpc=get_starknet_write_client(data_item.proxy)
-        )
+        self.starknet_address = hex(self.starknet_client.address)
+        self.balances = None
 
-        self.ethereum_client = EvmClient(
-            private_key=data_item.evm_private_key,
-            chain=ethereum,
-            proxy=data_item.proxy
-        )
+    @property
+    def ethereum_client(self) -> EvmClient:
+        return get_evm_client(self.data_item.evm_private_key, ethereum, self.data_item.proxy)
 
-        self.arbitrum_client = EvmClient(
-            private_key=data_item.evm_private_key,
-            chain=arbitrum,
-            proxy=data_item.proxy
-        )
+    @property
+    def arbitrum_client(self) -> EvmClient:
+        return get_evm_client(self.data_item.evm_private_key, arbitrum, self.data_item.proxy)
 
-        self.optimism_client = EvmClient(
-            private_key=data_item.evm_private_key,
-            chain=optimism,
-            proxy=data_item.proxy
-        )
+    @property
+    def optimism_client(self) -> EvmClient:
+        return get_evm_client(self.data_item.evm_private_key, optimism, self.data_item.proxy)
+
+    @property
+    def evm_address(self) -> str:
+        return self.ethereum_client.address
+
+    async def get_balances(self) -> BalanceSnapshot:
+        if self.balances is None:
+            self.balances = await get_starknet_balances(self.starknet_client)
 
-        self.starknet_address = hex(self.starknet_read_client.address)
-        self.evm_address = self.ethereum_client.address
+        return self.balances
@@ -1,3 +1,4 @@
+import asyncio
 import random
 
 from config import ATTEMPTS_COUNT, BRIDGE_ETH_KEEP_AMOUNT, ROUND_TO
@@ -12,27 +13,27 @@ class BridgeEvent(BaseEvent):
 
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def starkgate_bridge_from_starknet(self, evm_address: str, amount: float):
-        return await self.starknet_write_client.starkgate_bridge(amount, evm_address)
+        return await self.starknet_client.starkgate_bridge(amount, evm_address)
 
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def orbiter_bridge_from_starknet(self, evm_address: str, amount: float):
-        return await self.starknet_write_client.orbiter_bridge(amount, evm_address, arbitrum)
+        return await self.starknet_client.orbiter_bridge(amount, evm_address, arbitrum)
 
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def layerswap_bridge_from_starknet(self, evm_address: str, amount: float):
-        return await self.starknet_write_client.layerswap_bridge(amount, evm_address, optimism)
+        return await self.starknet_client.layerswap_bridge(amount, evm_address, optimism)
 
     @evm_retry(attempts=ATTEMPTS_COUNT)
     async def starkgate_bridge_from_evm(self, starknet_address: str, amount: float):
-        return self.ethereum_client.starkgate_bridge(amount, starknet_address)
+        return await asyncio.to_thread(self.ethereum_client.starkgate_bridge, amount, starknet_address)
 
     @evm_retry(attempts=ATTEMPTS_COUNT)
     async def orbiter_bridge_from_evm(self, starknet_address: str, amount: float):
-        return self.arbitrum_client.orbiter_bridge(amount, starknet_address)
+        return await asyncio.to_thread(self.arbitrum_client.orbiter_bridge, amount, starknet_address)
 
     @evm_retry(attempts=ATTEMPTS_COUNT)
     async def layerswap_bridge_from_evm(self, starknet_address: str, amount: float):
-        return self.optimism_client.layerswap_bridge(amount, starknet_address)
+        return await asyncio.to_thread(self.optimism_client.layerswap_bridge, amount, starknet_address)
 
     @staticmethod
     def get_amount_to_bridge(balance: float):
@@ -10,12 +10,12 @@ from constants import (
     STARKNET_ETH_TOKEN_ADDRESS,
     STARKNET_COLLECTOR_COINGECKO_TOKEN_IDS
 )
-from sdk.database.database import Database
+from sdk.apis.avnuswap import AvnuSwapAPI
 from sdk.events.base_event import BaseEvent
 from sdk.helpers.decorators import starknet_retry
 from sdk.helpers.logger import logger
-from sdk.helpers.utils import get_starknet_token_balance
-from sdk.starknet.utils import get_cg_tokens_price_usd
+from sdk.models.balance_snapshot import BalanceSnapshot
+from sdk.starknet.utils import get_cg_tokens_price_usd, float_to_wei
 
 
 class CollectorEvent(BaseEvent):
@@ -23,25 +23,43 @@ class CollectorEvent(BaseEvent):
         super().__init__(database, data_item, data_item_index)
 
     async def collector(self):
-        usd_token_prices = get_cg_tokens_price_usd(STARKNET_COLLECTOR_COINGECKO_TOKEN_IDS)
+        usd_token_prices = await get_cg_tokens_price_usd(STARKNET_COLLECTOR_COINGECKO_TOKEN_IDS)
+        balances = await self.get_balances()
         tx_count = 0
 
+        if USE_AVNU_FOR_COLLECTOR:
+            await self.get_avnu_quotes(usd_token_prices, balances)
+
         for token_address in STARKNET_COLLECTOR_TOKENS:
-            tx_status = await self.token_collector(token_address, usd_token_prices)
+            tx_status = await self.token_collector(token_address, usd_token_prices, balances)
             if tx_status:
                 tx_count += 1
 
         if tx_count != len(STARKNET_COLLECTOR_TOKENS):
             logger.warning(f"Not all tokens were swapped on this account")
-            self.database = Database.move_item_to_errors(self.database, self.data_item, self.data_item_index)
-        else:
-            self.database = Database.remove_item_from_data(self.database, self.data_item_index)
+            return False
 
-        Database.save_database(self.database)
+        return True
+
+    async def get_avnu_quotes(self, token_prices_usd: list, balances: BalanceSnapshot):
+        pairs = []
+
+        for token_address in STARKNET_COLLECTOR_TOKENS:
+            token_balance = balances.get(token_address)
+            token_balance_usd = token_balance * token_prices_usd[STARKNET_COLLECTOR_TOKENS.index(token_address)]
+
+            if token_balance_usd > MINIMUM_COLLECTED_USD_VALUE:
+                amount_in = int(token_balance * 10 ** ROUND_TO) / 10 ** ROUND_TO
+                pairs.append((token_address, STARKNET_ETH_TOKEN_ADDRESS, float_to_wei(amount_in, token_address)))
+
+        try:
+            await AvnuSwapAPI(proxy=self.data_item.proxy).get_quotes(pairs)
+        except Exception as e:
+            logger.warning(f"Avnu quotes error: {str(e)}", send_to_tg=False)
 
-    async def token_collector(self, token_address: str, token_prices_usd: list) -> bool:
+    async def token_collector(self, token_address: str, token_prices_usd: list, balances: BalanceSnapshot) -> bool:
         try:
-            token_balance = await get_starknet_token_balance(self.starknet_read_client, token_addr=token_address)
+            token_balance = balances.get(token_address)
             token_balance_usd = token_balance * token_prices_usd[STARKNET_COLLECTOR_TOKENS.index(token_address)]
             logger.info(f"Account balance in {STARKNET_TOKEN_NAMES[token_address]} token: {token_balance_usd} USD")
 
@@ -60,13 +78,13 @@ class CollectorEvent(BaseEvent):
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def swap(self, token_in_address: str, amount_in: float) -> bool:
         if USE_AVNU_FOR_COLLECTOR:
-            return await self.starknet_write_client.avnu_swap(
+            return await self.starknet_client.avnu_swap(
                 token_in_addr=token_in_address,
                 token_out_addr=STARKNET_ETH_TOKEN_ADDRESS,
                 amount_in=amount_in
             )
         else:
-            return await self.starknet_write_client.myswap_swap(
+            return await self.starknet_client.myswap_swap(
                 token_in_addr=token_in_address,
                 token_out_addr=STARKNET_ETH_TOKEN_ADDRESS,
                 amount_in=amount_in
@@ -8,7 +8,6 @@ from config import (
 from constants import STARKNET_ETH_TOKEN_ADDRESS
 from sdk.events.base_event import BaseEvent
 from sdk.helpers.decorators import starknet_retry
-from sdk.helpers.utils import get_starknet_token_balance
 
 
 class SenderEvent(BaseEvent):
@@ -16,7 +15,7 @@ class SenderEvent(BaseEvent):
         super().__init__(database, data_item, data_item_index)
 
     async def transfer(self):
-        balance = await get_starknet_token_balance(self.starknet_read_client)
+        balance = (await self.get_balances()).get(STARKNET_ETH_TOKEN_ADDRESS)
         transfer_keep_amount = round(random.uniform(*STARKNET_TRANSFER_ETH_KEEP_AMOUNT), ROUND_TO)
 
         if transfer_keep_amount > balance:
@@ -29,7 +28,7 @@ class SenderEvent(BaseEvent):
 
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def token_transfer(self, transfer_amount):
-        return await self.starknet_write_client.transfer(
+        return await self.starknet_client.transfer(
             token_in_addr=STARKNET_ETH_TOKEN_ADDRESS,
             amount_in=transfer_amount,
             recipient=self.data_item.withdrawal_address
@@ -7,6 +7,7 @@ from config import (
     WARMUP_WITH_GAS_THRESHOLD_ETH_VALUE,
     OKX_WITHDRAW_DEVIATION
 )
+from constants import STARKNET_ETH_TOKEN_ADDRESS
 from sdk.database.data_item import DataItem
 from sdk.database.database import Database
 from sdk.events.base_event import BaseEvent
@@ -14,9 +15,14 @@ from sdk.helpers.aggregator import Aggregator
 from sdk.helpers.decorators import starknet_retry
 from sdk.helpers.logger import logger
 from sdk.helpers.okx import volume_mode_withdraw
-from sdk.helpers.utils import get_starknet_token_balance
 from sdk.models.dapp import Dapp
 from sdk.models.event import Event
+from sdk.starknet.calls import (
+    get_dmail_send_mail_call,
+    get_nft_marketplace_allowance_call,
+    get_my_identity_mint_call,
+    get_starkverse_mint_call
+)
 
 
 class WarmupEvent(BaseEvent):
@@ -26,7 +32,7 @@ class WarmupEvent(BaseEvent):
     @starknet_retry(attempts=ATTEMPTS_COUNT)
     async def run_warmup(self, data_item: DataItem, aggregator: Aggregator):
         try:
-            event = aggregator.get_random_warmup_event()
+            event = aggregator.get_warmup_event()
             tx_status = False
 
             if event == Event.SWAPS:
@@ -41,6 +47,9 @@ class WarmupEvent(BaseEvent):
             if event == Event.ZKLEND:
                 tx_status, data_item = await self.zklend(data_item)
 
+            if event == Event.BUNDLE:
+                tx_status, data_item = await self.bundle(data_item, aggregator)
+
         except Exception as e:
             logger.error(f"Client failed with error: {str(e)}")
             tx_status = False
@@ -51,19 +60,19 @@ class WarmupEvent(BaseEvent):
         func = None
 
         if aggregator.dex_for_swap == Dapp.MYSWAP.value:
-            func = self.starknet_write_client.myswap_swap
+            func = self.starknet_client.myswap_swap
 
         if aggregator.dex_for_swap == Dapp.JEDISWAP.value:
-            func = self.starknet_write_client.jediswap_swap
+            func = self.starknet_client.jediswap_swap
 
         if aggregator.dex_for_swap == Dapp.TENKSWAP.value:
-            func = self.starknet_write_client.tenkswap_swap
+            func = self.starknet_client.tenkswap_swap
 
         if aggregator.dex_for_swap == Dapp.SITHSWAP.value:
-            func = self.starknet_write_client.sithswap_swap
+            func = self.starknet_client.sithswap_swap
 
         if aggregator.dex_for_swap == Dapp.AVNU.value:
-            func = self.starknet_write_client.avnu_swap
+            func = self.starknet_client.avnu_swap
 
         if func is None:
             raise Exception("Dex for swap was not found")
@@ -93,19 +102,22 @@ class WarmupEvent(BaseEvent):
         return tx_status, data_item
 
     async def nft(self, data_item: DataItem, aggregator: Aggregator):
-        random.shuffle(aggregator.suitable_nfts)
-        event = random.choice(aggregator.suitable_nfts)
+        event = aggregator.nft_for_event
+
+        if event is None:
+            random.shuffle(aggregator.suitable_nfts)
+            event = random.choice(aggregator.suitable_nfts)
 
         tx_status = False
 
         if event == Dapp.MY_IDENTITY:
-            tx_status = await self.starknet_write_client.my_identity_mint()
+            tx_status = await self.starknet_client.my_identity_mint()
 
         if event == Dapp.STARKVERSE:
-            tx_status = await self.starknet_write_client.starkverse_mint()
+            tx_status = await self.starknet_client.starkverse_mint()
 
         if event == Dapp.NFT_ALLOWANCE:
-            tx_status = await self.starknet_write_client.nft_marketplace_allowance(aggregator.nft_allowance_amount)
+            tx_status = await self.starknet_client.nft_marketplace_allowance(aggregator.nft_allowance_amount)
 
         if tx_status:
             if event == Dapp.MY_IDENTITY:
@@ -120,24 +132,60 @@ class WarmupEvent(BaseEvent):
         return tx_status, data_item
 
     async def dmail(self, data_item: DataItem):
-        tx_status = await self.starknet_write_client.dmail_send_mail()
+        tx_status = await self.starknet_client.dmail_send_mail()
 
         if tx_status:
             data_item.dmail_tx_count -= 1
 
         return tx_status, data_item
 
+    async def bundle(self, data_item: DataItem, aggregator: Aggregator):
+        calls = []
+
+        for dapp in aggregator.bundle_dapps:
+            if dapp == Dapp.DMAIL:
+                calls.append(await get_dmail_send_mail_call(self.starknet_client))
+
+            if dapp == Dapp.MY_IDENTITY:
+                calls.append(await get_my_identity_mint_call(self.starknet_client))
+
+            if dapp == Dapp.STARKVERSE:
+                calls.append(await get_starkverse_mint_call(self.starknet_client))
+
+            if dapp == Dapp.NFT_ALLOWANCE:
+                calls.append(
+                    await get_nft_marketplace_allowance_call(self.starknet_client, aggregator.nft_allowance_amount)
+                )
+
+        tx_status = await self.starknet_client.multicall(calls, [dapp.value for dapp in aggregator.bundle_dapps])
+
+        if tx_status:
+            for dapp in aggregator.bundle_dapps:
+                if dapp == Dapp.DMAIL:
+                    data_item.dmail_tx_count -= 1
+
+                if dapp == Dapp.MY_IDENTITY:
+                    data_item.my_identity_mint_tx_count -= 1
+
+                if dapp == Dapp.STARKVERSE:
+                    data_item.starkverse_mint_tx_count -= 1
+
+                if dapp == Dapp.NFT_ALLOWANCE:
+                    data_item.nft_marketplace_allowance_tx_count -= 1
+
+        return tx_status, data_item
+
     async def zklend(self, data_item: DataItem):
         if data_item.zklend_deposit_tx_count < data_item.zklend_withdraw_tx_count:
-            tx_status = await self.starknet_write_client.zklend_withdraw()
+            tx_status = await self.starknet_client.zklend_withdraw()
 
             if tx_status:
                 data_item.zklend_withdraw_tx_count -= 1
         else:
-            balance = await get_starknet_token_balance(self.starknet_read_client)
+            balance = (await self.get_balances()).get(STARKNET_ETH_TOKEN_ADDRESS)
             deposit_percent = round(random.uniform(*ZKLEND_DEPOSIT_PERCENT), ROUND_TO)
             deposit_amount = round(balance * deposit_percent, ROUND_TO)
-            tx_status = await self.starknet_write_client.zklend_deposit(deposit_amount)
+            tx_status = await self.starknet_client.zklend_deposit(deposit_amount)
 
             if tx_status:
                 data_item.zklend_deposit_tx_count -= 1
@@ -145,28 +193,30 @@ class WarmupEvent(BaseEvent):
         return tx_status, data_item
 
     async def warmup_with_gas_withdraw(self):
-        balance = await get_starknet_token_balance(self.starknet_read_client)
+        balance = (await self.get_balances()).get(STARKNET_ETH_TOKEN_ADDRESS)
 
         if balance < WARMUP_WITH_GAS_THRESHOLD_ETH_VALUE:
             logger.info("Start warmup with gas withdraw", send_to_tg=False)
             amount_to_withdraw = round(random.uniform(*OKX_WITHDRAW_DEVIATION), ROUND_TO)
             await volume_mode_withdraw(
-                starknet_client=self.starknet_read_client,
+                starknet_client=self.starknet_client,
                 evm_client=None,
                 withdrawal_address=self.starknet_address,
                 amount_to_withdraw=amount_to_withdraw
             )
+            self.balances = None
 
     async def warmup_low_bank_withdraw(self):
         logger.info("Start warmup low bank withdraw", send_to_tg=False)
         amount_to_withdraw = round(random.uniform(*OKX_WITHDRAW_DEVIATION), ROUND_TO)
 
         await volume_mode_withdraw(
-            starknet_client=self.starknet_read_client,
+            starknet_client=self.starknet_client,
             evm_client=None,
             withdrawal_address=self.starknet_address,
             amount_to_withdraw=amount_to_withdraw
         )
+        self.balances = None
 
         self.data_item.is_okx_withdraw_completed = True
         self.database = Database.update_database(self.database, self.data_item, self.data_item_index)
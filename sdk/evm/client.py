@@ -1,10 +1,11 @@
+import threading
+
 from web3 import Web3
 
 from config import (
     EVM_ETH_MIN_BALANCE,
     TX_DELAY_RANGE,
-    EVM_GAS_THRESHOLD,
-    GAS_DELAY_RANGE
+    EVM_GAS_THRESHOLD
 )
 from constants import (
     EVM_ORBITER_BRIGDE_ADDRESSES
@@ -34,7 +35,7 @@ from sdk.models.token_amount import TokenAmount
 
 @prepare_calling_functions(
     check_balance_evm(min_balance=EVM_ETH_MIN_BALANCE),
-    evm_gas_delay(gas_threshold=EVM_GAS_THRESHOLD, delay_range=GAS_DELAY_RANGE),
+    evm_gas_delay(gas_threshold=EVM_GAS_THRESHOLD),
     wait(delay_range=TX_DELAY_RANGE)
 )
 class EvmClient:
@@ -44,7 +45,7 @@ class EvmClient:
         self.proxy = proxy
         self.w3 = init_web3(self)
         self.public_key = Web3.to_checksum_address(self.w3.eth.account.from_key(private_key=private_key).address)
-        self.address = Web3.to_checksum_address(self.w3.eth.account.from_key(private_key=private_key).address)
+        self.address = self.public_key
 
     def starkgate_bridge(self, amount: float, starknet_address: str):
         logger.info(f"[STARKGATE] Bridge {amount} to {starknet_address}")
@@ -64,8 +65,7 @@ class EvmClient:
         )
 
         api = StarkgateAPI(proxy=self.proxy)
-        message_fee = api.get_message_fee(amount, starknet_address)
-        api.close_session_sync()
+        message_fee = api.get_message_fee_sync(amount, starknet_address)
 
         if not message_fee:
             return False
@@ -138,3 +138,20 @@ class EvmClient:
         )
 
         return verify_tx(self, tx_hash=tx_hash)
+
+
+evm_clients = {}
+evm_clients_lock = threading.Lock()
+
+
+def get_evm_client(private_key: str, chain: Chain, proxy: str = None) -> EvmClient:
+    if private_key is None:
+        raise Exception("EVM private key is not set for this account")
+
+    key = (private_key, chain.chain_id, proxy)
+
+    with evm_clients_lock:
+        if key not in evm_clients:
+            evm_clients[key] = EvmClient(private_key=private_key, chain=chain, proxy=proxy)
+
+        return evm_clients[key]
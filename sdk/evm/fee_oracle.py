@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import defaultdict
+
+from web3 import Web3
+
+from constants import (
+    EVM_FEE_CACHE_TIME,
+    EVM_FEE_HISTORY_BLOCKS,
+    EVM_FEE_HISTORY_PERCENTILE
+)
+from sdk.helpers.logger import logger
+from sdk.models.chain import Chain
+
+
+class FeeOracle:
+    def __init__(self, cache_time: int, history_blocks: int, percentile: int):
+        self.cache_time = cache_time
+        self.history_blocks = history_blocks
+        self.percentile = percentile
+        self.fees = {}
+        self.locks = defaultdict(threading.Lock)
+
+    def get_fees(self, w3: Web3, chain: Chain) -> tuple[int, int]:
+        with self.locks[chain.chain_id]:
+            timestamp, fees = self.fees.get(chain.chain_id, (0, None))
+
+            if time.time() - timestamp > self.cache_time:
+                fees = self.fetch_fees(w3)
+                self.fees[chain.chain_id] = (time.time(), fees)
+
+            return fees
+
+    def fetch_fees(self, w3: Web3) -> tuple[int, int]:
+        fee_history = w3.eth.fee_history(self.history_blocks, "latest", [self.percentile])
+        base_fee = fee_history["baseFeePerGas"][-1]
+        rewards = sorted(reward[0] for reward in fee_history.get("reward", []) if reward and reward[0] > 0)
+
+        if rewards:
+            max_priority_fee_per_gas = rewards[len(rewards) // 2]
+        else:
+            logger.debug("Fee history has no rewards, using node max priority fee", send_to_tg=False)
+            max_priority_fee_per_gas = w3.eth.max_priority_fee
+
+        return max_priority_fee_per_gas, base_fee
+
+
+fee_oracle = FeeOracle(
+    cache_time=EVM_FEE_CACHE_TIME,
+    history_blocks=EVM_FEE_HISTORY_BLOCKS,
+    percentile=EVM_FEE_HISTORY_PERCENTILE
+)
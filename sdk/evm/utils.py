@@ -2,7 +2,6 @@ from decimal import Decimal
 from typing import Union
 
 from web3 import Web3
-from web3.middleware import geth_poa_middleware
 
 from constants import (
     LAYERSWAP_BRIDGE_ADDRESSES,
@@ -11,7 +10,10 @@ from constants import (
     EVM_ESTIMATED_FEE_MULTIPLIER
 )
 from sdk.apis.layerswap import LayerSwapAPI
+from sdk.evm.fee_oracle import fee_oracle
+from sdk.helpers.gas_scheduler import release_gas_slot
 from sdk.helpers.logger import logger
+from sdk.helpers.nonce_manager import nonce_manager
 from sdk.models.chain import Chain
 from sdk.models.layerswap_swap_config import LayerswapDataItem
 from sdk.models.token_amount import TokenAmount
@@ -26,32 +28,8 @@ def init_web3(self):
     return Web3(Web3.HTTPProvider(endpoint_uri=self.chain.rpc, request_kwargs=request_kwargs))
 
 
-def get_tx_params(
-        self,
-        to_addr: str,
-        data: str = None,
-        from_addr: str = None,
-        value: int = None
-) -> dict:
-    if not from_addr:
-        from_addr = self.address
-
-    tx_params = {
-        "chainId": self.w3.eth.chain_id,
-        "nonce": self.w3.eth.get_transaction_count(self.address),
-        "from": self.w3.to_checksum_address(from_addr),
-        "to": self.w3.to_checksum_address(to_addr),
-    }
-
-    if data:
-        tx_params["data"] = data
-
-    if value:
-        tx_params["value"] = value
-
-    tx_params["gasPrice"] = self.w3.eth.gas_price
-
-    return tx_params
+def get_nonce_key(self) -> tuple:
+    return self.chain.chain_id, self.public_key
 
 
 def get_gas_estimate(self, tx_params: dict, gas_multiplier: float = EVM_ESTIMATED_FEE_MULTIPLIER):
@@ -82,8 +60,7 @@ def send_transaction(
         from_addr = self.public_key
 
     tx_params = {
-        "chainId": self.w3.eth.chain_id,
-        "nonce": self.w3.eth.get_transaction_count(self.public_key),
+        "chainId": self.chain.chain_id,
         "from": Web3.to_checksum_address(from_addr),
         "to": Web3.to_checksum_address(to_addr)
     }
@@ -107,47 +84,31 @@ def send_transaction(
     if not gas_additional:
         tx_params["gasPrice"] = self.w3.eth.gas_price
 
-    sign = self.w3.eth.account.sign_transaction(tx_params, self.private_key)
-    tx_result = self.w3.eth.send_raw_transaction(sign.rawTransaction)
+    tx_params["nonce"] = nonce_manager.get_nonce(
+        get_nonce_key(self),
+        lambda: self.w3.eth.get_transaction_count(self.public_key, "pending")
+    )
 
-    return tx_result
+    try:
+        sign = self.w3.eth.account.sign_transaction(tx_params, self.private_key)
+        tx_result = self.w3.eth.send_raw_transaction(sign.rawTransaction)
+    except Exception:
+        nonce_manager.reset(get_nonce_key(self))
+        raise
 
+    release_gas_slot()
 
-def get_eip1559_params(self, gas_multiplier) -> tuple[int, int]:
-    w3 = Web3(provider=Web3.HTTPProvider(endpoint_uri=self.chain.rpc))
+    return tx_result
 
-    w3.middleware_onion.inject(geth_poa_middleware, layer=0)
-    last_block = w3.eth.get_block("latest")
 
-    max_priority_fee_per_gas = get_max_priority_fee_per_gas(w3=w3, block=last_block)
-    base_fee = int(last_block["baseFeePerGas"] * gas_multiplier)
+def get_eip1559_params(self, gas_multiplier) -> tuple[int, int]:
+    max_priority_fee_per_gas, base_fee = fee_oracle.get_fees(self.w3, self.chain)
+    base_fee = int(base_fee * gas_multiplier)
     max_fee_per_gas = max(base_fee, base_fee + max_priority_fee_per_gas)
 
     return max_priority_fee_per_gas, max_fee_per_gas
 
 
-def get_max_priority_fee_per_gas(w3: Web3, block: dict) -> int:
-    block_number = block["number"]
-    latest_block_transaction_count = w3.eth.get_block_transaction_count(block_number)
-    max_priority_fee_per_gas_list = []
-
-    for tx_index in range(latest_block_transaction_count):
-        try:
-            transaction = w3.eth.get_transaction_by_block(block_number, tx_index)
-            if "maxPriorityFeePerGas" in transaction:
-                max_priority_fee_per_gas_list.append(transaction["maxPriorityFeePerGas"])
-        except Exception:
-            continue
-
-    if not max_priority_fee_per_gas_list:
-        max_priority_fee_per_gas = w3.eth.max_priority_fee
-    else:
-        max_priority_fee_per_gas_list.sort()
-        max_priority_fee_per_gas = max_priority_fee_per_gas_list[len(max_priority_fee_per_gas_list) // 2]
-
-    return max_priority_fee_per_gas
-
-
 def verify_tx(self, tx_hash) -> bool:
     try:
         data = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=200)
@@ -160,6 +121,7 @@ def verify_tx(self, tx_hash) -> bool:
             return False
 
     except Exception as e:
+        nonce_manager.reset(get_nonce_key(self))
         logger.error(f"Unexpected error in verify_tx function: {e}")
         return False
 
@@ -175,10 +137,9 @@ def get_layerswap_deposit_address(amount: Union[float, Decimal], evm_address: st
         source_address=evm_address,
     )
 
-    swap_id = api.create_swap(layerswap_config)['swap_id']
-    watch_id = api.get_swap(swap_id)['sequence_number']
-    deposit_address = api.get_deposit_address(LAYERSWAP_BRIDGE_ADDRESSES[source_chain.chain_id])['address']
-    api.close_session_sync()
+    swap_id = api.create_swap_sync(layerswap_config)['swap_id']
+    watch_id = api.get_swap_sync(swap_id)['sequence_number']
+    deposit_address = api.get_deposit_address_sync(LAYERSWAP_BRIDGE_ADDRESSES[source_chain.chain_id])['address']
 
     return deposit_address
 
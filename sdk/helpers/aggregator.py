@@ -1,12 +1,25 @@
 import random
 
-from config import SWAP_DEVIATION, ROUND_TO, NFT_MARKETPLACE_ALLOWANCE_AMOUNT
+from config import (
+    SWAP_DEVIATION,
+    ROUND_TO,
+    NFT_MARKETPLACE_ALLOWANCE_AMOUNT,
+    USE_WARMUP_BUNDLES,
+    WARMUP_BUNDLE_SIZE
+)
 from constants import (
     STARKNET_DAI_TOKEN_ADDRESS,
     STARKNET_SWAP_TOKEN_PAIRS,
     STARKNET_ETH_TOKEN_ADDRESS
 )
 from sdk.database.data_item import DataItem
+from sdk.helpers.planner import (
+    SWAP_ACTIONS,
+    NFT_ACTIONS,
+    get_execution_plan,
+    get_next_action,
+    get_action_event
+)
 from sdk.models.dapp import Dapp
 from sdk.models.event import Event
 
@@ -16,16 +29,32 @@ class Aggregator:
         self.data_item = data_item
         self.suitable_dexes = Aggregator.get_suitable_dexes(data_item)
         self.suitable_nfts = Aggregator.get_suitable_nfts(data_item)
+        self.execution_plan = get_execution_plan(data_item)
+        self.planned_action = get_next_action(self.execution_plan, token_in_for_swap)
         self.nft_allowance_amount = random.uniform(*NFT_MARKETPLACE_ALLOWANCE_AMOUNT)
+        self.nft_for_event = Dapp(self.planned_action) if self.planned_action in NFT_ACTIONS else None
+        self.bundle_dapps = Aggregator.get_bundle_dapps(self.execution_plan) if USE_WARMUP_BUNDLES else []
         self.token_in_for_swap = token_in_for_swap
         self.amount_in_for_swap = Aggregator.get_amount_in_for_swap(token_in_for_swap, amount_in_for_swap)
-        self.dex_for_swap = Aggregator.get_dex_for_swap(self.suitable_dexes, token_in_for_swap)
+        self.dex_for_swap = self.planned_action if self.planned_action in SWAP_ACTIONS \
+            else Aggregator.get_dex_for_swap(self.suitable_dexes, token_in_for_swap)
         self.token_out_for_swap = Aggregator.get_token_out_for_swap(
-            self.suitable_dexes,
+            [action for action in self.execution_plan if action in SWAP_ACTIONS],
             self.dex_for_swap,
             self.token_in_for_swap
         )
 
+    def get_warmup_event(self):
+        if self.planned_action is None:
+            return self.get_random_warmup_event()
+
+        event = get_action_event(self.planned_action)
+
+        if event in (Event.NFTS, Event.DMAIL) and len(self.bundle_dapps) > 1:
+            return Event.BUNDLE
+
+        return event
+
     def get_random_warmup_event(self):
         events = []
 
@@ -41,6 +70,9 @@ class Aggregator:
         random.shuffle(events)
         random_event = random.choice(events)
 
+        if random_event in (Event.NFTS, Event.DMAIL) and len(self.bundle_dapps) > 1:
+            return Event.BUNDLE
+
         return random_event
 
     @staticmethod
@@ -73,6 +105,16 @@ class Aggregator:
 
         return suitable_nfts
 
+    @staticmethod
+    def get_bundle_dapps(execution_plan: list):
+        bundle_dapps = []
+
+        for action in execution_plan:
+            if action in (*NFT_ACTIONS, Dapp.DMAIL.value) and Dapp(action) not in bundle_dapps:
+                bundle_dapps.append(Dapp(action))
+
+        return bundle_dapps[:random.randint(*WARMUP_BUNDLE_SIZE)]
+
     @staticmethod
     def get_dex_for_swap(dexes: list, token_in: str):
         suitable_dexes_for_swap = []
@@ -97,7 +139,7 @@ class Aggregator:
         if not valid_pairs:
             raise ValueError("Token out for swap is None")
 
-        if dex == Dapp.SITHSWAP and len(dexes) < 2:
+        if dex == Dapp.SITHSWAP.value and len(dexes) < 2:
             valid_pairs = Aggregator.remove_pairs_for_sithswap(valid_pairs)
 
         random.shuffle(valid_pairs)
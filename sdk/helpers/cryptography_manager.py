@@ -1,10 +1,17 @@
 import base64
 import hashlib
+import hmac
+import os
+import threading
 from enum import Enum
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
-from config import USE_DATABASE_ENCRYPTION, ENCRYPTION_PASSWORD
+from config import USE_DATABASE_ENCRYPTION, ENCRYPTION_PASSWORD, ENCRYPTION_KDF
+from constants import ENCRYPTION_SALT_PATH, ENCRYPTED_FIELDS, ENCRYPTION_DIGESTS_LIMIT
 
 
 class CryptographyMode(Enum):
@@ -14,6 +21,10 @@ class CryptographyMode(Enum):
 
 
 class CryptographyManager:
+    lock = threading.Lock()
+    keys = {}
+    fernets = {}
+    digests = {}
 
     @staticmethod
     def generate_key_from_password(password):
@@ -21,23 +32,115 @@ class CryptographyManager:
         return base64.urlsafe_b64encode(key)
 
     @staticmethod
-    def encrypt(data: str, password: str = ENCRYPTION_PASSWORD):
+    def derive_key(password: str, kdf: str = ENCRYPTION_KDF, create_salt: bool = False):
+        if kdf == "sha256":
+            return CryptographyManager.generate_key_from_password(password)
+
+        salt = CryptographyManager.get_salt(create_salt)
+
+        if kdf == "scrypt":
+            key = Scrypt(salt=salt, length=32, n=2 ** 15, r=8, p=1).derive(password.encode())
+        elif kdf == "pbkdf2":
+            key = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=600000) \
+                .derive(password.encode())
+        else:
+            raise Exception(f"Unknown encryption kdf: {kdf}")
+
+        return base64.urlsafe_b64encode(key)
+
+    @staticmethod
+    def get_salt(create_salt: bool = False) -> bytes:
+        if os.path.exists(ENCRYPTION_SALT_PATH):
+            with open(ENCRYPTION_SALT_PATH) as salt_file:
+                return bytes.fromhex(salt_file.read().strip())
+
+        # A new salt makes every value encrypted with the old one undecryptable
+        if not create_salt:
+            raise Exception(f"Encryption salt file {ENCRYPTION_SALT_PATH} is missing, "
+                            f"the encrypted database can't be decrypted without it")
+
+        salt = os.urandom(16)
+        with open(ENCRYPTION_SALT_PATH, "w") as salt_file:
+            salt_file.write(salt.hex())
+
+        return salt
+
+    @staticmethod
+    def get_fernet(password: str, create_salt: bool = False) -> Fernet:
+        fernet = CryptographyManager.fernets.get(password)
+
+        if fernet is None:
+            with CryptographyManager.lock:
+                if password not in CryptographyManager.fernets:
+                    key = CryptographyManager.derive_key(password, create_salt=create_salt)
+                    CryptographyManager.keys[password] = key
+                    CryptographyManager.fernets[password] = Fernet(key)
+
+                fernet = CryptographyManager.fernets[password]
+
+        return fernet
+
+    @staticmethod
+    def get_digest(data: str, password: str) -> bytes:
+        CryptographyManager.get_fernet(password)
+
+        return hmac.new(CryptographyManager.keys[password], data.encode(), hashlib.sha256).digest()
+
+    @staticmethod
+    def remember_digest(encrypted_data, data: str, password: str):
+        if len(CryptographyManager.digests) >= ENCRYPTION_DIGESTS_LIMIT:
+            CryptographyManager.digests.clear()
+
+        CryptographyManager.digests[encrypted_data] = CryptographyManager.get_digest(data, password)
+
+    @staticmethod
+    def encrypt(data: str, password: str = ENCRYPTION_PASSWORD, create_salt: bool = False):
         if data is None or not USE_DATABASE_ENCRYPTION:
             return data
 
-        key = CryptographyManager.generate_key_from_password(password)
-        fernet = Fernet(key)
-        encrypted_data = fernet.encrypt(data.encode())
+        encrypted_data = CryptographyManager.get_fernet(password, create_salt).encrypt(data.encode()).decode()
+        CryptographyManager.remember_digest(encrypted_data, data, password)
 
-        return encrypted_data.decode()
+        return encrypted_data
 
     @staticmethod
     def decrypt(data, password: str = ENCRYPTION_PASSWORD):
         if data is None or not USE_DATABASE_ENCRYPTION:
             return data
 
-        key = CryptographyManager.generate_key_from_password(password)
-        fernet = Fernet(key)
-        decrypted_data = fernet.decrypt(data)
+        decrypted_data = CryptographyManager.get_fernet(password).decrypt(data).decode()
+        CryptographyManager.remember_digest(data, decrypted_data, password)
+
+        return decrypted_data
+
+    @staticmethod
+    def encrypt_if_changed(encrypted_data, data: str, password: str = ENCRYPTION_PASSWORD):
+        if not USE_DATABASE_ENCRYPTION or encrypted_data is None or data is None:
+            return CryptographyManager.encrypt(data, password)
+
+        digest = CryptographyManager.digests.get(encrypted_data)
+        if digest is None:
+            digest = CryptographyManager.get_digest(CryptographyManager.decrypt(encrypted_data, password), password)
+
+        if hmac.compare_digest(digest, CryptographyManager.get_digest(data, password)):
+            return encrypted_data
+
+        CryptographyManager.digests.pop(encrypted_data, None)
+
+        return CryptographyManager.encrypt(data, password)
+
+    @staticmethod
+    def encrypt_records(records: list, password: str = ENCRYPTION_PASSWORD, create_salt: bool = False):
+        for record in records:
+            for field in ENCRYPTED_FIELDS:
+                if field in record:
+                    record[field] = CryptographyManager.encrypt(record[field], password, create_salt)
+
+        return records
+
+    @staticmethod
+    def encrypt_database(database, password: str = ENCRYPTION_PASSWORD, create_salt: bool = False):
+        CryptographyManager.encrypt_records(database["data"], password, create_salt)
+        CryptographyManager.encrypt_records(database["errors"], password, create_salt)
 
-        return decrypted_data.decode()
+        return database
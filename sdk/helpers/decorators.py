@@ -1,15 +1,19 @@
 import random
-import time
 from functools import wraps
 
 from starknet_py.net.client_errors import ClientError
-from tqdm import tqdm
 from web3 import Web3
 
 from constants import STARKNET_ETH_TOKEN_ADDRESS
-from sdk.apis.starknet_gas_checker import GasAPI
+from sdk.helpers.delay import sleep, sleep_sync, get_backoff_delay
+from sdk.helpers.gas_scheduler import (
+    ethereum_gas_scheduler,
+    starknet_gas_scheduler,
+    get_gas_priority,
+    hold_gas_slot,
+    release_gas_slot
+)
 from sdk.helpers.logger import logger
-from sdk.models.chain import ethereum
 from sdk.models.token_amount import TokenAmount
 
 
@@ -35,13 +39,10 @@ def apply_decorators(func, decorators):
 def wait(delay_range: list):
     def decorator(func):
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            result = func(*args, **kwargs)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
             random_delay = random.randint(*delay_range)
-            with tqdm(total=random_delay, desc="Waiting", unit="s", dynamic_ncols=True, colour="blue") as pbar:
-                for _ in range(random_delay):
-                    time.sleep(1)
-                    pbar.update(1)
+            sleep_sync(random_delay, desc=f"{self.address[:10]} waiting")
             return result
 
         return wrapper
@@ -52,13 +53,10 @@ def wait(delay_range: list):
 def wait_async(delay_range: list):
     def decorator(func):
         @wraps(func)
-        async def wrapper(*args, **kwargs):
-            result = await func(*args, **kwargs)
+        async def wrapper(self, *args, **kwargs):
+            result = await func(self, *args, **kwargs)
             random_delay = random.randint(*delay_range)
-            with tqdm(total=random_delay, desc="Waiting", unit="s", dynamic_ncols=True, colour="blue") as pbar:
-                for _ in range(random_delay):
-                    time.sleep(1)
-                    pbar.update(1)
+            await sleep(random_delay, desc=f"{hex(self.address)[:10]} waiting")
             return result
 
         return wrapper
@@ -96,58 +94,32 @@ def check_balance_starknet(min_balance):
     return decorator
 
 
-def evm_gas_delay(gas_threshold: int, delay_range: list):
+def evm_gas_delay(gas_threshold: int):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            w3 = Web3(Web3.HTTPProvider(ethereum.rpc))
-            while True:
-                current_eth_gas_price = w3.eth.gas_price
-                threshold = Web3.to_wei(gas_threshold, "gwei")
-                if current_eth_gas_price > threshold:
-                    random_delay = random.randint(*delay_range)
-
-                    logger.warning(
-                        f"Current gas fee {round(Web3.from_wei(current_eth_gas_price, 'gwei'), 2)} GWEI > Gas"
-                        f" threshold {Web3.from_wei(threshold, 'gwei')} GWEI. Waiting for {random_delay} seconds...")
-
-                    with tqdm(total=random_delay, desc="Waiting", unit="s", dynamic_ncols=True, colour="blue") as pbar:
-                        for _ in range(random_delay):
-                            time.sleep(1)
-                            pbar.update(1)
-                else:
-                    break
-
-            return func(*args, **kwargs)
+            ethereum_gas_scheduler.acquire_sync(Web3.to_wei(gas_threshold, "gwei"), get_gas_priority(func.__name__))
+            token = hold_gas_slot(ethereum_gas_scheduler.release_sync)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                release_gas_slot(token)
 
         return wrapper
 
     return decorator
 
 
-def starknet_gas_delay(gas_threshold: int, delay_range: list):
+def starknet_gas_delay(gas_threshold: int):
     def decorator(func):
         @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            while True:
-                gas_api = GasAPI(proxy=self.proxy)
-                current_starknet_gas_price = gas_api.get_last_block_gas_price()
-                threshold = Web3.to_wei(gas_threshold, "gwei")
-                if current_starknet_gas_price > threshold:
-                    random_delay = random.randint(*delay_range)
-
-                    logger.warning(
-                        f"Current gas fee {round(Web3.from_wei(current_starknet_gas_price, 'gwei'), 2)} GWEI > Gas"
-                        f" threshold {Web3.from_wei(threshold, 'gwei')} GWEI. Waiting for {random_delay} seconds...")
-
-                    with tqdm(total=random_delay, desc="Waiting", unit="s", dynamic_ncols=True, colour="blue") as pbar:
-                        for _ in range(random_delay):
-                            time.sleep(1)
-                            pbar.update(1)
-                else:
-                    break
-
-            return func(self, *args, **kwargs)
+        async def wrapper(self, *args, **kwargs):
+            await starknet_gas_scheduler.acquire(Web3.to_wei(gas_threshold, "gwei"), get_gas_priority(func.__name__))
+            token = hold_gas_slot(starknet_gas_scheduler.release)
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                release_gas_slot(token)
 
         return wrapper
 
@@ -181,8 +153,9 @@ def starknet_retry(attempts=5):
                 try:
                     return await func(*args, **kwargs)
                 except ClientError:
-                    logger.warning(f"Attempt {index + 1} failed: rpc is down, retrying in 30 seconds")
-                    time.sleep(30)
+                    delay = get_backoff_delay(index, base_delay=30, max_delay=240)
+                    logger.warning(f"Attempt {index + 1} failed: rpc is down, retrying in {delay} seconds")
+                    await sleep(delay, desc="Rpc waiting")
 
             raise Exception("Failed after multiple attempts")
 
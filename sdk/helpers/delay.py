@@ -0,0 +1,76 @@
+import asyncio
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from tqdm import tqdm
+
+from config import SHOW_DELAY_PROGRESS
+
+
+class ProgressRenderer:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.positions = set()
+
+    @contextmanager
+    def countdown(self, total: int, desc: str):
+        if not self.enabled:
+            yield None
+            return
+
+        with self.lock:
+            position = next(index for index in itertools.count() if index not in self.positions)
+            self.positions.add(position)
+
+        try:
+            with tqdm(
+                    total=total,
+                    desc=desc,
+                    unit="s",
+                    dynamic_ncols=True,
+                    colour="blue",
+                    position=position,
+                    leave=False
+            ) as pbar:
+                yield pbar
+        finally:
+            with self.lock:
+                self.positions.discard(position)
+
+
+progress_renderer = ProgressRenderer(enabled=SHOW_DELAY_PROGRESS)
+
+
+async def sleep(delay: float, desc: str = "Waiting") -> None:
+    with progress_renderer.countdown(int(delay), desc) as pbar:
+        if pbar is None:
+            await asyncio.sleep(delay)
+            return
+
+        for _ in range(int(delay)):
+            await asyncio.sleep(1)
+            pbar.update(1)
+
+        await asyncio.sleep(delay - int(delay))
+
+
+def sleep_sync(delay: float, desc: str = "Waiting") -> None:
+    with progress_renderer.countdown(int(delay), desc) as pbar:
+        if pbar is None:
+            time.sleep(delay)
+            return
+
+        for _ in range(int(delay)):
+            time.sleep(1)
+            pbar.update(1)
+
+        time.sleep(delay - int(delay))
+
+
+def get_backoff_delay(attempt: int, base_delay: int, max_delay: int) -> int:
+    delay = min(base_delay * 2 ** attempt, max_delay)
+    return random.randint(min(base_delay, delay), delay)
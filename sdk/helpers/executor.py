@@ -0,0 +1,107 @@
+import asyncio
+from collections import Counter
+
+from config import (
+    CONCURRENT_ACCOUNTS_COUNT,
+    MAX_ACCOUNTS_PER_PROXY,
+    USE_PROXY,
+    USE_MOBILE_PROXY
+)
+from constants import ACCOUNT_CLAIM_RETRY_DELAY
+from sdk.database.database import Database
+from sdk.database.database_writer import create_database_writer
+from sdk.helpers.cryptography_manager import CryptographyManager
+from sdk.helpers.logger import logger
+from sdk.helpers.utils import change_mobile_ip
+
+
+class AccountExecutor:
+    def __init__(
+            self,
+            database,
+            concurrent_accounts_count: int = CONCURRENT_ACCOUNTS_COUNT,
+            max_accounts_per_proxy: int = MAX_ACCOUNTS_PER_PROXY
+    ):
+        if USE_MOBILE_PROXY and concurrent_accounts_count > 1:
+            logger.warning("Mobile proxy changes ip for all accounts, concurrent accounts count set to 1",
+                           send_to_tg=False)
+            concurrent_accounts_count = 1
+
+        self.database = database
+        self.concurrent_accounts_count = max(concurrent_accounts_count, 1)
+        self.max_accounts_per_proxy = max_accounts_per_proxy if USE_PROXY else None
+        self.writer = create_database_writer(database)
+        self.condition = asyncio.Condition()
+        self.active_records = {}
+        self.proxy_usage = Counter()
+        self.proxies = {}
+
+    async def run(self, job):
+        self.writer.start()
+
+        try:
+            await asyncio.gather(*[self.worker(job) for _ in range(self.concurrent_accounts_count)])
+        finally:
+            await self.writer.stop()
+
+    async def worker(self, job):
+        while True:
+            record = await self.acquire()
+            if record is None:
+                return
+
+            try:
+                change_mobile_ip()
+                data_item = Database.load_data_item(record)
+                await job(self.writer, data_item, record)
+
+            except Exception as e:
+                logger.exception(f"Error while execute account job: {str(e)}")
+
+            finally:
+                await self.release(record)
+
+    async def acquire(self):
+        async with self.condition:
+            while True:
+                if not await self.writer.has_accounts():
+                    return None
+
+                record = await self.writer.claim(self.is_available)
+
+                if record is not None:
+                    proxy = self.get_proxy(record)
+
+                    self.active_records[record["id"]] = proxy
+                    self.proxy_usage[proxy] += 1
+
+                    return record
+
+                # Accounts claimed by other processes are not announced, so the claim is retried periodically
+                try:
+                    await asyncio.wait_for(self.condition.wait(), timeout=ACCOUNT_CLAIM_RETRY_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, record):
+        await self.writer.release(record)
+
+        async with self.condition:
+            proxy = self.active_records.pop(record["id"])
+            self.proxy_usage[proxy] -= 1
+            self.condition.notify_all()
+
+    def is_available(self, record) -> bool:
+        if record["id"] in self.active_records:
+            return False
+
+        if self.max_accounts_per_proxy is None:
+            return True
+
+        return self.proxy_usage[self.get_proxy(record)] < self.max_accounts_per_proxy
+
+    def get_proxy(self, record):
+        if record["id"] not in self.proxies:
+            self.proxies[record["id"]] = CryptographyManager.decrypt(record["proxy"])
+
+        return self.proxies[record["id"]]
@@ -0,0 +1,81 @@
+import asyncio
+import random
+import time
+from collections import deque
+
+from web3 import Web3
+
+from config import GAS_DELAY_RANGE
+from constants import GAS_MONITOR_HISTORY_SIZE
+from sdk.apis.starknet_gas_checker import GasAPI
+from sdk.helpers.logger import logger
+from sdk.models.chain import ethereum
+
+
+class GasMonitor:
+    def __init__(self, name: str, fetch_gas_price, delay_range: list, history_size: int):
+        self.name = name
+        self.fetch_gas_price = fetch_gas_price
+        self.delay_range = delay_range
+        self.history = deque(maxlen=history_size)
+        self.subscribers = []
+        self.task = None
+
+    @property
+    def gas_price(self):
+        return self.history[-1][1] if len(self.history) > 0 else None
+
+    def get_percentile(self, percentile: int):
+        if len(self.history) == 0:
+            return None
+
+        gas_prices = sorted(gas_price for _, gas_price in self.history)
+
+        return gas_prices[min(len(gas_prices) * percentile // 100, len(gas_prices) - 1)]
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def run(self):
+        while True:
+            try:
+                gas_price = await self.fetch_gas_price()
+                self.history.append((time.time(), gas_price))
+
+                for callback in self.subscribers:
+                    callback(gas_price)
+
+            except Exception as e:
+                logger.warning(f"{self.name} gas price fetch error: {str(e)}", send_to_tg=False)
+
+            await asyncio.sleep(random.randint(*self.delay_range))
+
+
+async def fetch_starknet_gas_price() -> int:
+    return await GasAPI(proxy=None).get_last_block_gas_price()
+
+
+ethereum_w3 = Web3(Web3.HTTPProvider(ethereum.rpc))
+
+
+async def fetch_ethereum_gas_price() -> int:
+    return await asyncio.to_thread(lambda: ethereum_w3.eth.gas_price)
+
+
+starknet_gas_monitor = GasMonitor("Starknet", fetch_starknet_gas_price, GAS_DELAY_RANGE, GAS_MONITOR_HISTORY_SIZE)
+ethereum_gas_monitor = GasMonitor("Ethereum", fetch_ethereum_gas_price, GAS_DELAY_RANGE, GAS_MONITOR_HISTORY_SIZE)
+
+
+async def stop_gas_monitors():
+    await starknet_gas_monitor.stop()
+    await ethereum_gas_monitor.stop()
@@ -0,0 +1,148 @@
+import asyncio
+import contextvars
+import itertools
+import time
+
+from web3 import Web3
+
+from config import GAS_SCHEDULER_BURST_SIZE, GAS_SCHEDULER_DIP_PERCENTILE
+from constants import GAS_SCHEDULER_PRIORITIES, GAS_SCHEDULER_DIP_MAX_WAIT
+from sdk.apis.session_registry import session_registry
+from sdk.helpers.gas_monitor import GasMonitor, starknet_gas_monitor, ethereum_gas_monitor
+from sdk.helpers.logger import logger
+
+
+gas_slot_release = contextvars.ContextVar("gas_slot_release", default=None)
+
+
+class GasScheduler:
+    def __init__(self, monitor: GasMonitor, burst_size: int, dip_percentile: int, dip_max_wait: int):
+        self.monitor = monitor
+        self.burst_size = max(burst_size, 1)
+        self.dip_percentile = dip_percentile
+        self.dip_max_wait = dip_max_wait
+        self.queue = []
+        self.counter = itertools.count()
+        self.active = 0
+        self.is_window_open = False
+
+        self.monitor.subscribe(self.on_gas_price)
+
+    async def acquire(self, threshold: int, priority: int):
+        self.monitor.start()
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (-priority, next(self.counter), threshold, time.time(), future)
+        self.queue.append(entry)
+        self.dispatch()
+
+        gas_price = self.monitor.gas_price
+        if not future.done() and gas_price is not None and gas_price > threshold:
+            logger.warning(
+                f"Current {self.monitor.name} gas fee {round(Web3.from_wei(gas_price, 'gwei'), 2)} GWEI > Gas"
+                f" threshold {Web3.from_wei(threshold, 'gwei')} GWEI. Waiting for gas to go down...")
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            elif entry in self.queue:
+                self.queue.remove(entry)
+            raise
+
+    def release(self):
+        self.active -= 1
+        self.dispatch()
+
+    def acquire_sync(self, threshold: int, priority: int):
+        session_registry.run_sync(self.acquire(threshold, priority))
+
+    def release_sync(self):
+        session_registry.loop.call_soon_threadsafe(self.release)
+
+    def is_dip(self, gas_price: int) -> bool:
+        if self.dip_percentile >= 100:
+            return True
+
+        dip_gas_price = self.monitor.get_percentile(self.dip_percentile)
+
+        return dip_gas_price is None or gas_price <= dip_gas_price
+
+    def on_gas_price(self, gas_price: int):
+        is_window_open = self.is_dip(gas_price) and any(gas_price <= entry[2] for entry in self.queue)
+
+        if is_window_open and not self.is_window_open:
+            logger.info(f"{self.monitor.name} gas fee {round(Web3.from_wei(gas_price, 'gwei'), 2)} GWEI,"
+                        f" releasing {len(self.queue)} pending transactions", send_to_tg=False)
+
+        self.is_window_open = is_window_open
+        self.dispatch()
+
+    def dispatch(self):
+        gas_price = self.monitor.gas_price
+        if gas_price is None:
+            return
+
+        self.queue.sort(key=lambda entry: entry[:2])
+        is_dip = self.is_dip(gas_price)
+
+        for entry in list(self.queue):
+            if self.active >= self.burst_size:
+                break
+
+            _, _, threshold, queued_at, future = entry
+
+            if future.cancelled():
+                self.queue.remove(entry)
+                continue
+
+            if gas_price <= threshold and (is_dip or time.time() - queued_at >= self.dip_max_wait):
+                self.queue.remove(entry)
+                self.active += 1
+                future.set_result(None)
+
+
+def hold_gas_slot(release) -> contextvars.Token:
+    is_released = False
+
+    def release_once():
+        nonlocal is_released
+
+        if not is_released:
+            is_released = True
+            release()
+
+    return gas_slot_release.set(release_once)
+
+
+def release_gas_slot(token: contextvars.Token = None):
+    release = gas_slot_release.get()
+
+    if release is not None:
+        release()
+
+    if token is not None:
+        gas_slot_release.reset(token)
+
+
+def get_gas_priority(name: str) -> int:
+    for action, priority in GAS_SCHEDULER_PRIORITIES.items():
+        if action in name:
+            return priority
+
+    return 0
+
+
+starknet_gas_scheduler = GasScheduler(
+    starknet_gas_monitor,
+    GAS_SCHEDULER_BURST_SIZE,
+    GAS_SCHEDULER_DIP_PERCENTILE,
+    GAS_SCHEDULER_DIP_MAX_WAIT
+)
+ethereum_gas_scheduler = GasScheduler(
+    ethereum_gas_monitor,
+    GAS_SCHEDULER_BURST_SIZE,
+    GAS_SCHEDULER_DIP_PERCENTILE,
+    GAS_SCHEDULER_DIP_MAX_WAIT
+)
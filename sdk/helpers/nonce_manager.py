@@ -0,0 +1,38 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+
+class NonceManager:
+    def __init__(self):
+        self.nonces = {}
+        self.locks = defaultdict(threading.Lock)
+        self.async_locks = defaultdict(asyncio.Lock)
+
+    def get_nonce(self, key, fetch_nonce) -> int:
+        with self.locks[key]:
+            nonce = self.nonces.get(key)
+
+            if nonce is None:
+                nonce = fetch_nonce()
+
+            self.nonces[key] = nonce + 1
+
+            return nonce
+
+    async def get_nonce_async(self, key, fetch_nonce) -> int:
+        async with self.async_locks[key]:
+            nonce = self.nonces.get(key)
+
+            if nonce is None:
+                nonce = await fetch_nonce()
+
+            self.nonces[key] = nonce + 1
+
+            return nonce
+
+    def reset(self, key):
+        self.nonces.pop(key, None)
+
+
+nonce_manager = NonceManager()
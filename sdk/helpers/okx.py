@@ -1,4 +1,4 @@
-import time
+import asyncio
 
 from ccxt import okx
 
@@ -19,6 +19,7 @@ from constants import (
     OKX_STARKNET_CHAIN,
     OKX_STARKNET_WITHDRAWAL_FEE
 )
+from sdk.helpers.delay import sleep
 from sdk.helpers.logger import logger
 from sdk.evm.client import EvmClient
 from sdk.models.token_amount import TokenAmount
@@ -37,7 +38,7 @@ def get_okx_config():
     return default_config
 
 
-def wait_for_withdrawal_final_status(exchange: okx, withdrawal_id: str):
+async def wait_for_withdrawal_final_status(exchange: okx, withdrawal_id: str):
     try:
         attempt = 1
         while True:
@@ -49,7 +50,7 @@ def wait_for_withdrawal_final_status(exchange: okx, withdrawal_id: str):
                 raise Exception('f[OKX] Withdrawal cancelled')
             if 'Withdrawal complete' not in status['data'][0]['state']:
                 attempt = attempt + 1
-                time.sleep(OKX_WAIT_FOR_WITHDRAWAL_FINAL_STATUS_TIME)
+                await sleep(OKX_WAIT_FOR_WITHDRAWAL_FINAL_STATUS_TIME, desc="[OKX] Withdrawal status waiting")
             else:
                 logger.info('[OKX] Withdraw by OKX side was completed')
                 return True
@@ -69,7 +70,7 @@ async def wait_for_starknet_withdraw_received(client: StarknetClient, initial_ba
             return True
 
         okx_attempt = okx_attempt + 1
-        time.sleep(OKX_WAIT_FOR_WITHDRAWAL_RECEIVED_TIME)
+        await sleep(OKX_WAIT_FOR_WITHDRAWAL_RECEIVED_TIME, desc="[OKX] Withdrawal receiving waiting")
 
 
 async def wait_for_evm_withdraw_received(client: EvmClient, initial_balance: int):
@@ -85,7 +86,7 @@ async def wait_for_evm_withdraw_received(client: EvmClient, initial_balance: int
             return True
 
         okx_attempt = okx_attempt + 1
-        time.sleep(OKX_WAIT_FOR_WITHDRAWAL_RECEIVED_TIME)
+        await sleep(OKX_WAIT_FOR_WITHDRAWAL_RECEIVED_TIME, desc="[OKX] Withdrawal receiving waiting")
 
 
 async def okx_watch_for_delivery(
@@ -96,7 +97,7 @@ async def okx_watch_for_delivery(
         initial_client_balance: float,
         okx_chain: str
 ):
-    withdrawal_completed_status = wait_for_withdrawal_final_status(exchange, withdrawal_id)
+    withdrawal_completed_status = await wait_for_withdrawal_final_status(exchange, withdrawal_id)
     if not withdrawal_completed_status:
         raise Exception('[OKX] Failed to wait for withdrawal completed status')
 
@@ -150,7 +151,7 @@ async def okx_withdraw(
         logger.error(f"[OKX] Withdraw {amount_to_withdraw} {OKX_CURRENCY} error: {str(e)}")
 
         if retry < OKX_TOTAL_TRIES:
-            time.sleep(OKX_SLEEP_TIME_AFTER_ERROR_SEC)
+            await sleep(OKX_SLEEP_TIME_AFTER_ERROR_SEC, desc="[OKX] Withdraw retry waiting")
             return await okx_withdraw(
                 starknet_client=starknet_client,
                 evm_client=evm_client,
@@ -204,14 +205,14 @@ def withdraw_from_sub_account(name, symbol: str) -> float:
         raise (Exception(f"[OKX] Withdraw {symbol} from {name} to main account error: {str(e)}"))
 
 
-def withdraw_from_sub_accounts(symbol=OKX_CURRENCY):
+async def withdraw_from_sub_accounts(symbol=OKX_CURRENCY):
     try:
         exchange = okx(get_okx_config())
 
         sub_accounts = exchange.private_get_users_subaccount_list()['data']
         for sub_acc in sub_accounts:
             withdraw_from_sub_account(sub_acc['subAcct'], symbol)
-            time.sleep(1)  # okx rate limit is 1 request per second
+            await asyncio.sleep(1)  # okx rate limit is 1 request per second
 
     except Exception as e:
         raise (Exception(f"[OKX] Withdraw from sub accounts error: {str(e)}"))
@@ -232,11 +233,11 @@ async def volume_mode_withdraw(
     while okx_main_account_balance < amount_to_withdraw:
         logger.info(f"[OKX] Main balance: {okx_main_account_balance} {OKX_CURRENCY}")
 
-        withdraw_from_sub_accounts()
+        await withdraw_from_sub_accounts()
         okx_main_account_balance = get_main_account_balance(exchange)
 
         if okx_main_account_balance < amount_to_withdraw:
-            time.sleep(OKX_WAIT_DEPOSIT_TIME)
+            await sleep(OKX_WAIT_DEPOSIT_TIME, desc="[OKX] Deposit waiting")
 
     await okx_withdraw(
         starknet_client=starknet_client,
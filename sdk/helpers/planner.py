@@ -0,0 +1,113 @@
+import random
+from collections import Counter
+
+from constants import STARKNET_DAI_TOKEN_ADDRESS
+from sdk.database.data_item import DataItem
+from sdk.models.dapp import Dapp
+from sdk.models.event import Event
+
+ZKLEND_DEPOSIT = "zklend_deposit"
+ZKLEND_WITHDRAW = "zklend_withdraw"
+
+PLANNED_ACTIONS = {
+    "myswap_swap_tx_count": Dapp.MYSWAP.value,
+    "jediswap_swap_tx_count": Dapp.JEDISWAP.value,
+    "tenkswap_swap_tx_count": Dapp.TENKSWAP.value,
+    "sithswap_swap_tx_count": Dapp.SITHSWAP.value,
+    "avnu_swap_tx_count": Dapp.AVNU.value,
+    "nft_marketplace_allowance_tx_count": Dapp.NFT_ALLOWANCE.value,
+    "my_identity_mint_tx_count": Dapp.MY_IDENTITY.value,
+    "starkverse_mint_tx_count": Dapp.STARKVERSE.value,
+    "dmail_tx_count": Dapp.DMAIL.value,
+    "zklend_deposit_tx_count": ZKLEND_DEPOSIT,
+    "zklend_withdraw_tx_count": ZKLEND_WITHDRAW
+}
+
+SWAP_ACTIONS = (
+    Dapp.MYSWAP.value,
+    Dapp.JEDISWAP.value,
+    Dapp.TENKSWAP.value,
+    Dapp.SITHSWAP.value,
+    Dapp.AVNU.value
+)
+
+NFT_ACTIONS = (
+    Dapp.NFT_ALLOWANCE.value,
+    Dapp.MY_IDENTITY.value,
+    Dapp.STARKVERSE.value
+)
+
+
+def get_action_counts(data_item: DataItem) -> Counter:
+    return Counter({
+        action: getattr(data_item, field)
+        for field, action in PLANNED_ACTIONS.items()
+        if getattr(data_item, field) > 0
+    })
+
+
+def create_execution_plan(data_item: DataItem) -> list:
+    counts = get_action_counts(data_item)
+    plan = list(counts.elements())
+    random.shuffle(plan)
+
+    zklend_actions = iter(get_zklend_actions(counts[ZKLEND_DEPOSIT], counts[ZKLEND_WITHDRAW]))
+
+    return [
+        next(zklend_actions) if action in (ZKLEND_DEPOSIT, ZKLEND_WITHDRAW) else action
+        for action in plan
+    ]
+
+
+def get_zklend_actions(deposit_count: int, withdraw_count: int) -> list:
+    actions = []
+
+    while deposit_count > 0 or withdraw_count > 0:
+        if deposit_count < withdraw_count:
+            actions.append(ZKLEND_WITHDRAW)
+            withdraw_count -= 1
+        else:
+            actions.append(ZKLEND_DEPOSIT)
+            deposit_count -= 1
+
+    return actions
+
+
+def get_execution_plan(data_item: DataItem) -> list:
+    plan = data_item.execution_plan.split(",") if data_item.execution_plan else []
+    counts = get_action_counts(data_item)
+    plan_counts = Counter(plan)
+
+    if any(plan_counts[action] < count for action, count in counts.items()):
+        plan = create_execution_plan(data_item)
+    else:
+        for action, count in plan_counts.items():
+            for _ in range(count - counts[action]):
+                plan.remove(action)
+
+    data_item.execution_plan = ",".join(plan)
+
+    return plan
+
+
+def get_next_action(plan: list, token_in: str) -> str:
+    for action in plan:
+        if action == Dapp.SITHSWAP.value and token_in == STARKNET_DAI_TOKEN_ADDRESS:
+            continue
+
+        return action
+
+    return None
+
+
+def get_action_event(action: str) -> Event:
+    if action in SWAP_ACTIONS:
+        return Event.SWAPS
+
+    if action in NFT_ACTIONS:
+        return Event.NFTS
+
+    if action == Dapp.DMAIL.value:
+        return Event.DMAIL
+
+    return Event.ZKLEND
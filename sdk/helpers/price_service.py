@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from pycoingecko import CoinGeckoAPI
+
+from config import PRICE_CACHE_TIME
+from constants import COINGECKO_TOKEN_IDS, PRICE_MAX_STALE_TIME
+from sdk.helpers.logger import logger
+
+
+class PriceService:
+    def __init__(self, token_ids: list, cache_time: int, max_stale_time: int):
+        self.token_ids = token_ids
+        self.cache_time = cache_time
+        self.max_stale_time = max_stale_time
+        self.prices = {}
+        self.updated_at = 0
+        self.refresh_task = None
+
+    async def get_prices(self) -> dict:
+        age = time.time() - self.updated_at
+
+        if len(self.prices) == 0 or age > self.max_stale_time:
+            await asyncio.shield(self.refresh())
+        elif age > self.cache_time:
+            self.refresh()
+
+        return self.prices
+
+    async def get_price(self, token_id: str) -> float:
+        return (await self.get_prices())[token_id]
+
+    def refresh(self) -> asyncio.Task:
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = asyncio.create_task(self.fetch_prices())
+            self.refresh_task.add_done_callback(log_refresh_error)
+
+        return self.refresh_task
+
+    async def fetch_prices(self):
+        response = await asyncio.to_thread(CoinGeckoAPI().get_price, ids=self.token_ids, vs_currencies="usd")
+
+        self.prices = {token_id: response[token_id]["usd"] for token_id in self.token_ids}
+        self.updated_at = time.time()
+
+
+def log_refresh_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Coingecko prices refresh error: {str(task.exception())}", send_to_tg=False)
+
+
+price_service = PriceService(
+    token_ids=list(set(COINGECKO_TOKEN_IDS.values())),
+    cache_time=PRICE_CACHE_TIME,
+    max_stale_time=PRICE_MAX_STALE_TIME
+)
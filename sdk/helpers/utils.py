@@ -1,16 +1,16 @@
 import json
 
 import requests
-from aiohttp import ClientSession
-from aiohttp_socks import ProxyConnector
 from openpyxl import Workbook
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import Call
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.gateway_client import GatewayClient
 from starknet_py.net.networks import MAINNET
 
 from config import (
     STARKNET_RPC_PROVIDER,
-    USE_PROXY,
     STARKNET_ETH_MIN_BALANCE,
     IP_CHANGE_LINK,
     USE_MOBILE_PROXY,
@@ -21,47 +21,32 @@ from constants import (
     STARKNET_ETH_TOKEN_ADDRESS,
     COINGECKO_TOKEN_IDS
 )
+from sdk.apis.session_registry import session_registry
 from sdk.helpers.decorators import starknet_retry
 from sdk.helpers.logger import logger
+from sdk.models.balance_snapshot import BalanceSnapshot
 from sdk.starknet.client import StarknetClient
-from sdk.starknet.utils import get_cg_tokens_price_usd, wei_to_float
+from sdk.starknet.routed_client import RoutedClient
+from sdk.starknet.utils import get_cg_tokens_price_usd, wei_to_float, call_contracts
 
 
-def export_json(data: str, field: str, destination):
+def export_excel(records: list, destination: str):
     try:
-        json_data = json.loads(data)
+        headers = list(dict.fromkeys(key for record in records for key in record))
 
-        wb = Workbook()
-        ws = wb.active
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
 
-        if len(json_data[field]) == 0:
-            return None
+        if len(headers) > 0:
+            ws.append(headers)
 
-        headers = list(json_data[field][0].keys())
-        for col_idx, header in enumerate(headers, start=1):
-            ws.cell(row=1, column=col_idx, value=header)
-
-        for row_idx, row_data in enumerate(json_data["data"], start=2):
-            for col_idx, key in enumerate(headers, start=1):
-                value = row_data[key]
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        for record in records:
+            ws.append([record.get(header) for header in headers])
 
         wb.save(destination)
 
     except Exception as e:
         logger.error(f"Encountered an error while exporting db to Excel: {str(e)}")
-        exit()
-
-
-async def close_starknet_session(starknet_read_client=None, starknet_write_client=None):
-    if USE_PROXY:
-        if starknet_read_client and starknet_read_client.rpc._client.session is not None:
-            await starknet_read_client.rpc._client.session.close()
-            await starknet_read_client.rpc._client.session.close()
-
-        if starknet_write_client and starknet_write_client.rpc._feeder_gateway_client.session is not None:
-            await starknet_write_client.rpc._feeder_gateway_client.session.close()
-            await starknet_write_client.rpc._gateway_client.session.close()
 
 
 def read_from_json(file_path):
@@ -92,34 +77,26 @@ def change_mobile_ip() -> None:
         raise Exception(f"Encountered an error when changing ip address, check your proxy provider: {e}")
 
 
-def get_starknet_read_client(proxy):
-    if USE_PROXY:
-        return FullNodeClient(
-            node_url=STARKNET_RPC_PROVIDER,
-            session=ClientSession(connector=ProxyConnector.from_url(f'http://{proxy}'))
-        )
-    else:
-        return FullNodeClient(node_url=STARKNET_RPC_PROVIDER)
-
+def get_starknet_client(proxy) -> RoutedClient:
+    session = session_registry.get_session(proxy, STARKNET_RPC_PROVIDER)
 
-def get_starknet_write_client(proxy):
-    if not USE_PROXY:
-        return GatewayClient(net=MAINNET)
-
-    return GatewayClient(
-        net=MAINNET,
-        session=ClientSession(connector=ProxyConnector.from_url(f'http://{proxy}'))
+    return RoutedClient(
+        read_client=FullNodeClient(node_url=STARKNET_RPC_PROVIDER, session=session),
+        write_client=GatewayClient(net=MAINNET, session=session)
     )
 
 
-async def get_starknet_max_balance_token(client: StarknetClient) -> (str, int):
-    usd_token_prices = get_cg_tokens_price_usd(COINGECKO_TOKEN_IDS)
+async def get_starknet_max_balance_token(client: StarknetClient, balances: BalanceSnapshot = None) -> (str, int):
+    usd_token_prices = await get_cg_tokens_price_usd(COINGECKO_TOKEN_IDS)
     max_balance_token_address = None
     max_balance_token_amount = 0.0
     max_balance_token_usd = 0.0
 
+    if balances is None:
+        balances = await get_starknet_balances(client)
+
     for token_address in STARKNET_TOKENS:
-        token_balance = await get_starknet_token_balance(client, token_addr=token_address)
+        token_balance = balances.get(token_address)
         token_balance_usd = token_balance * usd_token_prices[STARKNET_TOKENS.index(token_address)]
 
         if max_balance_token_usd < token_balance_usd:
@@ -151,6 +128,37 @@ async def get_starknet_token_balance(client: StarknetClient, token_addr=STARKNET
         raise Exception(f"Client failed with error: {str(e)}")
 
 
+async def get_starknet_balances(client: StarknetClient, tokens: list = STARKNET_TOKENS) -> BalanceSnapshot:
+    return (await get_starknet_accounts_balances(client.client, [client.address], tokens))[0]
+
+
+@starknet_retry(attempts=ATTEMPTS_COUNT)
+async def get_starknet_accounts_balances(rpc, addresses: list, tokens: list = STARKNET_TOKENS) -> list:
+    try:
+        calls = [
+            Call(to_addr=int(token_address, 16), selector=get_selector_from_name("balanceOf"), calldata=[address])
+            for address in addresses
+            for token_address in tokens
+        ]
+        results = iter(await call_contracts(rpc, calls))
+
+        snapshots = []
+        for address in addresses:
+            balances = {}
+            for token_address in tokens:
+                low, high = next(results)
+                balances[token_address] = (high << 128) + low
+
+            snapshots.append(BalanceSnapshot(address=address, balances=balances))
+
+        return snapshots
+
+    except ClientError:
+        raise
+    except Exception as e:
+        raise Exception(f"Client failed with error: {str(e)}")
+
+
 def greeting_message():
     bridge_usage_warning_message = ("Если вы гоняете пачку аккаунтов, то ОБЯЗАТЕЛЬНО нужно протестить сначала на ОДНОМ "
                                     "кошельке с МАЛЕНЬКОЙ суммой, удостовериться, что деньги дошли, и ТОЛЬКО ПОСЛЕ "
@@ -197,6 +205,7 @@ Modules:
 12: Layerswap (op -> stark). {bridge_usage_warning_message}
 13: Layerswap (stark -> op). {bridge_usage_warning_message}
 14: (TODO) Cairo 1 update (argentx)
+15: Export database to Excel
     '''
 
     logger.success(start_message, send_to_tg=False)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from constants import STARKNET_DECIMALS, STARKNET_ETH_TOKEN_ADDRESS
+
+
+@dataclass
+class BalanceSnapshot:
+    address: int
+    balances: dict
+
+    def get_wei(self, token_addr: str = STARKNET_ETH_TOKEN_ADDRESS) -> int:
+        return self.balances[token_addr]
+
+    def get(self, token_addr: str = STARKNET_ETH_TOKEN_ADDRESS) -> float:
+        return float(self.balances[token_addr] / 10 ** STARKNET_DECIMALS[token_addr])
@@ -11,3 +11,4 @@ class Dapp(Enum):
     NFT_ALLOWANCE = "nft_allowance"
     MY_IDENTITY = "my_identity"
     STARKVERSE = "starkverse"
+    DMAIL = "dmail"
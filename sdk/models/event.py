@@ -6,3 +6,4 @@ class Event(Enum):
     NFTS = "nfts"
     DMAIL = "dmail"
     ZKLEND = "zklend"
+    BUNDLE = "bundle"
@@ -0,0 +1,51 @@
+from starknet_py.net.client_models import Call
+
+from constants import (
+    STARKNET_DMAIL_CONTRACT_ADDRESS,
+    STARKNET_ETH_TOKEN_ADDRESS,
+    STARKNET_NFT_MARKETPLACE,
+    STARKNET_MY_IDENTITY_CONTRACT_ADDRESS,
+    STARKNET_STARKVERSE_CONTRACT_ADDRESS
+)
+from sdk.apis.dmail import DmailAPI
+from sdk.starknet.utils import (
+    float_to_wei,
+    get_contract,
+    get_proxy_contract,
+    get_token_contract,
+    get_starknet_id,
+    generate_random_evm_address
+)
+
+
+async def get_dmail_send_mail_call(account) -> Call:
+    random_evm_address = generate_random_evm_address()
+    to = int(random_evm_address, 16)
+
+    api = DmailAPI(proxy=account.proxy)
+    theme = (await api.get_random_theme())[0]
+
+    dmail_contract = await get_contract(account, STARKNET_DMAIL_CONTRACT_ADDRESS)
+
+    return dmail_contract.functions["transaction"].prepare(to=to, theme=theme)
+
+
+async def get_nft_marketplace_allowance_call(account, allowance_amount: float) -> Call:
+    eth_token_contract = await get_token_contract(account, int(STARKNET_ETH_TOKEN_ADDRESS, 16))
+
+    return eth_token_contract.functions["increaseAllowance"].prepare(
+        spender=int(STARKNET_NFT_MARKETPLACE, 16),
+        added_value=float_to_wei(allowance_amount, STARKNET_ETH_TOKEN_ADDRESS)
+    )
+
+
+async def get_my_identity_mint_call(account) -> Call:
+    contract = await get_proxy_contract(account, int(STARKNET_MY_IDENTITY_CONTRACT_ADDRESS, 16))
+
+    return contract.functions["mint"].prepare(starknet_id=get_starknet_id())
+
+
+async def get_starkverse_mint_call(account) -> Call:
+    contract = await get_contract(account, int(STARKNET_STARKVERSE_CONTRACT_ADDRESS, 16))
+
+    return contract.functions["publicMint"].prepare(to=account.address)
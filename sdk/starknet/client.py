@@ -8,7 +8,6 @@ from starknet_py.net.models.chains import StarknetChainId
 from starknet_py.net.signer.stark_curve_signer import KeyPair
 
 from config import (
-    GAS_DELAY_RANGE,
     STARKNET_GAS_THRESHOLD,
     TX_DELAY_RANGE,
     STARKNET_ETH_MIN_BALANCE
@@ -16,8 +15,6 @@ from config import (
 from constants import (
     STARKNET_MYSWAP_CONTRACT_ADDRESS,
     STARKNET_ETH_TOKEN_ADDRESS,
-    STARKNET_NFT_MARKETPLACE,
-    STARKNET_DMAIL_CONTRACT_ADDRESS,
     STARKNET_JEDISWAP_CONTRACT_ADDRESS,
     STARKNET_TENKSWAP_CONTRACT_ADDRESS,
     STARKNET_SITHSWAP_CONTRACT_ADDRESS,
@@ -27,14 +24,11 @@ from constants import (
     STARKNET_LAYERSWAP_CONTRACT_ADDRESS,
     STARKNET_LAYERSWAP_WATCHDOG_ADDRESS,
     STARKNET_FIBROUS_CONTRACT_ADDRESS,
-    STARKNET_MY_IDENTITY_CONTRACT_ADDRESS,
     STARKNET_ZKLEND_CONTRACT_ADDRESS,
     STARKNET_TOKEN_NAMES,
-    STARKNET_ESTIMATED_FEE_MULTIPLIER,
-    STARKNET_STARKVERSE_CONTRACT_ADDRESS
+    STARKNET_ESTIMATED_FEE_MULTIPLIER
 )
 from sdk.apis.avnuswap import AvnuSwapAPI
-from sdk.apis.dmail import DmailAPI
 from sdk.helpers.decorators import (
     prepare_calling_functions,
     check_balance_starknet,
@@ -43,6 +37,14 @@ from sdk.helpers.decorators import (
 )
 from sdk.helpers.logger import logger
 from sdk.models.chain import Chain
+from sdk.models.dapp import Dapp
+from sdk.starknet.calls import (
+    get_dmail_send_mail_call,
+    get_nft_marketplace_allowance_call,
+    get_my_identity_mint_call,
+    get_starkverse_mint_call
+)
+from sdk.starknet.quote_engine import get_swap_min_amount_out
 from sdk.starknet.utils import (
     get_address,
     get_min_amount_out,
@@ -55,14 +57,13 @@ from sdk.starknet.utils import (
     get_orbiter_total_value,
     get_orbiter_destination_address,
     get_layerswap_watch_id,
-    get_starknet_id,
-    generate_random_evm_address
+    get_wallet_application
 )
 
 
 @prepare_calling_functions(
     check_balance_starknet(min_balance=STARKNET_ETH_MIN_BALANCE),
-    starknet_gas_delay(gas_threshold=STARKNET_GAS_THRESHOLD, delay_range=GAS_DELAY_RANGE),
+    starknet_gas_delay(gas_threshold=STARKNET_GAS_THRESHOLD),
     wait_async(delay_range=TX_DELAY_RANGE)
 )
 class StarknetClient(Account):
@@ -71,16 +72,23 @@ class StarknetClient(Account):
             private_key: str,
             salt: str = None,
             proxy: str = None,
-            rpc=GatewayClient(net="mainnet")
+            rpc=GatewayClient(net="mainnet"),
+            address: str = None,
+            public_key: str = None,
+            wallet_application: str = None
     ):
         self.private_key = int(private_key, 0)
         self.proxy = proxy
-        self.key_pair = KeyPair.from_private_key(self.private_key)
+        self.key_pair = KeyPair(self.private_key, int(public_key, 16)) if public_key \
+            else KeyPair.from_private_key(self.private_key)
         self.ESTIMATED_FEE_MULTIPLIER = STARKNET_ESTIMATED_FEE_MULTIPLIER
         self.rpc = rpc
 
+        if wallet_application != get_wallet_application():
+            address = None
+
         super().__init__(
-            address=get_address(self.key_pair, salt),
+            address=int(address, 16) if address else get_address(self.key_pair, salt),
             client=rpc,
             signer=None,
             key_pair=self.key_pair,
@@ -122,37 +130,18 @@ class StarknetClient(Account):
     async def dmail_send_mail(self) -> bool:
         logger.info(f"[DMAIL] Try to send mail")
 
-        random_evm_address = generate_random_evm_address()
-        to = int(random_evm_address, 16)
-
-        api = DmailAPI(proxy=self.proxy)
-        theme = (await api.get_random_theme())[0]
-        await api.close_session()
-
-        dmail_contract = await get_contract(self, STARKNET_DMAIL_CONTRACT_ADDRESS)
-        call = dmail_contract.functions["transaction"].prepare(to=to, theme=theme)
-
-        return await send_tx(self, call)
+        return await send_tx(self, await get_dmail_send_mail_call(self))
 
     async def nft_marketplace_allowance(self, allowance_amount: int) -> bool:
         logger.info(f"[NFT MARKETPLACE] Try to get allowance")
 
-        eth_token_contract = await get_token_contract(self, int(STARKNET_ETH_TOKEN_ADDRESS, 16))
-        call = eth_token_contract.functions["increaseAllowance"].prepare(
-            spender=int(STARKNET_NFT_MARKETPLACE, 16),
-            added_value=float_to_wei(allowance_amount, STARKNET_ETH_TOKEN_ADDRESS)
-        )
-
-        return await send_tx(self, call)
+        return await send_tx(self, await get_nft_marketplace_allowance_call(self, allowance_amount))
 
     async def myswap_swap(self, token_in_addr: str, token_out_addr: str, amount_in: float) -> bool:
         logger.info(f"[MYSWAP] Try to swap {amount_in} {STARKNET_TOKEN_NAMES[token_in_addr]} "
                     f"to {STARKNET_TOKEN_NAMES[token_out_addr]}")
 
-        min_amount_out = float_to_wei(
-            amount=get_min_amount_out(amount_in, token_in_addr, token_out_addr),
-            token_addr=token_out_addr
-        )
+        min_amount_out = await get_swap_min_amount_out(self, Dapp.MYSWAP, amount_in, token_in_addr, token_out_addr)
 
         pool_id = get_pool_id(token_in_addr, token_out_addr)
         amount_in = float_to_wei(amount_in, token_in_addr)
@@ -179,10 +168,7 @@ class StarknetClient(Account):
         logger.info(f"[JEDISWAP] Try to swap {amount_in} {STARKNET_TOKEN_NAMES[token_in_addr]} "
                     f"to {STARKNET_TOKEN_NAMES[token_out_addr]}")
 
-        min_amount_out = float_to_wei(
-            amount=get_min_amount_out(amount_in, token_in_addr, token_out_addr),
-            token_addr=token_out_addr
-        )
+        min_amount_out = await get_swap_min_amount_out(self, Dapp.JEDISWAP, amount_in, token_in_addr, token_out_addr)
 
         amount_in = float_to_wei(amount_in, token_in_addr)
         token_in_addr = int(token_in_addr, 16)
@@ -210,10 +196,7 @@ class StarknetClient(Account):
         logger.info(f"[10KSWAP] Try to swap {amount_in} {STARKNET_TOKEN_NAMES[token_in_addr]} "
                     f"to {STARKNET_TOKEN_NAMES[token_out_addr]}")
 
-        min_amount_out = float_to_wei(
-            amount=get_min_amount_out(amount_in, token_in_addr, token_out_addr),
-            token_addr=token_out_addr
-        )
+        min_amount_out = await get_swap_min_amount_out(self, Dapp.TENKSWAP, amount_in, token_in_addr, token_out_addr)
 
         amount_in = float_to_wei(amount_in, token_in_addr)
         token_in_addr = int(token_in_addr, 16)
@@ -241,10 +224,7 @@ class StarknetClient(Account):
         logger.info(f"[SITHSWAP] Try to swap {amount_in} {STARKNET_TOKEN_NAMES[token_in_addr]} "
                     f"to {STARKNET_TOKEN_NAMES[token_out_addr]}")
 
-        min_amount_out = float_to_wei(
-            amount=get_min_amount_out(amount_in, token_in_addr, token_out_addr),
-            token_addr=token_out_addr
-        )
+        min_amount_out = await get_swap_min_amount_out(self, Dapp.SITHSWAP, amount_in, token_in_addr, token_out_addr)
 
         amount_in = float_to_wei(amount_in, token_in_addr)
         token_in_addr = int(token_in_addr, 16)
@@ -278,17 +258,15 @@ class StarknetClient(Account):
 
         amount_in = float_to_wei(amount_in, token_in_addr)
 
+        api = AvnuSwapAPI(proxy=self.proxy)
+        build_tx = await api.build_swap_tx(token_in_addr, token_out_addr, amount_in, self.address)
+
         token_contract = await get_token_contract(self, int(token_in_addr, 16))
         approve_call = token_contract.functions["approve"].prepare(
             spender=int(STARKNET_AVNU_CONTRACT_ADDRESS, 16),
             amount=amount_in
         )
 
-        api = AvnuSwapAPI(proxy=self.proxy)
-        quote_id = await api.get_avnu_swap_quote_id(token_in_addr, token_out_addr, amount_in)
-        build_tx = await api.get_build_avnu_swap_tx(quote_id, self.address)
-        await api.close_session()
-
         calldata = [int(item, 16) for item in build_tx["calldata"]]
 
         swap_call = Call(
@@ -304,7 +282,7 @@ class StarknetClient(Account):
                     f"to {STARKNET_TOKEN_NAMES[token_out_addr]}")
 
         min_amount_out = float_to_wei(
-            amount=get_min_amount_out(amount_in, token_in_addr, token_out_addr),
+            amount=await get_min_amount_out(amount_in, token_in_addr, token_out_addr),
             token_addr=token_out_addr
         )
         amount_in = float_to_wei(amount_in, token_in_addr)
@@ -341,20 +319,17 @@ class StarknetClient(Account):
     async def my_identity_mint(self) -> bool:
         logger.info(f"[MYIDENTITY] Try to mint NFT")
 
-        contract_address = int(STARKNET_MY_IDENTITY_CONTRACT_ADDRESS, 16)
-        contract = await get_proxy_contract(self, contract_address)
-        call = contract.functions["mint"].prepare(starknet_id=get_starknet_id())
-
-        return await send_tx(self, call)
+        return await send_tx(self, await get_my_identity_mint_call(self))
 
     async def starkverse_mint(self) -> bool:
         logger.info(f"[STARKVERSE] Try to mint NFT")
 
-        contract_address = int(STARKNET_STARKVERSE_CONTRACT_ADDRESS, 16)
-        contract = await get_contract(self, contract_address)
-        call = contract.functions["publicMint"].prepare(to=self.address)
+        return await send_tx(self, await get_starkverse_mint_call(self))
+
+    async def multicall(self, calls: list, names: list) -> bool:
+        logger.info(f"[MULTICALL] Try to send {', '.join(names)} in one transaction")
 
-        return await send_tx(self, call)
+        return await send_tx(self, calls)
 
     async def zklend_deposit(self, amount_in: float) -> bool:
         logger.info(f"[ZKLEND] Try to deposit {amount_in} ETH")
@@ -433,7 +408,7 @@ class StarknetClient(Account):
         layerswap_address = int(STARKNET_LAYERSWAP_CONTRACT_ADDRESS, 16)
         layerswap_watchdog_address = int(STARKNET_LAYERSWAP_WATCHDOG_ADDRESS, 16)
 
-        watch_id = get_layerswap_watch_id(amount, evm_address, destination_chain, self.proxy)
+        watch_id = await get_layerswap_watch_id(amount, evm_address, destination_chain, self.proxy)
 
         layerswap_watchdog_contract = await get_contract(self, layerswap_watchdog_address)
         watch_call = layerswap_watchdog_contract.functions["watch"].prepare(_Id=watch_id)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict
+
+from starknet_py.contract import Contract
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import SierraContractClass
+from starknet_py.net.models.address import parse_address
+from starknet_py.proxy.contract_abi_resolver import ProxyConfig, ProxyResolutionError, prepare_proxy_config
+
+from constants import CONTRACT_ABI_CACHE_PATH, CONTRACT_ABI_CACHE_REVALIDATE_TIME
+from sdk.helpers.logger import logger
+
+
+class ContractCache:
+    def __init__(self, path: str, revalidate_time: int):
+        self.path = path
+        self.revalidate_time = revalidate_time
+        self.contracts = {}
+        self.classes = {}
+        self.validated = {}
+        self.locks = defaultdict(asyncio.Lock)
+        self.load()
+
+    def load(self):
+        try:
+            if not os.path.exists(self.path):
+                return
+
+            with open(self.path) as json_file:
+                cache = json.load(json_file)
+
+            self.contracts = cache["contracts"]
+            self.classes = cache["classes"]
+
+        except Exception as e:
+            logger.warning(f"Contract abi cache is broken and will be rebuilt: {str(e)}", send_to_tg=False)
+
+    def save(self):
+        try:
+            tmp_path = f"{self.path}.tmp"
+
+            with open(tmp_path, "w") as json_file:
+                json.dump({"contracts": self.contracts, "classes": self.classes}, json_file)
+
+            os.replace(tmp_path, self.path)
+
+        except Exception as e:
+            logger.warning(f"Error while save contract abi cache: {str(e)}", send_to_tg=False)
+
+    async def get_contract(self, provider, contract_address, proxy_config=False) -> Contract:
+        address = parse_address(contract_address)
+        proxy_config = get_proxy_config(proxy_config)
+        key = get_cache_key(address, proxy_config)
+
+        async with self.locks[key]:
+            if time.time() - self.validated.get(key, 0) > self.revalidate_time:
+                await self.revalidate(provider.client, address, proxy_config, key)
+
+        contract_class = self.classes[self.contracts[key]]
+
+        return Contract(
+            address=address,
+            abi=contract_class["abi"],
+            provider=provider,
+            cairo_version=contract_class["cairo_version"]
+        )
+
+    async def revalidate(self, client, address: int, proxy_config: ProxyConfig, key: str):
+        class_hash = hex(await get_class_hash(client, address, proxy_config))
+
+        if self.contracts.get(key) != class_hash:
+            if key in self.contracts:
+                logger.debug(f"Contract {hex(address)} implementation changed, abi cache invalidated",
+                             send_to_tg=False)
+
+            if class_hash not in self.classes:
+                self.classes[class_hash] = await get_contract_class(client, class_hash)
+
+            self.contracts[key] = class_hash
+            self.save()
+
+        self.validated[key] = time.time()
+
+    def invalidate(self, contract_address):
+        address = hex(parse_address(contract_address))
+
+        for key in list(self.validated):
+            if key.split("/")[0] == address:
+                self.validated.pop(key)
+
+
+def get_proxy_config(proxy_config) -> ProxyConfig:
+    if proxy_config is False:
+        return ProxyConfig()
+
+    return prepare_proxy_config(ProxyConfig() if proxy_config is True else proxy_config)
+
+
+def get_cache_key(address: int, proxy_config: ProxyConfig) -> str:
+    if len(proxy_config) == 0:
+        return hex(address)
+
+    proxy_checks = ",".join(type(proxy_check).__name__ for proxy_check in proxy_config["proxy_checks"])
+
+    return f"{hex(address)}/{proxy_checks}"
+
+
+async def get_class_hash(client, address: int, proxy_config: ProxyConfig) -> int:
+    if len(proxy_config) == 0:
+        return await client.get_class_hash_at(contract_address=address)
+
+    for proxy_check in proxy_config["proxy_checks"]:
+        try:
+            implementation_hash = await proxy_check.implementation_hash(address=address, client=client)
+            if implementation_hash is not None:
+                return implementation_hash
+
+            implementation_address = await proxy_check.implementation_address(address=address, client=client)
+            if implementation_address is not None:
+                return await client.get_class_hash_at(contract_address=implementation_address)
+
+        except ClientError:
+            continue
+
+    raise ProxyResolutionError(proxy_config["proxy_checks"])
+
+
+async def get_contract_class(client, class_hash: str) -> dict:
+    contract_class = await client.get_class_by_hash(class_hash=int(class_hash, 16))
+
+    if contract_class.abi is None:
+        raise Exception(f"Abi not found for class {class_hash}")
+
+    if isinstance(contract_class, SierraContractClass):
+        return {"abi": json.loads(contract_class.abi), "cairo_version": 1}
+
+    return {"abi": contract_class.abi, "cairo_version": 0}
+
+
+contract_cache = ContractCache(CONTRACT_ABI_CACHE_PATH, CONTRACT_ABI_CACHE_REVALIDATE_TIME)
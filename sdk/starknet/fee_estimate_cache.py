@@ -0,0 +1,53 @@
+import time
+
+from config import WALLET_APPLICATION, CAIRO_VERSION
+from constants import (
+    STARKNET_ESTIMATED_FEE_MULTIPLIER,
+    STARKNET_FEE_ESTIMATE_CACHE_TIME,
+    STARKNET_FEE_ESTIMATE_CACHE_MULTIPLIER
+)
+
+
+class FeeEstimateCache:
+    def __init__(self, cache_time: int, fee_multiplier: float, cache_multiplier: float):
+        self.cache_time = cache_time
+        self.fee_multiplier = fee_multiplier
+        self.cache_multiplier = cache_multiplier
+        self.fees = {}
+
+    def get_max_fee(self, calls) -> int:
+        timestamp, overall_fee = self.fees.get(get_cache_key(calls), (0, None))
+
+        if time.time() - timestamp > self.cache_time:
+            return None
+
+        return int(overall_fee * self.fee_multiplier * self.cache_multiplier)
+
+    async def estimate_max_fee(self, account, calls, nonce: int) -> int:
+        transaction = await account.sign_invoke_transaction(
+            calls=calls,
+            nonce=nonce,
+            max_fee=0,
+            cairo_version=CAIRO_VERSION
+        )
+        estimated_fee = await account.client.estimate_fee(tx=transaction)
+
+        self.fees[get_cache_key(calls)] = (time.time(), estimated_fee.overall_fee)
+
+        return int(estimated_fee.overall_fee * self.fee_multiplier)
+
+    def invalidate(self, calls):
+        self.fees.pop(get_cache_key(calls), None)
+
+
+def get_cache_key(calls) -> tuple:
+    calls = calls if isinstance(calls, list) else [calls]
+
+    return WALLET_APPLICATION, CAIRO_VERSION, tuple((call.to_addr, call.selector) for call in calls)
+
+
+fee_estimate_cache = FeeEstimateCache(
+    cache_time=STARKNET_FEE_ESTIMATE_CACHE_TIME,
+    fee_multiplier=STARKNET_ESTIMATED_FEE_MULTIPLIER,
+    cache_multiplier=STARKNET_FEE_ESTIMATE_CACHE_MULTIPLIER
+)
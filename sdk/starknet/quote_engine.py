@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_models import Call
+
+from config import SLIPPAGE
+from constants import (
+    STARKNET_MYSWAP_CONTRACT_ADDRESS,
+    STARKNET_JEDISWAP_CONTRACT_ADDRESS,
+    STARKNET_TENKSWAP_CONTRACT_ADDRESS,
+    STARKNET_SITHSWAP_CONTRACT_ADDRESS,
+    STARKNET_QUOTE_CACHE_TIME,
+    STARKNET_QUOTE_BATCH_DELAY,
+    STARKNET_MYSWAP_FEE_DENOMINATOR
+)
+from sdk.helpers.logger import logger
+from sdk.models.dapp import Dapp
+from sdk.starknet.transaction_tracker import get_client_key
+from sdk.starknet.utils import call_contracts, float_to_wei, get_min_amount_out, get_pool_id
+
+QUOTED_DEXES = (Dapp.MYSWAP, Dapp.JEDISWAP, Dapp.TENKSWAP, Dapp.SITHSWAP)
+
+
+class QuoteEngine:
+    def __init__(self, cache_time: int, batch_delay: float):
+        self.cache_time = cache_time
+        self.batch_delay = batch_delay
+        self.quotes = {}
+        self.pending = {}
+        self.tasks = set()
+
+    async def get_amount_out(self, client, dex: Dapp, amount_in: int, token_in: str, token_out: str) -> int:
+        if dex not in QUOTED_DEXES:
+            raise Exception(f"On-chain quote is not supported for {dex.value}")
+
+        if dex == Dapp.MYSWAP:
+            reserve_in, reserve_out, fee_percentage = await self.get_quote(client, (dex, 0, token_in, token_out))
+            amount_in_with_fee = amount_in * (STARKNET_MYSWAP_FEE_DENOMINATOR - fee_percentage)
+
+            return reserve_out * amount_in_with_fee // \
+                (reserve_in * STARKNET_MYSWAP_FEE_DENOMINATOR + amount_in_with_fee)
+
+        return await self.get_quote(client, (dex, amount_in, token_in, token_out))
+
+    async def get_quote(self, client, key: tuple):
+        timestamp, quote = self.quotes.get(key, (0, None))
+
+        if time.time() - timestamp <= self.cache_time:
+            return quote
+
+        pending_key = (get_client_key(client), key)
+
+        if pending_key not in self.pending:
+            if len(self.pending) == 0:
+                task = asyncio.create_task(self.flush())
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+
+            self.pending[pending_key] = (client, asyncio.get_running_loop().create_future())
+
+        return await asyncio.shield(self.pending[pending_key][1])
+
+    async def flush(self):
+        await asyncio.sleep(self.batch_delay)
+
+        pending, self.pending = self.pending, {}
+
+        groups = {}
+        for client_key, key in pending:
+            groups.setdefault(client_key, []).append(key)
+
+        await asyncio.gather(*[self.flush_group(pending, client_key, keys) for client_key, keys in groups.items()])
+
+    async def flush_group(self, pending: dict, client_key: tuple, keys: list):
+        client = pending[(client_key, keys[0])][0]
+
+        try:
+            results = await call_contracts(client, [get_quote_call(*key) for key in keys])
+
+            for key, result in zip(keys, results):
+                quote = parse_quote(key[0], key[2], result)
+                self.quotes[key] = (time.time(), quote)
+                pending[(client_key, key)][1].set_result(quote)
+
+        except Exception as e:
+            for key in keys:
+                future = pending[(client_key, key)][1]
+                if not future.done():
+                    future.set_exception(e)
+
+
+def get_quote_call(dex: Dapp, amount_in: int, token_in: str, token_out: str) -> Call:
+    amount_in_low, amount_in_high = amount_in % 2 ** 128, amount_in // 2 ** 128
+
+    if dex == Dapp.MYSWAP:
+        return Call(
+            to_addr=int(STARKNET_MYSWAP_CONTRACT_ADDRESS, 16),
+            selector=get_selector_from_name("get_pool"),
+            calldata=[get_pool_id(token_in, token_out)]
+        )
+
+    if dex == Dapp.JEDISWAP:
+        return Call(
+            to_addr=int(STARKNET_JEDISWAP_CONTRACT_ADDRESS, 16),
+            selector=get_selector_from_name("get_amounts_out"),
+            calldata=[amount_in_low, amount_in_high, 2, int(token_in, 16), int(token_out, 16)]
+        )
+
+    if dex == Dapp.TENKSWAP:
+        return Call(
+            to_addr=int(STARKNET_TENKSWAP_CONTRACT_ADDRESS, 16),
+            selector=get_selector_from_name("getAmountsOut"),
+            calldata=[amount_in_low, amount_in_high, 2, int(token_in, 16), int(token_out, 16)]
+        )
+
+    return Call(
+        to_addr=int(STARKNET_SITHSWAP_CONTRACT_ADDRESS, 16),
+        selector=get_selector_from_name("getAmountOut"),
+        calldata=[amount_in_low, amount_in_high, int(token_in, 16), int(token_out, 16)]
+    )
+
+
+def parse_quote(dex: Dapp, token_in: str, result: list):
+    if dex == Dapp.MYSWAP:
+        _, token_a, reserve_a_low, reserve_a_high, _, reserve_b_low, reserve_b_high, fee_percentage = result[:8]
+        reserve_a = reserve_a_low + reserve_a_high * 2 ** 128
+        reserve_b = reserve_b_low + reserve_b_high * 2 ** 128
+        reserve_in, reserve_out = (reserve_a, reserve_b) if token_a == int(token_in, 16) else (reserve_b, reserve_a)
+
+        return reserve_in, reserve_out, fee_percentage
+
+    if dex in (Dapp.JEDISWAP, Dapp.TENKSWAP):
+        return result[-2] + result[-1] * 2 ** 128
+
+    return result[0] + result[1] * 2 ** 128
+
+
+async def get_swap_min_amount_out(client, dex: Dapp, amount_in: float, token_in: str, token_out: str) -> int:
+    try:
+        amount_out = await quote_engine.get_amount_out(
+            client,
+            dex,
+            float_to_wei(amount_in, token_in),
+            token_in,
+            token_out
+        )
+
+        return amount_out * int((100 - SLIPPAGE) * 100) // 10000
+
+    except Exception as e:
+        logger.warning(f"On-chain quote error, using coingecko prices: {str(e)}", send_to_tg=False)
+
+    return float_to_wei(
+        amount=await get_min_amount_out(amount_in, token_in, token_out),
+        token_addr=token_out
+    )
+
+
+quote_engine = QuoteEngine(STARKNET_QUOTE_CACHE_TIME, STARKNET_QUOTE_BATCH_DELAY)
@@ -0,0 +1,55 @@
+from starknet_py.net.client import Client
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.gateway_client import GatewayClient
+
+
+class RoutedClient(Client):
+    def __init__(self, read_client: FullNodeClient, write_client: GatewayClient):
+        self.read_client = read_client
+        self.write_client = write_client
+
+    @property
+    def net(self):
+        return self.write_client.net
+
+    async def get_block(self, *args, **kwargs):
+        return await self.read_client.get_block(*args, **kwargs)
+
+    async def get_block_traces(self, *args, **kwargs):
+        return await self.read_client.get_block_traces(*args, **kwargs)
+
+    async def get_state_update(self, *args, **kwargs):
+        return await self.read_client.get_state_update(*args, **kwargs)
+
+    async def get_storage_at(self, *args, **kwargs):
+        return await self.read_client.get_storage_at(*args, **kwargs)
+
+    async def get_transaction(self, *args, **kwargs):
+        return await self.write_client.get_transaction(*args, **kwargs)
+
+    async def get_transaction_receipt(self, *args, **kwargs):
+        return await self.write_client.get_transaction_receipt(*args, **kwargs)
+
+    async def estimate_fee(self, *args, **kwargs):
+        return await self.read_client.estimate_fee(*args, **kwargs)
+
+    async def call_contract(self, *args, **kwargs):
+        return await self.read_client.call_contract(*args, **kwargs)
+
+    async def send_transaction(self, *args, **kwargs):
+        return await self.write_client.send_transaction(*args, **kwargs)
+
+    async def deploy_account(self, *args, **kwargs):
+        return await self.write_client.deploy_account(*args, **kwargs)
+
+    async def declare(self, *args, **kwargs):
+        return await self.write_client.declare(*args, **kwargs)
+
+    async def get_class_hash_at(self, *args, **kwargs):
+        return await self.read_client.get_class_hash_at(*args, **kwargs)
+
+    async def get_class_by_hash(self, *args, **kwargs):
+        return await self.read_client.get_class_by_hash(*args, **kwargs)
+
+    async def get_contract_nonce(self, *args, **kwargs):
+        return await self.write_client.get_contract_nonce(*args, **kwargs)
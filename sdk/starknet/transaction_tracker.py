@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import HttpMethod
+from starknet_py.net.client_errors import ClientError
+
+from constants import STARKNET_TX_STATUS_CHECK_DELAYS, STARKNET_TX_MAX_WAIT
+from sdk.helpers.logger import logger
+from sdk.starknet.routed_client import RoutedClient
+
+ACCEPTED_STATUSES = ("SUCCEEDED", "ACCEPTED_ON_L2", "ACCEPTED_ON_L1")
+FAILED_STATUSES = ("REVERTED", "REJECTED")
+
+
+class TransactionTracker:
+    def __init__(self, check_delays: list, max_wait: int):
+        self.check_delays = check_delays
+        self.max_wait = max_wait
+        self.pending = {}
+        self.event = asyncio.Event()
+        self.task = None
+
+    async def wait_for_tx(self, client, tx_hash: int) -> bool:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[tx_hash] = {
+            "client": client,
+            "future": future,
+            "attempt": 0,
+            "check_at": time.monotonic() + self.check_delays[0],
+            "deadline": time.monotonic() + self.max_wait
+        }
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        self.event.set()
+
+        try:
+            return await future
+        finally:
+            self.pending.pop(tx_hash, None)
+
+    async def run(self):
+        while len(self.pending) > 0:
+            self.event.clear()
+
+            check_at = min(item["check_at"] for item in self.pending.values())
+            try:
+                await asyncio.wait_for(self.event.wait(), timeout=max(check_at - time.monotonic(), 0))
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            now = time.monotonic()
+            tx_hashes = [
+                tx_hash for tx_hash, item in self.pending.items()
+                if item["check_at"] <= now and not item["future"].done()
+            ]
+
+            groups = {}
+            for tx_hash in tx_hashes:
+                groups.setdefault(get_client_key(self.pending[tx_hash]["client"]), []).append(tx_hash)
+
+            results = await asyncio.gather(
+                *[self.get_receipts(group) for group in groups.values()],
+                return_exceptions=True
+            )
+
+            for group, receipts in zip(groups.values(), results):
+                if isinstance(receipts, Exception):
+                    logger.warning(f"Transaction status check error: {str(receipts)}", send_to_tg=False)
+                    receipts = {}
+
+                for tx_hash in group:
+                    self.resolve(tx_hash, receipts.get(tx_hash))
+
+    def resolve(self, tx_hash: int, receipt: dict):
+        item = self.pending.get(tx_hash)
+        if item is None or item["future"].done():
+            return
+
+        statuses = (receipt or {}).get("execution_status"), (receipt or {}).get("finality_status"), \
+            (receipt or {}).get("status")
+
+        if any(status in FAILED_STATUSES for status in statuses):
+            item["future"].set_exception(
+                Exception(f"Transaction {hex(tx_hash)} failed: {receipt.get('revert_reason')}")
+            )
+        elif any(status in ACCEPTED_STATUSES for status in statuses):
+            item["future"].set_result(True)
+        elif time.monotonic() >= item["deadline"]:
+            item["future"].set_exception(
+                Exception(f"Transaction {hex(tx_hash)} was not accepted in {self.max_wait} seconds")
+            )
+        else:
+            item["attempt"] += 1
+            delay = self.check_delays[min(item["attempt"], len(self.check_delays) - 1)]
+            item["check_at"] = time.monotonic() + delay
+
+    async def get_receipts(self, tx_hashes: list) -> dict:
+        if len(tx_hashes) == 0:
+            return {}
+
+        client = get_read_client(self.pending[tx_hashes[0]]["client"])
+
+        if not isinstance(client, FullNodeClient):
+            receipts = await asyncio.gather(
+                *[self.get_client_receipt(self.pending[tx_hash]["client"], tx_hash) for tx_hash in tx_hashes]
+            )
+            return dict(zip(tx_hashes, receipts))
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": "starknet_getTransactionReceipt",
+                "params": {"transaction_hash": hex(tx_hash)},
+                "id": request_id
+            }
+            for request_id, tx_hash in enumerate(tx_hashes)
+        ]
+
+        response = await client._client.request(address=client.url, http_method=HttpMethod.POST, payload=payload)
+
+        if isinstance(response, dict):
+            raise Exception(response.get("error", response))
+
+        return {tx_hashes[item["id"]]: item.get("result") for item in response}
+
+    @staticmethod
+    async def get_client_receipt(client, tx_hash: int):
+        try:
+            receipt = await client.get_transaction_receipt(tx_hash=tx_hash)
+        except ClientError as e:
+            if "Transaction hash not found" not in e.message:
+                raise e
+            return None
+
+        return {
+            "execution_status": getattr(receipt.execution_status, "value", None),
+            "finality_status": getattr(receipt.finality_status, "value", None),
+            "status": getattr(receipt.status, "value", None),
+            "revert_reason": receipt.revert_error or receipt.rejection_reason
+        }
+
+
+def get_read_client(client):
+    return client.read_client if isinstance(client, RoutedClient) else client
+
+
+def get_client_key(client) -> tuple:
+    client = get_read_client(client)
+
+    if not isinstance(client, FullNodeClient):
+        return id(client),
+
+    return client.url, id(client._client.session)
+
+
+transaction_tracker = TransactionTracker(STARKNET_TX_STATUS_CHECK_DELAYS, STARKNET_TX_MAX_WAIT)
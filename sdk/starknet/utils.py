@@ -1,10 +1,15 @@
+import asyncio
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 
 from eth_keys import keys
-from pycoingecko import CoinGeckoAPI
-from starknet_py.contract import Contract
+from starknet_py.constants import EC_ORDER
 from starknet_py.hash.address import compute_address
 from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.full_node_client import FullNodeClient, get_block_identifier
+from starknet_py.net.http_client import HttpMethod, RpcHttpClient
+from starknet_py.net.signer.stark_curve_signer import KeyPair
 from starknet_py.proxy.contract_abi_resolver import ProxyConfig
 
 from config import (
@@ -26,13 +31,21 @@ from constants import (
     ORBITER_CHAIN_IDS,
     STARKNET_ORBITER_BRIDGE_ADDRESSES,
     LAYERSWAP_BRIDGE_ADDRESSES,
-    CAIRO_1_ARGENTX_PROXY_CLASS_HASH
+    CAIRO_1_ARGENTX_PROXY_CLASS_HASH,
+    STARKNET_ACCOUNTS_DERIVATION_POOL_THRESHOLD
 )
 from sdk.apis.layerswap import LayerSwapAPI
+from sdk.helpers.gas_scheduler import release_gas_slot
 from sdk.helpers.logger import logger
+from sdk.helpers.nonce_manager import nonce_manager
+from sdk.helpers.price_service import price_service
 from sdk.models.chain import Chain
 from sdk.models.layerswap_swap_config import LayerswapDataItem
 from sdk.models.proxy_contract import CustomProxyCheck
+from sdk.starknet.contract_cache import contract_cache
+from sdk.starknet.fee_estimate_cache import fee_estimate_cache
+from sdk.starknet.routed_client import RoutedClient
+from sdk.starknet.transaction_tracker import transaction_tracker
 
 
 def get_starknet_explorer_link(tx_hash: str) -> str:
@@ -40,15 +53,54 @@ def get_starknet_explorer_link(tx_hash: str) -> str:
 
 
 async def get_contract(self, contract_address):
-    return await Contract.from_address(address=contract_address, provider=self)
+    return await contract_cache.get_contract(self, contract_address)
 
 
 async def get_proxy_contract(self, contract_address):
-    return await Contract.from_address(address=contract_address, provider=self, proxy_config=True)
+    return await contract_cache.get_contract(self, contract_address, proxy_config=True)
 
 
 async def get_custom_proxy_contract(self, contract_address, proxy_config):
-    return await Contract.from_address(address=contract_address, provider=self, proxy_config=proxy_config)
+    return await contract_cache.get_contract(self, contract_address, proxy_config=proxy_config)
+
+
+async def call_contracts(client, calls: list) -> list:
+    if isinstance(client, RoutedClient):
+        client = client.read_client
+
+    if not isinstance(client, FullNodeClient):
+        return await asyncio.gather(*[client.call_contract(call=call) for call in calls])
+
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "method": "starknet_call",
+            "params": {
+                "request": {
+                    "contract_address": hex(call.to_addr),
+                    "entry_point_selector": hex(call.selector),
+                    "calldata": [hex(item) for item in call.calldata]
+                },
+                **get_block_identifier()
+            },
+            "id": call_id
+        }
+        for call_id, call in enumerate(calls)
+    ]
+
+    response = await client._client.request(address=client.url, http_method=HttpMethod.POST, payload=payload)
+
+    if isinstance(response, dict):
+        RpcHttpClient.handle_rpc_error(response)
+
+    results = []
+    for item in sorted(response, key=lambda result: result["id"]):
+        if "result" not in item:
+            RpcHttpClient.handle_rpc_error(item)
+
+        results.append([int(value, 16) for value in item["result"]])
+
+    return results
 
 
 def get_orbiter_total_value(amount: int, evm_chain: Chain) -> int:
@@ -62,7 +114,7 @@ def get_orbiter_destination_address(evm_chain: Chain) -> str:
     return STARKNET_ORBITER_BRIDGE_ADDRESSES[evm_chain.chain_id]
 
 
-def get_layerswap_watch_id(amount: float, evm_address: str, destination_chain: Chain, proxy: str):
+async def get_layerswap_watch_id(amount: float, evm_address: str, destination_chain: Chain, proxy: str):
     api = LayerSwapAPI(proxy=proxy)
 
     layerswap_config = LayerswapDataItem(
@@ -73,9 +125,8 @@ def get_layerswap_watch_id(amount: float, evm_address: str, destination_chain: C
         source_address=evm_address,
     )
 
-    swap_id = api.create_swap(layerswap_config)['swap_id']
-    watch_id = api.get_swap(swap_id)['sequence_number']
-    api.close_session_sync()
+    swap_id = (await api.create_swap(layerswap_config))['swap_id']
+    watch_id = (await api.get_swap(swap_id))['sequence_number']
 
     return watch_id
 
@@ -98,12 +149,31 @@ async def get_token_contract(self, contract_addr):
         return await get_custom_proxy_contract(self, contract_addr, proxy_config)
 
 
+def get_nonce_key(self) -> tuple:
+    return "starknet", self.address
+
+
 async def send_tx(self, calls):
     tx = None
 
     try:
-        tx = await self.execute(calls=calls, auto_estimate=True, cairo_version=CAIRO_VERSION)
-        if await self.client.wait_for_tx(tx_hash=tx.transaction_hash, check_interval=20, retries=10000):
+        nonce = await nonce_manager.get_nonce_async(get_nonce_key(self), self.get_nonce)
+        max_fee = fee_estimate_cache.get_max_fee(calls)
+
+        if max_fee is not None:
+            try:
+                tx = await self.execute(calls=calls, nonce=nonce, max_fee=max_fee, cairo_version=CAIRO_VERSION)
+            except Exception as e:
+                logger.warning(f"Send tx with cached fee estimate error: {str(e)}", send_to_tg=False)
+                fee_estimate_cache.invalidate(calls)
+
+        if tx is None:
+            max_fee = await fee_estimate_cache.estimate_max_fee(self, calls, nonce)
+            tx = await self.execute(calls=calls, nonce=nonce, max_fee=max_fee, cairo_version=CAIRO_VERSION)
+
+        release_gas_slot()
+
+        if await transaction_tracker.wait_for_tx(self.client, tx.transaction_hash):
             logger.success(f"Transaction was successful: {get_starknet_explorer_link(hex(tx.transaction_hash))}")
             return True
 
@@ -114,6 +184,12 @@ async def send_tx(self, calls):
             )
             return True
         else:
+            nonce_manager.reset(get_nonce_key(self))
+            fee_estimate_cache.invalidate(calls)
+
+            for call in calls if isinstance(calls, list) else [calls]:
+                contract_cache.invalidate(call.to_addr)
+
             logger.error(f"Send tx error: {str(e)}")
             return False
 
@@ -164,8 +240,8 @@ def get_address(key_pair, salt: int = None) -> int:
         raise Exception("Get address error")
 
 
-def get_min_amount_out(amount_in, token_in_addr, token_out_addr):
-    amount_out = get_amount_out(amount_in, get_token_id(token_in_addr), get_token_id(token_out_addr))
+async def get_min_amount_out(amount_in, token_in_addr, token_out_addr):
+    amount_out = await get_amount_out(amount_in, get_token_id(token_in_addr), get_token_id(token_out_addr))
     return amount_out * (100.0 - SLIPPAGE) / 100
 
 
@@ -180,6 +256,41 @@ def get_pool_id(token_in, token_out):
     return None
 
 
+def get_wallet_application() -> str:
+    if WALLET_APPLICATION == "argentx" and IS_WALLET_CREATED_AFTER_CAIRO_1_RELEASED:
+        return "argentx_cairo_1"
+
+    return WALLET_APPLICATION
+
+
+def derive_starknet_account(private_key: str, salt: str = None) -> tuple[str, str]:
+    key_pair = KeyPair.from_private_key(int(private_key, 0))
+
+    return hex(get_address(key_pair, salt)), hex(key_pair.public_key)
+
+
+def derive_starknet_accounts(private_keys: list, salts: list) -> list:
+    return list(iter_starknet_accounts(private_keys, salts))
+
+
+def iter_starknet_accounts(private_keys: list, salts: list):
+    if len(private_keys) < STARKNET_ACCOUNTS_DERIVATION_POOL_THRESHOLD:
+        yield from map(derive_starknet_account, private_keys, salts)
+        return
+
+    chunksize = max(len(private_keys) // ((os.cpu_count() or 1) * 4), 1)
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(derive_starknet_account, private_keys, salts, chunksize=chunksize)
+
+
+def is_valid_starknet_private_key(private_key: str) -> bool:
+    try:
+        return 0 < int(private_key, 0) < EC_ORDER
+    except ValueError:
+        return False
+
+
 def get_braavos_address(key_pair) -> int:
     proxy_class_hash = BRAAVOS_PROXY_CLASS_HASH
     implementation_class_hash = BRAAVOS_IMPLEMENTATION_CLASS_HASH
@@ -228,11 +339,10 @@ def get_address_with_salt(key_pair, salt) -> int:
     )
 
 
-def get_cg_tokens_price_usd(ids: dict):
+async def get_cg_tokens_price_usd(ids: dict):
     try:
-        ids = list(ids.values())
-        res = CoinGeckoAPI().get_price(ids=ids, vs_currencies='usd')
-        usd_prices = [res[token_id]["usd"] for token_id in ids]
+        prices = await price_service.get_prices()
+        usd_prices = [prices[token_id] for token_id in ids.values()]
 
         return usd_prices
 
@@ -240,11 +350,11 @@ def get_cg_tokens_price_usd(ids: dict):
         raise Exception(f"fail to get coin price in usd by coingecko. Error: {str(e)}")
 
 
-def get_coin_price_usd(token_in_id, token_out_id):
+async def get_coin_price_usd(token_in_id, token_out_id):
     try:
-        res = CoinGeckoAPI().get_price(ids=[token_in_id, token_out_id], vs_currencies='usd')
-        token_in_price = res[token_in_id]["usd"]
-        token_out_price = res[token_out_id]["usd"]
+        prices = await price_service.get_prices()
+        token_in_price = prices[token_in_id]
+        token_out_price = prices[token_out_id]
 
         return token_in_price, token_out_price
 
@@ -252,9 +362,9 @@ def get_coin_price_usd(token_in_id, token_out_id):
         raise Exception(f"fail to get coin price in usd by coingecko. Error: {str(e)}")
 
 
-def get_amount_out(amount_in, token_in_id, token_out_id):
+async def get_amount_out(amount_in, token_in_id, token_out_id):
     try:
-        token_in_price, token_out_price = get_coin_price_usd(token_in_id, token_out_id)
+        token_in_price, token_out_price = await get_coin_price_usd(token_in_id, token_out_id)
         amount_out = amount_in * token_in_price / token_out_price
 
         return amount_out